@@ -0,0 +1,86 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from list import search
+from list.models import CUSTOMERS, get_data_version, prefetch_active_jobs
+
+# rendered tables are only ever looked up by their current queue version, so
+# old ones can simply be left to expire
+MACHINE_TABLE_TIMEOUT = 60 * 60 * 24
+
+# customers offered for what's been typed in a customer field
+CUSTOMER_SEARCH_LIMIT = 10
+CUSTOMER_SEARCH_TIMEOUT = 60
+
+
+def machine_table_key(machine):
+    return f"list:machine-table:{machine.pk}:{machine.queue_version}"
+
+
+def render_machine_tables(machines):
+    """
+    render the job table of every machine, reusing the cached copy for any
+    machine whose queue hasn't changed since it was last rendered. active
+    jobs are only loaded for the machines that have to be rendered again.
+    :param machines: list of Machine instances
+    :return: dict - machine pk: rendered table html
+    """
+    keys = {machine.pk: machine_table_key(machine) for machine in machines}
+    cached = cache.get_many(keys.values())
+
+    missing = [machine for machine in machines
+               if keys[machine.pk] not in cached]
+    if missing:
+        prefetch_related_objects(missing, prefetch_active_jobs())
+        rendered = {
+            keys[machine.pk]: render_to_string(
+                "list/machine_table.html",
+                {'machine': machine, 'debug': settings.DEBUG})
+            for machine in missing
+        }
+        cache.set_many(rendered, MACHINE_TABLE_TIMEOUT)
+        cached.update(rendered)
+
+    return {pk: mark_safe(cached[key]) for pk, key in keys.items()}
+
+
+def attach_machine_tables(machines):
+    """
+    load the machines and set `machine.table_html` on each one for the
+    priority list template.
+    :param machines: queryset or iterable of machines
+    :return: list of Machine instances
+    """
+    machines = list(machines)
+    tables = render_machine_tables(machines)
+    for machine in machines:
+        machine.table_html = tables[machine.pk]
+    return machines
+
+
+def customer_search_key(version, text):
+    digest = hashlib.md5(text.encode()).hexdigest()
+    return f"list:customer-search:{version}:{digest}"
+
+
+def search_customers(text):
+    """
+    the customers matching what's been typed in a customer field, see
+    search.search_customers. results are cached for a short while, keyed by
+    the version of the customers so a new or renamed customer shows up at
+    once.
+    :param text: str
+    :return: list of (pk, name)
+    """
+    text = text.strip().lower()
+    key = customer_search_key(get_data_version(CUSTOMERS), text)
+    matches = cache.get(key)
+    if matches is None:
+        matches = search.search_customers(text, CUSTOMER_SEARCH_LIMIT)
+        cache.set(key, matches, CUSTOMER_SEARCH_TIMEOUT)
+    return matches
@@ -0,0 +1,167 @@
+import json
+import queue
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+
+
+class LocalBroker:
+    """
+    fans board events out to the event streams served by this process. a
+    stream doesn't rely on it to be correct, it only wakes streams up as
+    soon as something changes, see board_stream. with more than one
+    process the streams of the others catch up on their next heartbeat.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        """
+        :return: Queue - the events published from now on
+        """
+        subscriber = queue.Queue()
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+
+BROKERS = {
+    'local': LocalBroker,
+}
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """
+    the broker of board events, set with the BOARD_EVENTS_BROKER setting.
+    one is shared by every request in the process.
+    :return: LocalBroker
+    """
+    return BROKERS[getattr(settings, 'BOARD_EVENTS_BROKER', 'local')]()
+
+
+def publish_queue_changes(machine_ids):
+    """
+    tell the board streams the job tables of the given machines changed.
+    :param machine_ids: iterable of machine pks
+    :return: None
+    """
+    get_broker().publish({'machines': list(machine_ids)})
+
+
+def events_enabled():
+    """
+    whether boards are kept up to date over server-sent events, which holds
+    a worker connection per open board, see the BOARD_EVENTS_ENABLED setting
+    """
+    return getattr(settings, 'BOARD_EVENTS_ENABLED', False)
+
+
+def parse_versions(text):
+    """
+    read the queue versions a board was shown with, e.g. "1:4,2:10"
+    :param text: str
+    :return: dict - machine pk: queue version
+    """
+    versions = {}
+    for pair in text.split(','):
+        try:
+            pk, version = pair.split(':')
+            versions[int(pk)] = int(version)
+        except ValueError:
+            continue
+    return versions
+
+
+def format_versions(versions):
+    return ",".join(f"{pk}:{version}" for pk, version in versions.items())
+
+
+def board_stream(machine_ids, versions, heartbeat=None, max_age=None):
+    """
+    the server-sent events of a board: a `machine` event each time the job
+    table of one of its machines changes, with the machine's pk and new
+    queue version. the id of every event holds the versions the board is
+    at, so a reconnecting client picks up from where it was.
+
+    the queue versions are read when a change to one of the machines is
+    published in this process, or every `heartbeat` seconds otherwise.
+    the stream ends after `max_age` seconds, so it doesn't hold a worker
+    forever, and the client reconnects.
+    :param machine_ids: list of the machine pks on the board
+    :param versions: dict - machine pk: the queue version the board shows
+    :return: generator of str
+    """
+    if heartbeat is None:
+        heartbeat = getattr(settings, 'BOARD_EVENTS_HEARTBEAT', 15)
+    if max_age is None:
+        max_age = getattr(settings, 'BOARD_EVENTS_MAX_AGE', 300)
+    broker = get_broker()
+    subscriber = broker.subscribe()
+    end = time.monotonic() + max_age
+    watched = set(machine_ids)
+    versions = dict(versions)
+    try:
+        # how long the client waits before reconnecting, in ms
+        yield "retry: 3000\n\n"
+        while True:
+            changed = _changed_versions(machine_ids, versions)
+            for pk in changed:
+                versions[pk] = changed[pk]
+                data = json.dumps({'machine': pk, 'version': changed[pk]})
+                yield (f"id: {format_versions(versions)}\n"
+                       f"event: machine\ndata: {data}\n\n")
+            if not changed:
+                # keeps the connection open through proxies
+                yield ": keepalive\n\n"
+
+            timeout = min(heartbeat, end - time.monotonic())
+            if not _wait_for(subscriber, watched, timeout) \
+                    and time.monotonic() >= end:
+                return
+    finally:
+        broker.unsubscribe(subscriber)
+
+
+def _changed_versions(machine_ids, versions):
+    # list.models publishes through this module
+    from list.models import Machine
+
+    current = dict(Machine.objects
+                   .filter(pk__in=machine_ids)
+                   .values_list('pk', 'queue_version'))
+    return {pk: version for pk, version in current.items()
+            if versions.get(pk) != version}
+
+
+def _wait_for(subscriber, watched, timeout):
+    """
+    wait up to `timeout` seconds for an event about one of the watched
+    machines.
+    :return: bool - whether one came
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        try:
+            event = subscriber.get(timeout=remaining)
+        except queue.Empty:
+            return False
+        if watched.intersection(event['machines']):
+            return True
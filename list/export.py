@@ -0,0 +1,70 @@
+import csv
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from list.models import Job
+
+# (header, field) of each column of an export
+COLUMNS = (
+    ("Job Number", 'job_number'),
+    ("Description", 'description'),
+    ("Customer", 'customer__name'),
+    ("Machine", 'machine__name'),
+    ("Tools?", 'add_tools'),
+    ("SS Made?", 'setup_sheets'),
+    ("Date Added", 'date_added'),
+    ("Due Date", 'due_date'),
+    ("Completed", 'datetime_completed'),
+    ("Active", 'active'),
+)
+# rows fetched from the database at a time
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """
+    a file that hands back whatever is written to it, so csv.writer can
+    format one row at a time for a streaming response
+    """
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset):
+    """
+    the jobs of a queryset as csv lines, header first. only the exported
+    fields are fetched, as tuples, a chunk at a time, so memory use doesn't
+    grow with the number of jobs.
+    :param queryset: Job queryset, in the order to export
+    :return: generator of str
+    """
+    writer = csv.writer(Echo())
+    setup_sheets = dict(Job.SETUP_SHEETS_CHOICES)
+    yield writer.writerow([header for header, _ in COLUMNS])
+
+    rows = queryset.values_list(*[field for _, field in COLUMNS])
+    for (job_number, description, customer, machine, add_tools,
+         sheets, date_added, due_date, completed, active) \
+            in rows.iterator(chunk_size=CHUNK_SIZE):
+        yield writer.writerow([
+            job_number,
+            description,
+            customer.title(),
+            machine,
+            "Yes" if add_tools else "No",
+            setup_sheets.get(sheets, sheets),
+            date_added or "",
+            due_date or "",
+            timezone.localtime(completed).strftime("%Y-%m-%d %H:%M")
+            if completed else "",
+            "Yes" if active else "No",
+        ])
+
+
+def csv_response(queryset, filename):
+    response = StreamingHttpResponse(export_rows(queryset),
+                                     content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
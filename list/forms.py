@@ -1,4 +1,5 @@
 from django import forms
+from django.urls import reverse_lazy
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
@@ -28,11 +29,32 @@ class RelatedFieldWidgetCanAdd(forms.widgets.Select):
         return mark_safe(''.join(output))
 
 
+class CustomerSearchWidget(RelatedFieldWidgetCanAdd):
+    """
+    a customer select carrying only the chosen customer rather than every
+    customer. script.js fills in the options for what's typed into a box
+    above it, from the customer-search endpoint.
+    """
+
+    def __init__(self, attrs=None):
+        attrs = {'data-search-url': reverse_lazy('list:customer-search'),
+                 **(attrs or {})}
+        super().__init__(Customer, attrs=attrs)
+
+    def optgroups(self, name, value, attrs=None):
+        # a submitted value can be anything, only look up actual pks
+        chosen = [pk for pk in value if str(pk).isdigit()]
+        self.choices = [("", "---------")] + [
+            (customer.pk, str(customer))
+            for customer in Customer.objects.filter(pk__in=chosen)]
+        return super().optgroups(name, value, attrs)
+
+
 class JobForm(forms.ModelForm):
     customer = forms.ModelChoiceField(
         required=True,
         queryset=Customer.objects.all(),
-        widget=RelatedFieldWidgetCanAdd(Customer, attrs={
+        widget=CustomerSearchWidget(attrs={
             'class': 'uk-select uk-form-width-large'})
     )
     job_number = forms.CharField(
@@ -83,7 +105,7 @@ class JobSearchForm(forms.ModelForm):
     customer = forms.ModelChoiceField(
         required=False,
         queryset=Customer.objects.all(),
-        widget=RelatedFieldWidgetCanAdd(Customer, attrs={
+        widget=CustomerSearchWidget(attrs={
             'class': 'uk-select uk-form-width-large'})
     )
     job_number = forms.CharField(
@@ -99,6 +121,8 @@ class JobSearchForm(forms.ModelForm):
         widget=forms.widgets.Select(attrs={'class': 'uk-select'})
     )
     description = forms.CharField(
+        label="Keywords:",
+        help_text="Words from the description, job number or customer.",
         widget=forms.widgets.TextInput(attrs={'class': 'uk-input'}),
         required=False
     )
@@ -163,7 +187,8 @@ class JobSearchForm(forms.ModelForm):
 
 class CustomerForm(forms.ModelForm):
     name = forms.CharField(
-        widget=forms.widgets.TextInput(attrs={'class': 'uk-input'})
+        widget=forms.widgets.TextInput(attrs={'class': 'uk-input'}),
+        error_messages={'unique': "This customer already exists."},
     )
 
     class Meta:
@@ -171,12 +196,9 @@ class CustomerForm(forms.ModelForm):
         fields = ["name", ]
 
     def clean_name(self):
-        name = self.cleaned_data['name']
-        customer_names = [cust.name for cust in Customer.objects.all()]
-        if name.lower() in customer_names:
-            raise forms.ValidationError("This customer already exists.")
-
-        return name
+        # names are saved lowercased, so the model's unique check on the
+        # normalized name is one lookup on the name column's index
+        return self.cleaned_data['name'].strip().lower()
 
 
 class ProfileForm(forms.ModelForm):
@@ -190,3 +212,16 @@ class ProfileForm(forms.ModelForm):
             'machines': forms.SelectMultiple(
                 attrs={'size': "8", 'class': 'uk-select'})
         }
+
+
+class JobImportForm(forms.Form):
+    file = forms.FileField(
+        label="Spreadsheet:",
+        help_text="A csv or xlsx file with a header row naming the columns: "
+                  "job_number, description, customer, machine and "
+                  "optionally due_date, add_tools and setup_sheets.",
+        widget=forms.widgets.ClearableFileInput(attrs={'accept': '.csv,.xlsx'}))
+    create_customers = forms.BooleanField(
+        label="Add new customers:",
+        required=False,
+        widget=forms.widgets.CheckboxInput(attrs={'class': 'uk-checkbox'}))
@@ -0,0 +1,261 @@
+import csv
+import itertools
+import os
+import zipfile
+
+from django.core.exceptions import ValidationError
+from django.db.models import Max
+
+from list import search
+from list.models import Customer, Job, Machine, bump_queue_version
+from list.ordering import get_ordering
+from list.queue import lock_machines
+
+# the columns of a spreadsheet of jobs, the first row of the sheet names them
+COLUMNS = ('job_number', 'description', 'customer', 'machine', 'due_date',
+           'add_tools', 'setup_sheets')
+REQUIRED_COLUMNS = ('job_number', 'description', 'customer', 'machine')
+
+TRUE_VALUES = {'y', 'yes', 'true', 't', '1', 'x'}
+FALSE_VALUES = {'n', 'no', 'false', 'f', '0', ''}
+
+
+class ImportFileError(Exception):
+    """
+    the file as a whole can't be imported, e.g. a column is missing
+    """
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        # (line, message) for each row that wasn't imported
+        self.errors = []
+
+    def __str__(self):
+        return f"{self.created} jobs imported, {len(self.errors)} rows skipped"
+
+
+def read_csv(file):
+    """
+    read the rows of a csv file one at a time. the file has to be UTF-8,
+    a line that can't be read stops the import.
+    :param file: binary file
+    :return: generator of (line, dict)
+    :raises ImportFileError: if the file isn't UTF-8 or isn't csv
+    """
+    reader = csv.reader(_decode_lines(file))
+    try:
+        header = next(reader, None)
+        if header is None:
+            raise ImportFileError("The file is empty.")
+        header = [column.strip().lower().replace(' ', '_')
+                  for column in header]
+        for row in reader:
+            if any(value.strip() for value in row):
+                yield reader.line_num, dict(zip(header, row))
+    except csv.Error as e:
+        raise ImportFileError(f"Line {reader.line_num} can't be read: {e}.")
+
+
+def _decode_lines(file):
+    # decoded a line at a time, rather than by io.TextIOWrapper a chunk at a
+    # time, so an error can say which line it's on
+    for line, data in enumerate(file, 1):
+        try:
+            yield data.decode('utf-8-sig' if line == 1 else 'utf-8')
+        except UnicodeDecodeError:
+            raise ImportFileError(f"Line {line} isn't UTF-8 text, save the "
+                                  f"file as \"CSV UTF-8\".")
+
+
+def read_excel(file):
+    """
+    read the rows of the first sheet of an Excel workbook one at a time.
+    needs openpyxl.
+    :param file: binary file
+    :return: generator of (line, dict)
+    """
+    try:
+        import openpyxl
+        from openpyxl.utils.exceptions import InvalidFileException
+    except ModuleNotFoundError:
+        raise ImportFileError("Excel files can't be read here, save the "
+                              "sheet as a csv file instead.")
+    try:
+        workbook = openpyxl.load_workbook(file, read_only=True,
+                                          data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError):
+        # KeyError: a zip file without the parts of a workbook
+        raise ImportFileError("The file isn't an Excel workbook, or is "
+                              "damaged.")
+    rows = workbook.worksheets[0].iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        raise ImportFileError("The file is empty.")
+    header = [str(column or '').strip().lower().replace(' ', '_')
+              for column in header]
+    for line, row in enumerate(rows, 2):
+        if any(value not in (None, '') for value in row):
+            yield line, dict(zip(header, row))
+    workbook.close()
+
+
+def read_rows(file, name):
+    """
+    :param file: binary file
+    :param name: str - the file's name, which tells its format
+    :return: generator of (line, dict)
+    """
+    extension = os.path.splitext(name)[1].lower()
+    if extension in ('.xlsx', '.xlsm'):
+        return read_excel(file)
+    if extension in ('.csv', '.txt'):
+        return read_csv(file)
+    raise ImportFileError(f"Can't import \"{name}\", expected a csv or "
+                          f"xlsx file.")
+
+
+class JobImporter:
+    """
+    add jobs from the rows of a spreadsheet. customers and machines are
+    looked up by name in maps loaded once, every machine's queue is locked
+    and its last key read once, and the jobs are written with bulk_create in
+    batches, so the cost per row is a small part of an INSERT. rows with an
+    error are skipped and reported, the rest are added.
+    """
+
+    def __init__(self, create_customers=False, batch_size=500):
+        """
+        :param create_customers: bool - add customers that don't exist yet,
+                                 rather than skipping their jobs
+        :param batch_size: int - jobs per INSERT
+        """
+        self.create_customers = create_customers
+        self.batch_size = batch_size
+        self.ordering = get_ordering()
+        self.fields = {name: Job._meta.get_field(name)
+                       for name in ('job_number', 'description', 'due_date')}
+        self.setup_sheets = {}
+        for value, label in Job.SETUP_SHEETS_CHOICES:
+            self.setup_sheets[value.lower()] = value
+            self.setup_sheets[label.lower()] = value
+
+    def run(self, rows):
+        """
+        :param rows: iterable of (line, dict), see read_rows
+        :return: ImportReport
+        :raises ImportFileError: if a required column is missing
+        """
+        report = ImportReport()
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return report
+        missing = [column for column in REQUIRED_COLUMNS
+                   if column not in first[1]]
+        if missing:
+            raise ImportFileError(f"Missing columns: {', '.join(missing)}.")
+
+        self.customers = {name.lower(): pk for pk, name in
+                          Customer.objects.values_list('pk', 'name')}
+        self.machines = {name.lower(): pk for pk, name in
+                         Machine.objects.values_list('pk', 'name')}
+
+        with lock_machines(*self.machines.values()):
+            self.last_keys = dict.fromkeys(self.machines.values(), -1)
+            self.last_keys.update(Job.objects
+                                  .filter(active=True)
+                                  .values_list('machine_id')
+                                  .annotate(Max('order'))
+                                  .order_by())
+            last_id = Job.objects.aggregate(Max('pk'))['pk__max'] or 0
+
+            batch = []
+            changed_machines = set()
+            for line, row in itertools.chain([first], rows):
+                try:
+                    job = self.build_job(row)
+                except ValidationError as e:
+                    report.errors.append((line, "; ".join(e.messages)))
+                    continue
+                batch.append(job)
+                changed_machines.add(job.machine_id)
+                if len(batch) >= self.batch_size:
+                    report.created += self._write(batch)
+            report.created += self._write(batch)
+
+            if report.created:
+                # bulk_create bypasses Job.save, which indexes each job
+                search.get_backend().index_jobs("WHERE j.id > %s", [last_id])
+                bump_queue_version(*changed_machines)
+        return report
+
+    def _write(self, batch):
+        Job.objects.bulk_create(batch)
+        created = len(batch)
+        batch.clear()
+        return created
+
+    def build_job(self, row):
+        """
+        :param row: dict - column name: value
+        :return: Job, with its key at the bottom of its machine's queue
+        :raises ValidationError: if a value is missing or can't be used
+        """
+        errors = {}
+        values = {}
+        for name, field in self.fields.items():
+            value = row.get(name)
+            if isinstance(value, str):
+                value = value.strip()
+            if value in (None, ''):
+                value = None if field.null else ''
+            try:
+                values[name] = field.clean(value, None)
+            except ValidationError as e:
+                errors[name] = e.messages
+
+        try:
+            values['customer_id'] = self.customer_id(row.get('customer'))
+        except ValidationError as e:
+            errors['customer'] = e.messages
+        machine = str(row.get('machine') or '').strip().lower()
+        if machine not in self.machines:
+            errors['machine'] = [f"No machine named \"{row.get('machine') or ''}\"."]
+        else:
+            values['machine_id'] = self.machines[machine]
+
+        add_tools = str(row.get('add_tools') or '').strip().lower()
+        if add_tools in TRUE_VALUES | FALSE_VALUES:
+            values['add_tools'] = add_tools in TRUE_VALUES
+        else:
+            errors['add_tools'] = [f"\"{row.get('add_tools')}\" isn't yes or no."]
+        setup_sheets = str(row.get('setup_sheets') or 'N').strip().lower()
+        if setup_sheets in self.setup_sheets:
+            values['setup_sheets'] = self.setup_sheets[setup_sheets]
+        else:
+            errors['setup_sheets'] = [f"\"{row.get('setup_sheets')}\" isn't "
+                                      f"Yes, No or N/A."]
+
+        if errors:
+            raise ValidationError([f"{name}: {message}"
+                                   for name, messages in errors.items()
+                                   for message in messages])
+
+        machine_id = values['machine_id']
+        self.last_keys[machine_id] = self.ordering.next_key(
+            self.last_keys[machine_id])
+        return Job(order=self.last_keys[machine_id], active=True, **values)
+
+    def customer_id(self, name):
+        name = str(name or '').strip().lower()
+        if not name:
+            raise ValidationError("This field cannot be blank.")
+        if name not in self.customers:
+            if not self.create_customers:
+                raise ValidationError(f"No customer named \"{name}\".")
+            # checked here, an over long name would fail the whole import
+            Customer._meta.get_field('name').clean(name, None)
+            self.customers[name] = Customer.objects.create(name=name).pk
+        return self.customers[name]
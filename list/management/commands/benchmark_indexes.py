@@ -0,0 +1,119 @@
+import datetime
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+from list.models import Customer, Job, Machine
+from utils.db import rolled_back
+
+
+class Command(BaseCommand):
+    help = ("Seed a large number of jobs and report the query plan and "
+            "timing of the main Job queries with and without the Job "
+            "indexes. Everything is done in a transaction that is rolled "
+            "back, the indexes are only dropped inside it.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100000)
+        parser.add_argument('--machines', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options['seed'])
+        with rolled_back():
+            machines = self.seed(options['jobs'], options['machines'])
+            queries = self.queries(machines)
+
+            self.report("with indexes", queries, options['repeat'])
+            self.drop_indexes()
+            self.report("without indexes", queries, options['repeat'])
+
+    def seed(self, num_jobs, num_machines):
+        customers = [Customer.objects.create(name=f"benchmark {i}")
+                     for i in range(50)]
+        machines = [Machine.objects.create(name=f"benchmark {i}")
+                    for i in range(num_machines)]
+
+        today = datetime.date.today()
+        now = timezone.now()
+        orders = {machine.pk: 0 for machine in machines}
+        jobs = []
+        for i in range(num_jobs):
+            machine = random.choice(machines)
+            # like the real list, nearly every job has been archived
+            active = random.random() < 0.02
+            added = today - datetime.timedelta(days=random.randrange(3650))
+            job = Job(job_number=random.randrange(1000, 10000),
+                      description=f"benchmark job {i}",
+                      add_tools=False,
+                      customer=random.choice(customers),
+                      machine=machine,
+                      date_added=added,
+                      due_date=added + datetime.timedelta(
+                          days=random.randrange(60)),
+                      active=active,
+                      order=0)
+            if active:
+                job.order = orders[machine.pk]
+                orders[machine.pk] += 1
+            else:
+                job.datetime_completed = now - datetime.timedelta(
+                    minutes=random.randrange(3650 * 24 * 60))
+            jobs.append(job)
+        Job.objects.bulk_create(jobs)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.stdout.write(f"seeded {num_jobs} jobs on {num_machines} "
+                          f"machines")
+        return machines
+
+    def queries(self, machines):
+        machine = machines[0]
+        some = machines[:len(machines) // 2 or 1]
+        today = datetime.date.today()
+        month_ago = today - datetime.timedelta(days=30)
+        return {
+            'active jobs': machine.active_jobs().order_by('order'),
+            'max order': (Job.objects
+                          .filter(machine=machine, active=True)
+                          .values('machine')
+                          .annotate(Max('order'))),
+            'archive page': (Job.objects
+                             .filter(active=False, machine__in=some)
+                             .order_by('-datetime_completed')[:10]),
+            'added range': (Job.objects
+                            .filter(date_added__gte=month_ago,
+                                    date_added__lte=today)
+                            .order_by('date_added')),
+            'due range': (Job.objects
+                          .filter(due_date__gte=month_ago,
+                                  due_date__lte=today)
+                          .order_by('date_added')),
+            'job number': Job.objects.filter(job_number=4321),
+        }
+
+    def drop_indexes(self):
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for index in Job._meta.indexes:
+                cursor.execute(str(index.remove_sql(Job, editor)))
+            cursor.execute("ANALYZE")
+
+    def report(self, title, queries, repeat):
+        self.stdout.write(f"\n== {title} ==")
+        for name, queryset in queries.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                # a fresh queryset each time, so nothing is cached
+                list(queryset.all())
+            ms = (time.perf_counter() - start) * 1000 / repeat
+
+            self.stdout.write(f"\n{name}: {ms:.2f} ms")
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f"    {line}")
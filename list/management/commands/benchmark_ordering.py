@@ -0,0 +1,60 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from list.models import Customer, Job, Machine
+from list.ordering import ORDERINGS
+from utils.db import rolled_back
+
+
+class Command(BaseCommand):
+    help = ("Time moving jobs to random positions in a queue with each "
+            "ordering strategy, for growing queue lengths, and count the "
+            "job rows each move rewrites. Everything is done in a "
+            "transaction that is rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int,
+                            default=[10, 100, 1000, 10000])
+        parser.add_argument('--moves', type=int, default=100)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'ordering':<10}{'jobs':>8}{'ms/move':>10}"
+                          f"{'rows/move':>12}")
+        for name in ORDERINGS:
+            for size in options['sizes']:
+                random.seed(options['seed'])
+                ms, rows = self.measure(name, size, options['moves'])
+                self.stdout.write(f"{name:<10}{size:>8}{ms:>10.2f}"
+                                  f"{rows:>12.1f}")
+
+    def measure(self, name, size, moves):
+        elapsed = 0
+        rows = 0
+        with rolled_back(), override_settings(JOB_ORDERING=name):
+            machine = Machine.objects.create(
+                name=f"benchmark {name} {size}")
+            customer = Customer.objects.create(
+                name=f"benchmark {name} {size}")
+            jobs = [Job(job_number=1000 + i % 9000, description=f"job {i}",
+                        add_tools=False, customer=customer,
+                        machine=machine)
+                    for i in range(size)]
+            ORDERINGS[name]().renumber(jobs)
+            Job.objects.bulk_create(jobs)
+            queue = machine.active_jobs()
+
+            for _ in range(moves):
+                before = dict(queue.values_list('pk', 'order'))
+                job = queue.get(pk=random.choice(list(before)))
+
+                start = time.perf_counter()
+                job.to(random.randrange(size))
+                elapsed += time.perf_counter() - start
+
+                after = dict(queue.values_list('pk', 'order'))
+                rows += sum(before[pk] != after[pk] for pk in before)
+        return elapsed * 1000 / moves, rows / moves
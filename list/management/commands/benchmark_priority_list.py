@@ -0,0 +1,76 @@
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.urls import reverse
+
+from list.models import Customer, Job, Machine
+from list.views import PriorityListView
+from utils.db import rolled_back
+
+
+class Command(BaseCommand):
+    help = ("Render the priority list of a user with many machines and "
+            "report the size of the page and the time it takes to render, "
+            "with the rendered job tables cached. Everything is done in a "
+            "transaction that is rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--machines', type=int, default=20)
+        parser.add_argument('--jobs', type=int, default=10,
+                            help="Active jobs per machine.")
+        parser.add_argument('--customers', type=int, default=200)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options['seed'])
+        with rolled_back():
+            user = self.seed(options['machines'], options['jobs'],
+                             options['customers'])
+            self.report(user, options['repeat'])
+
+    def seed(self, num_machines, num_jobs, num_customers):
+        customers = [Customer.objects.create(name=f"benchmark {i}")
+                     for i in range(num_customers)]
+        machines = [Machine.objects.create(name=f"benchmark {i}")
+                    for i in range(num_machines)]
+        Job.objects.bulk_create([
+            Job(job_number=random.randrange(1000, 10000),
+                description=f"benchmark job {i}",
+                add_tools=False,
+                customer=random.choice(customers),
+                machine=machine,
+                order=i)
+            for machine in machines
+            for i in range(num_jobs)
+        ])
+        user = User.objects.create_user(username='benchmark')
+        user.profile.machines.set(machines)
+        return user
+
+    def report(self, user, repeat):
+        factory = RequestFactory()
+        view = PriorityListView.as_view()
+        cache.clear()
+
+        def render():
+            request = factory.get(reverse('list:priority-list'))
+            request.user = user
+            response = view(request)
+            response.render()
+            return response
+
+        # the first render fills the caches
+        render()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            response = render()
+        ms = (time.perf_counter() - start) * 1000 / repeat
+
+        machines = user.profile.machines.count()
+        self.stdout.write(f"{machines} machines: {len(response.content)} "
+                          f"bytes, {ms:.1f} ms per render")
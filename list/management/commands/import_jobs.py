@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from list.importer import ImportFileError, JobImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = ("Add the jobs in a csv or xlsx file exported from the ERP. The "
+            "first row names the columns: job_number, description, customer, "
+            "machine and optionally due_date, add_tools and setup_sheets. "
+            "Rows with an error are skipped and listed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--create-customers', action='store_true',
+                            help="Add customers that don't exist yet instead "
+                                 "of skipping their jobs.")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        importer = JobImporter(create_customers=options['create_customers'],
+                               batch_size=options['batch_size'])
+        start = time.perf_counter()
+        try:
+            with open(options['path'], 'rb') as file:
+                report = importer.run(read_rows(file, options['path']))
+        except (OSError, ImportFileError) as e:
+            raise CommandError(e)
+
+        for line, message in report.errors:
+            self.stderr.write(f"line {line}: {message}")
+        self.stdout.write(f"{report} in "
+                          f"{time.perf_counter() - start:.2f} s")
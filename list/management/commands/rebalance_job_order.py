@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from list.models import Machine, bump_queue_version
+from list.ordering import get_ordering
+from list.queue import lock_machines
+
+
+class Command(BaseCommand):
+    help = ("Give every machine's queue fresh order keys. With the sparse "
+            "ordering this spreads the keys back out, run it off-hours so "
+            "moves never have to rebalance a queue themselves.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('machines', nargs='*', type=int,
+                            help="pks of the machines to rebalance, "
+                                 "all machines if left out")
+
+    def handle(self, *args, **options):
+        ordering = get_ordering()
+        machines = Machine.objects.all()
+        if options['machines']:
+            machines = machines.filter(pk__in=options['machines'])
+
+        for machine in machines:
+            with lock_machines(machine.pk):
+                changed = ordering.rebalance(machine.active_jobs())
+                if changed:
+                    # the cached job table and the boards showing it
+                    bump_queue_version(machine.pk)
+            self.stdout.write(f"{machine.name}: {changed} jobs renumbered")
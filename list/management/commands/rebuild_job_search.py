@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from list import search
+
+
+class Command(BaseCommand):
+    help = ("Index the text of every job for search again, e.g. after jobs "
+            "were changed with a bulk update that bypassed Job.save.")
+
+    def handle(self, *args, **options):
+        backend = search.get_backend()
+        with transaction.atomic():
+            backend.index_jobs()
+        self.stdout.write(f"jobs indexed with {type(backend).__name__}")
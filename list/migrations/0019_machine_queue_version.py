@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-18 09:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('list', '0018_auto_20190802_0922'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='machine',
+            name='queue_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
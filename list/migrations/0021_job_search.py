@@ -0,0 +1,59 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+JOB_TEXT_SQL = """
+    SELECT j.id, j.description, CAST(j.job_number AS TEXT), c.name
+    FROM list_job j JOIN list_customer c ON c.id = j.customer_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    """
+    the job text index used by list.search. other databases search without
+    one.
+    """
+    vendor = schema_editor.connection.vendor
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == 'sqlite':
+            try:
+                cursor.execute("CREATE VIRTUAL TABLE list_job_fts USING "
+                               "fts5(description, job_number, customer)")
+            except OperationalError:
+                # sqlite was built without FTS5
+                return
+            cursor.execute("INSERT INTO list_job_fts "
+                           "(rowid, description, job_number, customer) "
+                           + JOB_TEXT_SQL)
+        elif vendor == 'postgresql':
+            cursor.execute("CREATE TABLE list_job_search ("
+                           "job_id integer PRIMARY KEY, "
+                           "document tsvector NOT NULL)")
+            cursor.execute("CREATE INDEX list_job_search_document_idx "
+                           "ON list_job_search USING gin (document)")
+            cursor.execute(
+                "INSERT INTO list_job_search (job_id, document) "
+                "SELECT id, "
+                "setweight(to_tsvector('simple', description), 'A') || "
+                "setweight(to_tsvector('simple', job_number), 'A') || "
+                "setweight(to_tsvector('simple', customer), 'B') "
+                "FROM (" + JOB_TEXT_SQL + ") "
+                "AS job (id, description, job_number, customer)")
+
+
+def drop_search_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        if schema_editor.connection.vendor == 'sqlite':
+            cursor.execute("DROP TABLE IF EXISTS list_job_fts")
+        elif schema_editor.connection.vendor == 'postgresql':
+            cursor.execute("DROP TABLE IF EXISTS list_job_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('list', '0020_job_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,15 +1,19 @@
 # import pdb
+import uuid
 
 from django.contrib.auth.models import User
 from django.core import validators
-from django.db import models
-from django.db.models import Max
-from django.db.models.signals import post_save
+from django.db import models, transaction
+from django.db.models import F, Max, Prefetch, Subquery
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.shortcuts import reverse
 from django.utils import timezone
 from ordered_model.models import OrderedModel
 
+from list import events, search
+from list.ordering import get_ordering
+
 
 class Customer(OrderedModel):
     name = models.CharField(max_length=50, unique=True)
@@ -27,6 +31,9 @@ class Customer(OrderedModel):
 
 class Machine(OrderedModel):
     name = models.CharField(max_length=50, unique=True)
+    # bumped every time something shown in the machine's job table changes,
+    # used to key the cached copy of the rendered table
+    queue_version = models.PositiveIntegerField(default=0, editable=False)
 
     def active_jobs(self):
         return Job.objects.filter(machine__pk=self.pk).filter(active=True)
@@ -37,6 +44,17 @@ class Machine(OrderedModel):
     class Meta(OrderedModel.Meta):
         ordering = ("order",)
 
+    def save(self, *args, **kwargs):
+        # queue_version is only changed through bump_queue_version, never
+        # write back the (possibly stale) copy held by this instance
+        if not self._state.adding and 'update_fields' not in kwargs:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'queue_version'
+            ]
+        super().save(*args, **kwargs)
+        bump_queue_version(self.pk)
+
     def __str__(self):
         return f"{self.name}"
 
@@ -68,15 +86,41 @@ class Job(OrderedModel):
     order_with_respect_to = 'machine'
     active = models.BooleanField(blank=True, default=True)
 
+    # fields that decide where the job sits in the machine queues
+    TRACKED_FIELDS = ('active', 'machine_id', 'order')
+    # fields the job is found by in search, see list.search
+    SEARCH_FIELDS = ('description', 'job_number', 'customer_id')
+    _loaded_values = None
+
     def get_absolute_url(self):
         return reverse("list:job-detail", args=[self.pk])
 
+    def get_ordering_queryset(self, qs=None):
+        """
+        the queue a job is ordered in: the active jobs on its machine.
+        archived jobs are parked at order 0 and take no part in it.
+        :return: QuerySet
+        """
+        if qs is None:
+            qs = Job.objects.all()
+        return qs.filter(machine_id=self.machine_id, active=True)
+
+    def queue_machine_ids(self):
+        """
+        the machines whose queues saving this instance would change
+        :return: set - machine pks
+        """
+        machine_ids = {self.machine_id}
+        if self._loaded_values is not None:
+            machine_ids.add(self._loaded_values['machine_id'])
+        return machine_ids
+
     def _find_max_order(self, include_self=False):
         """
         get the max order for the ordering_queryset
         :return: int - max order
         """
-        oq = self.get_ordering_queryset()
+        oq = Job.objects.filter(machine_id=self.machine_id)
         if include_self:
             last = (oq
                     .filter(active=True)
@@ -96,61 +140,168 @@ class Job(OrderedModel):
 
         return last
 
+    def position(self):
+        """
+        the job's position in its machine's queue, starting from 0
+        :return: int
+        """
+        return get_ordering().position(self)
+
+    def up(self):
+        get_ordering().up(self)
+
+    def down(self):
+        get_ordering().down(self)
+
+    def to(self, order, extra_update=None):
+        """
+        move the job to a position in its machine's queue
+        :param order: int - the position to move to
+        :param extra_update: dict - extra fields to set on the jobs that
+        are shifted to make room, if any are
+        :return: None
+        """
+        get_ordering().to(self, order, extra_update=extra_update)
+
+    def top(self, extra_update=None):
+        self.to(0, extra_update=extra_update)
+
+    def bottom(self, extra_update=None):
+        self.to(self.get_ordering_queryset().count() - 1,
+                extra_update=extra_update)
+
     def _bot(self):
         """
         find the max order of the destination ordering_queryset and set the
         instance order to one greater.
         it this method does not change the order of any other instance in the
-        set. meant to be used only
-        from within the save method for setting the order of an instance that
-        just changed machines.
+        set. save does the same thing for an instance that just changed
+        machines, without the extra write.
         :return: None
         """
         last = self._find_max_order()
 
-        self.order = last + 1
+        self.order = get_ordering().next_key(last)
         self.save()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._take_snapshot()
+
+    def _take_snapshot(self):
+        """
+        remember the values of the fields that decide where the job sits in
+        the machine queues and how it is found in search, so save can work
+        out what changed without fetching the old row.
+        :return: None
+        """
+        loaded = self.__dict__
+        fields = self.TRACKED_FIELDS + self.SEARCH_FIELDS
+        if all(field in loaded for field in fields):
+            self._loaded_values = {field: loaded[field] for field in fields}
+        else:
+            # some of the fields were deferred
+            self._loaded_values = None
+
     def save(self, *args, **kwargs):
+        old_job = self._loaded_values
+        if old_job is None and self.pk is not None:
+            # the instance wasn't (fully) loaded from the database
+            old_job = (Job.objects
+                       .filter(pk=self.pk)
+                       .values(*self.TRACKED_FIELDS, *self.SEARCH_FIELDS)
+                       .first()
+                       )
+
         # If this instance is being created for the first time, old instance
         # won't exist
-        try:
-            old_job = Job.objects.get(id=self.pk)
+        if old_job is None:
+            if self.active:
+                self.order = get_ordering().next_key(self._find_max_order())
+            else:
+                self.order = 0
+                self.datetime_completed = timezone.now()
             super().save(*args, **kwargs)
+            bump_queue_version(self.machine_id)
+        else:
             self._save(old_job, *args, **kwargs)
-        except Job.DoesNotExist:
-            super().save(*args, **kwargs)
 
-    def _save(self, old_job, *args, **kwargs):
-        if old_job is not None:
-            if old_job.active and not self.active:
-                smooth_ordering(old_job)
-                self.order = 0
-                self.datetime_completed = timezone.now()
-                super().save(*args, **kwargs)
-            elif not old_job.active and self.active:
-                order = self._find_max_order()
-                self.datetime_completed = None
-                self.order = order + 1
-                super().save(*args, **kwargs)
-
-            if self.machine.pk != old_job.machine.pk:
-                # If machine changed, the instance is switching to a
-                # different subset,
-                # we need to send that instance to the bottom of that subset.
-                # NOTE: not overriding ordered_model's bottom method,
-                # since that uses the to() method
-                # to assign the order for the object, and that messes up the
-                # order of the machine the job is
-                # being moved to.
-                self._bot()
+        if old_job is None or any(getattr(self, field) != old_job[field]
+                                  for field in self.SEARCH_FIELDS):
+            search.index_job(self.pk)
+        self._take_snapshot()
 
+    def _save(self, old_job, *args, **kwargs):
+        """
+        save an existing job, moving it between the machine queues according
+        to what changed since it was loaded. the job row is written with a
+        single UPDATE.
+        :param old_job: dict - the tracked fields as they were loaded
+        :return: None
+        """
+        machine_changed = self.machine_id != old_job['machine_id']
+        leaves_queue = old_job['active'] and (not self.active
+                                              or machine_changed)
+        joins_queue = self.active and (not old_job['active']
+                                       or machine_changed)
+
+        if old_job['active'] and not self.active:
+            self.order = 0
+            self.datetime_completed = timezone.now()
+        elif joins_queue:
+            # If machine changed or the job was reactivated, send the
+            # instance to the bottom of the destination machine's queue
+            self.order = get_ordering().next_key(self._find_max_order())
+            self.datetime_completed = None
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if leaves_queue or joins_queue:
+                update_fields |= {'order', 'datetime_completed'}
+            elif self.order == old_job['order']:
+                # as below, the order may be stale
+                update_fields.discard('order')
+            kwargs['update_fields'] = update_fields
+        elif self.order == old_job['order'] and not leaves_queue:
+            # the order may have been shifted in the database since the
+            # instance was loaded, don't write back a stale copy of it
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'order'
+            ]
+
+        with transaction.atomic(savepoint=False):
+            if leaves_queue:
                 # If there were objects after the instance in the OLD subset,
-                # move them up in the order by 1 each
-                smooth_ordering(old_job)
+                # move them up in the order by 1 each. the position is read
+                # from the database since the loaded one may be stale.
+                close_gap(old_job['machine_id'],
+                          Subquery(Job.objects
+                                   .filter(pk=self.pk)
+                                   .values('order')[:1]))
+            super().save(*args, **kwargs)
+            bump_queue_version(*{self.machine_id, old_job['machine_id']})
 
     class Meta(OrderedModel.Meta):
-        pass
+        indexes = [
+            # machine queues: active_jobs, close_gap, _find_max_order
+            models.Index(fields=['machine', 'active', 'order'],
+                         name='job_queue_idx'),
+            # the archive, newest first
+            models.Index(fields=['active', '-datetime_completed'],
+                         name='job_archive_idx'),
+            # job search
+            models.Index(fields=['date_added'], name='job_date_added_idx'),
+            models.Index(fields=['due_date'], name='job_due_date_idx'),
+            models.Index(fields=['job_number'], name='job_number_idx'),
+        ]
 
     def __str__(self):
         return f"{self.job_number} {self.description}"
@@ -167,23 +318,126 @@ class Profile(models.Model):
         return f"{self.user.username}"
 
 
+# the names of the DataVersion counters
+CUSTOMERS = 'customers'
+
+
+class DataVersion(models.Model):
+    """
+    a token that changes whenever a kind of data changes, e.g. every
+    customer. copies of the data kept by each process are stored next to
+    the token they were built from, see list.cache.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    version = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"{self.name}: {self.version}"
+
+
+def get_data_version(name):
+    """
+    :param name: str - the kind of data
+    :return: str - empty if it never changed
+    """
+    return (DataVersion.objects
+            .filter(name=name)
+            .values_list('version', flat=True)
+            .first()) or ""
+
+
+def bump_data_version(name):
+    """
+    mark a kind of data as changed. the new version is random rather than
+    counted up, so a version seen inside a transaction that was rolled back
+    is never reused for different data.
+    :param name: str - the kind of data
+    :return: None
+    """
+    DataVersion.objects.update_or_create(
+        name=name, defaults={'version': uuid.uuid4().hex})
+
+
+def prefetch_active_jobs():
+    """
+    build a prefetch that loads the active jobs of every machine in a
+    queryset, with their customers, in a single query. the jobs end up in
+    `machine.active_job_list`, sorted by order.
+    :return: Prefetch
+    """
+    return Prefetch(
+        'job_set',
+        queryset=(Job.objects
+                  .filter(active=True)
+                  .select_related('customer')
+                  .order_by('order')
+                  ),
+        to_attr='active_job_list'
+    )
+
+
 def smooth_ordering(instance):
     """
     move every job after the given instance up by 1 in the ordering
     :param instance: the instance that changed machines or was archived
     :return: None
     """
-    # If there were objects after the instance in the OLD subset, move them
-    # up in the order by 1 each
-    order = instance.order + 1
-    try:
-        while True:
-            job = Job.objects.get(machine=instance.machine, order=order,
-                                  active=True)
-            job.to(order - 1)
-            order += 1
-    except Job.DoesNotExist:
-        pass
+    close_gap(instance.machine_id, instance.order)
+
+
+def close_gap(machine_id, order):
+    """
+    close the gap left at `order` in a machine's active job ordering.
+    every active job after the gap is moved up by 1 with a single UPDATE,
+    so the cost doesn't grow with the length of the queue. with the sparse
+    ordering gaps are allowed and nothing is moved.
+    :param machine_id: pk of the machine the gap is on
+    :param order: the order that was vacated, or an expression giving it
+    :return: int - number of jobs that were moved
+    """
+    with transaction.atomic(savepoint=False):
+        return get_ordering().close_gap(
+            Job.objects.filter(machine_id=machine_id, active=True), order)
+
+
+def bump_queue_version(*machine_ids):
+    """
+    mark the job tables of the given machines as changed, so any cached copy
+    of them is no longer used.
+    :param machine_ids: pks of the machines whose queue changed
+    :return: None
+    """
+    (Machine.objects
+     .filter(pk__in=machine_ids)
+     .update(queue_version=F('queue_version') + 1)
+     )
+    # the boards showing them update themselves, once the change is visible
+    transaction.on_commit(lambda: events.publish_queue_changes(machine_ids))
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, **kwargs):
+    bump_queue_version(instance.machine_id)
+    search.remove_job(instance.pk)
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def customer_list_changed(sender, instance, **kwargs):
+    # the customer selects of the job forms are cached
+    bump_data_version(CUSTOMERS)
+
+
+@receiver(post_save, sender=Customer)
+def customer_changed(sender, instance, created, **kwargs):
+    if not created:
+        # the customer's name is shown in the job tables
+        bump_queue_version(*(Machine.objects
+                             .filter(job__customer=instance, job__active=True)
+                             .values_list('pk', flat=True)
+                             .distinct()))
+        # and it's searched for
+        search.index_customer_jobs(instance.pk)
 
 
 @receiver(post_save, sender=User)
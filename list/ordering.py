@@ -0,0 +1,186 @@
+from django.conf import settings
+from django.db.models import F
+from ordered_model.models import OrderedModel
+
+
+class DenseOrdering:
+    """
+    the job's order is its position in the machine's queue: 0, 1, 2, ...
+    moving a job shifts every job between its old and new position, and
+    archiving one shifts every job after it.
+    """
+
+    def next_key(self, last):
+        """
+        the key for a job added after the last one in a queue
+        :param last: int - max key in the queue, -1 if it's empty
+        :return: int
+        """
+        return last + 1
+
+    def position(self, job):
+        return job.order
+
+    def close_gap(self, queryset, order):
+        """
+        close the gap left at `order` in a queue
+        :param queryset: the active jobs of the machine
+        :param order: the vacated key, or an expression giving it
+        :return: int - number of jobs that were moved
+        """
+        return (queryset
+                .filter(order__gt=order)
+                .update(order=F('order') - 1)
+                )
+
+    def up(self, job):
+        OrderedModel.up(job)
+
+    def down(self, job):
+        OrderedModel.down(job)
+
+    def to(self, job, position, extra_update=None):
+        OrderedModel.to(job, position, extra_update=extra_update)
+
+    def renumber(self, jobs):
+        """
+        assign fresh keys to a queue's jobs, in the given order.
+        :param jobs: list of Job, in queue order
+        :return: list of the jobs whose key changed
+        """
+        changed = []
+        key = -1
+        for job in jobs:
+            key = self.next_key(key)
+            if job.order != key:
+                job.order = key
+                changed.append(job)
+        return changed
+
+    def rebalance(self, queryset):
+        """
+        assign fresh keys to every job in a queue, keeping the order of the
+        jobs. with the sparse ordering this spreads the keys back out to
+        `gap` apart, which only has to happen once the gaps between
+        neighbours run out.
+        :param queryset: the active jobs of the machine
+        :return: int - number of jobs whose key changed
+        """
+        jobs = list(queryset.order_by('order', 'pk').only('pk', 'order'))
+        changed = self.renumber(jobs)
+        queryset.model.objects.bulk_update(changed, ['order'])
+        return len(changed)
+
+    def compact(self, queryset):
+        """
+        close every gap in a queue at once, e.g. after a bulk update took
+        jobs out of it, writing only the jobs whose key changes.
+        :param queryset: the active jobs of the machine
+        :return: int - number of jobs that were moved
+        """
+        return self.rebalance(queryset)
+
+
+class SparseOrdering(DenseOrdering):
+    """
+    jobs are keyed with gaps between them, and a job's position is the
+    number of jobs with a smaller key. moving a job writes only that job,
+    taking a key halfway between its new neighbours, and archiving one
+    leaves the others alone. when two neighbours have no key left between
+    them the machine's queue is rebalanced.
+    """
+
+    def __init__(self, gap=None):
+        if gap is None:
+            gap = getattr(settings, 'JOB_ORDER_GAP', 1024)
+        self.gap = gap
+
+    def next_key(self, last):
+        if last < 0:
+            return self.gap
+        return last + self.gap
+
+    def position(self, job):
+        return (job.get_ordering_queryset()
+                .filter(order__lt=job.order)
+                .count()
+                )
+
+    def close_gap(self, queryset, order):
+        return 0
+
+    def compact(self, queryset):
+        return 0
+
+    def up(self, job):
+        position = self.position(job)
+        if position > 0:
+            self.to(job, position - 1)
+
+    def down(self, job):
+        self.to(job, self.position(job) + 1)
+
+    def to(self, job, position, extra_update=None):
+        # no other job is shifted, so there is nothing to apply extra_update to
+        if not isinstance(position, int):
+            raise TypeError("Order value must be set using an 'int', not using "
+                            "a '{0}'.".format(type(position).__name__))
+
+        key = self._key_at(job, position)
+        if key is None:
+            self.rebalance(job.get_ordering_queryset())
+            job.refresh_from_db(fields=['order'])
+            key = self._key_at(job, position)
+        if key != job.order:
+            job.order = key
+            job.save()
+
+    def _key_at(self, job, position):
+        """
+        find a key that puts the job at `position` among the other jobs in
+        its queue, or None if there is no room between the neighbours.
+        :return: int or None
+        """
+        others = (job.get_ordering_queryset()
+                  .exclude(pk=job.pk)
+                  .order_by('order')
+                  .values_list('order', flat=True)
+                  )
+        if position <= 0:
+            before = None
+            after = next(iter(others[:1]), None)
+        else:
+            neighbours = list(others[position - 1:position + 1])
+            if not neighbours:
+                # past the end of the queue
+                neighbours = list(others.reverse()[:1])
+            before = next(iter(neighbours), None)
+            after = neighbours[1] if len(neighbours) > 1 else None
+
+        if (before is None or before < job.order) \
+                and (after is None or job.order < after):
+            # already in place
+            return job.order
+        if after is None:
+            return self.next_key(before)
+        if before is None and after >= self.gap:
+            # keep a full gap above the top job while there is room
+            return after - self.gap
+        low = -1 if before is None else before
+        if after - low < 2:
+            return None
+        return (low + after) // 2
+
+
+ORDERINGS = {
+    'dense': DenseOrdering,
+    'sparse': SparseOrdering,
+}
+
+
+def get_ordering():
+    """
+    the ordering strategy for job queues, set with the JOB_ORDERING setting.
+    :return: DenseOrdering or SparseOrdering
+    """
+    return ORDERINGS[getattr(settings, 'JOB_ORDERING', 'dense')]()
@@ -0,0 +1,182 @@
+import base64
+import binascii
+import json
+import operator
+from functools import reduce
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+
+
+class KeysetPaginator:
+    """
+    pages through a queryset by seeking past the last row of the previous
+    page instead of counting rows with OFFSET, so every page costs the same
+    however deep it is. the ordering has to end in a unique field (e.g. id)
+    so that no two rows share a key. only the first field may be null, rows
+    where it is null come last.
+
+    a page is requested with a cursor from the page before or after it,
+    which holds the sort key of the row to seek past and the position of
+    the page, so rows can still be numbered without counting them.
+    """
+
+    def __init__(self, queryset, per_page, ordering, count=False):
+        """
+        :param queryset: the rows to page through
+        :param per_page: int - rows per page
+        :param ordering: tuple of field names, '-' prefixed for descending
+        :param count: bool - also count every row, which is the slow part
+                      of OFFSET paging on a large table
+        """
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = [(key.lstrip('-'), key.startswith('-'))
+                         for key in ordering]
+        self.count = queryset.count() if count else None
+
+    def page(self, after=None, before=None):
+        """
+        :param after: cursor of the previous page, or None
+        :param before: cursor of the next page, when going back
+        :return: KeysetPage
+        :raises InvalidPage: if the cursor can't be read
+        """
+        if before:
+            position, values = self.decode(before)
+            rows = self._rows(values, forwards=False)
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+            start = max(position - len(rows), 0)
+            has_next = True
+        else:
+            start, values = self.decode(after) if after else (0, None)
+            rows = self._rows(values, forwards=True)
+            has_next = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            has_previous = bool(after)
+
+        return KeysetPage(rows, self, start, has_previous, has_next)
+
+    def _rows(self, values, forwards):
+        """
+        fetch up to one row more than a page past the given sort key. rows
+        with a null first field are fetched on their own, an OR with IS NULL
+        would stop the database from walking an index in order.
+        :param values: sort key to seek past, None to start from the top
+        :param forwards: bool - False to fetch the rows before the key,
+                         closest first
+        :return: list
+        """
+        name = self.ordering[0][0]
+        limit = self.per_page + 1
+        not_null = self.queryset.filter(**{f'{name}__isnull': False})
+        null = self.queryset.filter(**{f'{name}__isnull': True})
+        ordering = self.ordering
+        if not forwards:
+            ordering = [(name, not descending)
+                        for name, descending in ordering]
+
+        if values is not None and values[0] is None:
+            # among the null rows, seek on the rest of the key
+            groups = [(null, ordering[1:], values[1:])]
+        else:
+            groups = [(not_null, ordering, values)]
+        if forwards and groups[0][0] is not_null:
+            groups.append((null, ordering[1:], None))
+        elif not forwards and groups[0][0] is null:
+            groups.append((not_null, ordering, None))
+
+        rows = []
+        for queryset, ordering, values in groups:
+            if values is not None:
+                queryset = queryset.filter(self._seek(ordering, values))
+            rows += queryset.order_by(*[
+                f"-{name}" if descending else name
+                for name, descending in ordering
+            ])[:limit - len(rows)]
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def _seek(self, ordering, values):
+        """
+        the rows past the one with the given sort key. the first field is
+        bounded on its own as well, so the database can walk an index on it
+        from the key rather than filter every row.
+        :param ordering: list of (field name, descending)
+        :param values: list - the sort key, none of it null
+        :return: Q
+        """
+        terms = []
+        equal = Q()
+        for (name, descending), value in zip(ordering, values):
+            lookup = 'lt' if descending else 'gt'
+            terms.append(equal & Q(**{f'{name}__{lookup}': value}))
+            equal &= Q(**{name: value})
+        name, descending = ordering[0]
+        bound = Q(**{f"{name}__{'lte' if descending else 'gte'}": values[0]})
+        return bound & reduce(operator.or_, terms)
+
+    def cursor(self, row, position):
+        values = [getattr(row, name) for name, _ in self.ordering]
+        # not DjangoJSONEncoder, it drops the microseconds of datetimes and
+        # the cursor has to hold the exact key
+        data = json.dumps([position, values],
+                          default=lambda value: value.isoformat())
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode(self, cursor):
+        model = self.queryset.model
+        try:
+            position, values = json.loads(
+                base64.urlsafe_b64decode(cursor.encode()))
+            position = int(position)
+            if position < 0 or len(values) != len(self.ordering):
+                raise ValueError
+            values = [None if value is None
+                      else model._meta.get_field(name).to_python(value)
+                      for (name, _), value in zip(self.ordering, values)]
+            return position, values
+        except (binascii.Error, TypeError, ValueError, ValidationError):
+            raise InvalidPage("Invalid cursor.")
+
+
+class KeysetPage:
+    def __init__(self, object_list, paginator, start, has_previous, has_next):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.start = start
+        self._has_previous = has_previous
+        self._has_next = has_next and bool(object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_next(self):
+        return self._has_next
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def start_index(self):
+        return self.start + 1 if self.object_list else 0
+
+    def end_index(self):
+        return self.start + len(self.object_list)
+
+    def previous_cursor(self):
+        if self.has_previous():
+            return self.paginator.cursor(self.object_list[0], self.start)
+
+    def next_cursor(self):
+        if self.has_next():
+            return self.paginator.cursor(self.object_list[-1],
+                                         self.end_index())
@@ -0,0 +1,227 @@
+import threading
+from contextlib import ExitStack, contextmanager
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from list.models import Job, Machine, bump_queue_version
+from list.ordering import get_ordering
+
+# used to serialize queue changes when the database can't lock rows
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+
+def _local_lock(machine_id):
+    with _local_locks_guard:
+        return _local_locks.setdefault(machine_id, threading.RLock())
+
+
+@contextmanager
+def lock_machines(*machine_ids):
+    """
+    lock the queues of the given machines and run the block in a transaction.
+    the machine rows are locked with select_for_update, so only one request
+    at a time can reorder a machine's jobs. on databases without row locks
+    (sqlite) a lock per machine is held within the process instead.
+    machines are always locked in pk order to avoid deadlocks.
+    :param machine_ids: pks of the machines whose queues will change
+    :return: None
+    """
+    machine_ids = sorted(set(machine_ids))
+    with ExitStack() as stack:
+        if not connection.features.has_select_for_update:
+            for machine_id in machine_ids:
+                stack.enter_context(_local_lock(machine_id))
+        with transaction.atomic():
+            if connection.features.has_select_for_update:
+                list(Machine.objects
+                     .select_for_update()
+                     .filter(pk__in=machine_ids)
+                     .order_by('pk')
+                     .values_list('pk', flat=True)
+                     )
+            yield
+
+
+@contextmanager
+def locked_job(job):
+    """
+    lock the queue of the job's machine and refresh the job inside the lock,
+    so any change is worked out from its current position.
+    :param job: the Job that is about to be moved
+    :return: the refreshed job
+    """
+    while True:
+        machine_id = job.machine_id
+        with lock_machines(machine_id):
+            job.refresh_from_db()
+            # the job may have moved to another machine before the lock was
+            # taken, in which case the wrong queue is locked
+            if job.machine_id == machine_id:
+                yield job
+                return
+
+
+def move_up(job):
+    """
+    move a job up one position in its machine's queue. archived jobs aren't
+    in a queue, moving one (e.g. from a stale page) does nothing.
+    :param job: Job
+    :return: None
+    """
+    with locked_job(job):
+        if job.active:
+            job.up()
+
+
+def move_down(job):
+    """
+    move a job down one position in its machine's queue.
+    :param job: Job
+    :return: None
+    """
+    with locked_job(job):
+        if job.active:
+            job.down()
+
+
+def move_to(job, order):
+    """
+    move a job to a position in its machine's queue, shifting the jobs in
+    between. positions past the end of the queue move the job to the bottom.
+    :param job: Job
+    :param order: int - the position to move to
+    :return: None
+    """
+    with locked_job(job):
+        if job.active:
+            last = job.get_ordering_queryset().count() - 1
+            job.to(max(0, min(order, last)))
+
+
+def archive(job):
+    """
+    archive a job, closing the gap it leaves in its machine's queue.
+    :param job: Job
+    :return: None
+    """
+    with locked_job(job):
+        job.active = False
+        job.save()
+
+
+def save_job(job):
+    """
+    save a new or edited job while holding the locks of every machine queue
+    the save changes.
+    :param job: Job
+    :return: the saved job
+    """
+    with lock_machines(*job.queue_machine_ids()):
+        job.save()
+    return job
+
+
+def reorder(machine_id, job_ids):
+    """
+    put a machine's queue in the given order in one go. the list has to name
+    every active job of the machine exactly once, so a page that is out of
+    date can't drop or duplicate jobs. the new keys are written with a single
+    bulk update.
+    :param machine_id: pk of the machine
+    :param job_ids: list of job pks, in their new queue order
+    :return: list of job pks, in queue order
+    """
+    with lock_machines(machine_id):
+        jobs = {job.pk: job for job in (Job.objects
+                                        .filter(machine_id=machine_id,
+                                                active=True)
+                                        .only('pk', 'order'))}
+        if len(job_ids) != len(set(job_ids)):
+            raise ValueError("Jobs can only be listed once.")
+        if set(job_ids) != set(jobs):
+            raise ValueError("The jobs don't match the machine's queue, "
+                             "reload the page and try again.")
+
+        changed = get_ordering().renumber([jobs[pk] for pk in job_ids])
+        if changed:
+            Job.objects.bulk_update(changed, ['order'])
+            bump_queue_version(machine_id)
+    return job_ids
+
+
+@contextmanager
+def locked_jobs(job_ids, *machine_ids):
+    """
+    lock the queues of every machine the given active jobs are on, plus any
+    other machines given, and yield the jobs' machine pks. jobs can move
+    before the locks are taken, so the machines are looked up again inside
+    them until they match.
+    :param job_ids: pks of the jobs that are about to change
+    :return: set of the pks of the machines the jobs are on
+    """
+    jobs = Job.objects.filter(pk__in=job_ids, active=True)
+    while True:
+        sources = set(jobs.values_list('machine_id', flat=True).distinct())
+        with lock_machines(*sources, *machine_ids):
+            if set(jobs.values_list('machine_id', flat=True)
+                   .distinct()) == sources:
+                yield sources
+                return
+
+
+def archive_jobs(job_ids):
+    """
+    archive many jobs at once. they are archived with one UPDATE and each
+    queue they leave closes its gaps once, rather than one job at a time.
+    jobs that are already archived are left as they are.
+    :param job_ids: iterable of job pks
+    :return: int - number of jobs archived
+    """
+    job_ids = set(job_ids)
+    with locked_jobs(job_ids) as machine_ids:
+        archived = (Job.objects
+                    .filter(pk__in=job_ids, active=True)
+                    .update(active=False, order=0,
+                            datetime_completed=timezone.now()))
+        ordering = get_ordering()
+        for machine_id in machine_ids:
+            ordering.compact(Job.objects.filter(machine_id=machine_id,
+                                                active=True))
+        bump_queue_version(*machine_ids)
+    return archived
+
+
+def move_jobs(job_ids, machine_id):
+    """
+    move many active jobs to the bottom of another machine's queue, in the
+    order they had, and close the gaps they leave behind once per queue.
+    the moved jobs are written with one bulk update.
+    :param job_ids: iterable of job pks
+    :param machine_id: pk of the machine to move them to
+    :return: int - number of jobs moved
+    """
+    job_ids = set(job_ids)
+    with locked_jobs(job_ids, machine_id) as sources:
+        jobs = list(Job.objects
+                    .filter(pk__in=job_ids, active=True)
+                    .exclude(machine_id=machine_id)
+                    .order_by('machine__order', 'order')
+                    .only('pk', 'machine_id', 'order'))
+        if not jobs:
+            return 0
+
+        ordering = get_ordering()
+        key = Job(machine_id=machine_id)._find_max_order()
+        for job in jobs:
+            key = ordering.next_key(key)
+            job.machine_id = machine_id
+            job.order = key
+        Job.objects.bulk_update(jobs, ['machine', 'order'])
+
+        for source in sources - {machine_id}:
+            ordering.compact(Job.objects.filter(machine_id=source,
+                                                active=True))
+        bump_queue_version(machine_id, *sources)
+    return len(jobs)
@@ -0,0 +1,211 @@
+import re
+from functools import lru_cache
+
+from django.db import connection
+from django.db.models import Q
+
+# the text of each job that search looks at: its description, job number and
+# customer name, kept in a table of its own next to list_job
+JOB_TEXT_SQL = """
+    SELECT j.id, j.description, CAST(j.job_number AS TEXT), c.name
+    FROM list_job j JOIN list_customer c ON c.id = j.customer_id
+"""
+
+
+def search_terms(text):
+    """
+    split search text into words, ignoring punctuation
+    :param text: str
+    :return: list of str
+    """
+    return re.findall(r'\w+', text.lower())
+
+
+class SimpleSearch:
+    """
+    fallback for databases without a text index: matches every word against
+    the description, job number and customer name with LIKE scans, and
+    doesn't rank the results.
+    """
+
+    def search(self, queryset, text):
+        """
+        the jobs in queryset matching every word of the search text, with a
+        `search_rank` to order by (lower is better)
+        :param queryset: Job queryset
+        :param text: str - the search text
+        :return: QuerySet
+        """
+        for term in search_terms(text):
+            match = (Q(description__icontains=term)
+                     | Q(customer__name__icontains=term))
+            if term.isdigit():
+                match |= Q(job_number__startswith=term)
+            queryset = queryset.filter(match)
+        return queryset.extra(select={'search_rank': '0'})
+
+    def index_jobs(self, where='', params=()):
+        pass
+
+    def remove_jobs(self, job_ids):
+        pass
+
+
+class SqliteSearch(SimpleSearch):
+    """
+    an FTS5 table with a row for each job, keyed by the job's id. words are
+    matched as prefixes and results are ranked with bm25.
+    """
+    table = 'list_job_fts'
+
+    def search(self, queryset, text):
+        terms = search_terms(text)
+        if not terms:
+            return super().search(queryset, text)
+        match = " ".join(f'"{term}"*' for term in terms)
+        return queryset.extra(
+            select={'search_rank': f'{self.table}.rank'},
+            tables=[self.table],
+            where=[f'{self.table}.rowid = list_job.id',
+                   f'{self.table} MATCH %s'],
+            params=[match],
+        )
+
+    def index_jobs(self, where='', params=()):
+        """
+        (re)index the jobs selected by a WHERE clause on list_job j and
+        list_customer c, with one statement.
+        :param where: str - e.g. "WHERE j.id = %s", empty for every job
+        :param params: list - the parameters of where
+        :return: None
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {self.table} "
+                f"(rowid, description, job_number, customer) "
+                f"{JOB_TEXT_SQL} {where}", params)
+
+    def remove_jobs(self, job_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN "
+                f"({', '.join(['%s'] * len(job_ids))})", job_ids)
+
+
+class PostgresSearch(SimpleSearch):
+    """
+    a tsvector of each job in a side table with a GIN index. words are
+    matched as prefixes and results are ranked with ts_rank, description and
+    job number weighted above the customer name.
+    """
+    table = 'list_job_search'
+
+    def search(self, queryset, text):
+        terms = search_terms(text)
+        if not terms:
+            return super().search(queryset, text)
+        query = " & ".join(f"{term}:*" for term in terms)
+        return queryset.extra(
+            select={'search_rank': (f"-ts_rank({self.table}.document, "
+                                    f"to_tsquery('simple', %s))")},
+            select_params=[query],
+            tables=[self.table],
+            where=[f'{self.table}.job_id = list_job.id',
+                   f"{self.table}.document @@ to_tsquery('simple', %s)"],
+            params=[query],
+        )
+
+    def index_jobs(self, where='', params=()):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (job_id, document) "
+                f"SELECT id, "
+                f"setweight(to_tsvector('simple', description), 'A') || "
+                f"setweight(to_tsvector('simple', job_number), 'A') || "
+                f"setweight(to_tsvector('simple', customer), 'B') "
+                f"FROM ({JOB_TEXT_SQL} {where}) "
+                f"AS job (id, description, job_number, customer) "
+                f"ON CONFLICT (job_id) DO UPDATE "
+                f"SET document = EXCLUDED.document", params)
+
+    def remove_jobs(self, job_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE job_id = ANY(%s)",
+                           [list(job_ids)])
+
+
+BACKENDS = {
+    'sqlite': SqliteSearch,
+    'postgresql': PostgresSearch,
+}
+
+
+def get_backend():
+    """
+    the search backend for the database in use. databases without an index
+    table (sqlite builds without FTS5, MySQL) fall back to SimpleSearch.
+    :return: SimpleSearch, SqliteSearch or PostgresSearch
+    """
+    backend = BACKENDS.get(connection.vendor)
+    if backend is not None and _has_table(backend.table):
+        return backend()
+    return SimpleSearch()
+
+
+@lru_cache(maxsize=None)
+def _has_table(table):
+    return table in connection.introspection.table_names()
+
+
+def search_jobs(queryset, text):
+    return get_backend().search(queryset, text)
+
+
+def index_job(job_id):
+    get_backend().index_jobs("WHERE j.id = %s", [job_id])
+
+
+def index_customer_jobs(customer_id):
+    get_backend().index_jobs("WHERE j.customer_id = %s", [customer_id])
+
+
+def remove_job(job_id):
+    get_backend().remove_jobs([job_id])
+
+
+def name_prefix(text):
+    """
+    a filter for customer names starting with the text, served by an index
+    on the name column. on postgres LIKE 'text%' uses the varchar_pattern_ops
+    index Django adds next to the unique one. sqlite's LIKE ignores case and
+    can't use the index, but it compares names bytewise, so there the prefix
+    is a range on the unique index.
+    :param text: str - lowercased, as names are stored
+    :return: Q
+    """
+    if connection.vendor == 'sqlite':
+        return Q(name__gte=text, name__lt=text + '\U0010ffff')
+    return Q(name__startswith=text)
+
+
+def search_customers(text, limit):
+    """
+    the customers whose name starts with the text, see name_prefix, then
+    those with the text elsewhere in their name. the substring scan is only
+    run for what's left of the limit.
+    :param text: str
+    :param limit: int - the most customers to return
+    :return: list of (pk, name)
+    """
+    from list.models import Customer
+
+    text = text.strip().lower()
+    if not text:
+        return []
+    customers = Customer.objects.order_by('name').values_list('pk', 'name')
+    prefix = name_prefix(text)
+    matches = list(customers.filter(prefix)[:limit])
+    if len(matches) < limit:
+        matches += customers.filter(name__contains=text).exclude(
+            prefix)[:limit - len(matches)]
+    return matches
@@ -1,22 +1,147 @@
-$(document).ready(function () {
-    $(".date-input").flatpickr();
-
-    let oldIndex;
-    $(".machine-table").sortable({
+function bindSortable($tables) {
+    $tables.sortable({
         containerSelector: 'table',
         itemPath: '> tbody',
         itemSelector: 'tr',
         placeholder: '<tr class="placeholder"/>',
         delay: 0.5,
-        onDragStart: ($item, container, _super) => {
-          oldIndex = $item.index();
-        },
         onDrop: ($item, container, _super) => {
-            let new_order = $item.index();
-            let job_href = $item.children()[1].firstElementChild.attributes['0'].nodeValue;
-            let job_number = job_href.substring(5);
-            window.location.href = "job/to/" + job_number + new_order;
             _super($item, container);
+            let $table = $item.closest('table');
+            let $rows = $table.find('> tbody > tr.job-row');
+            let jobs = $rows.map((i, row) => $(row).data('job-id')).get();
+            $.ajax({
+                url: $table.data('reorder-url'),
+                method: 'POST',
+                contentType: 'application/json',
+                data: JSON.stringify({jobs: jobs}),
+                headers: {
+                    'X-CSRFToken': $('[name=csrfmiddlewaretoken]').first().val()
+                },
+            }).done(() => {
+                $rows.each((i, row) => {
+                    $(row).find('.job-position').text((i + 1) + '.');
+                });
+            }).fail(() => {
+                // the queue changed under us, show the saved order
+                window.location.reload();
+            });
         }
-    })
+    });
+}
+
+function refreshMachineTable($board, machineId) {
+    let $container = $board.find('.machine-table-container[data-machine-id=' + machineId + ']');
+    // only the machine that changed is fetched and swapped in
+    $.get($container.data('table-url')).done((html) => {
+        $container.html(html);
+        bindSortable($container.find('.machine-table'));
+    });
+}
+
+function parseVersions(text) {
+    let versions = {};
+    String(text || '').split(',').forEach((pair) => {
+        let parts = pair.split(':');
+        if (parts.length === 2) {
+            versions[parts[0]] = Number(parts[1]);
+        }
+    });
+    return versions;
+}
+
+function listenForChanges($board) {
+    if (!window.EventSource) {
+        return;
+    }
+    let url = $board.data('events-url') + '?v=' + encodeURIComponent($board.data('versions'));
+    let source = new EventSource(url);
+    source.addEventListener('machine', (e) => {
+        refreshMachineTable($board, JSON.parse(e.data).machine);
+    });
+}
+
+function pollForChanges($board) {
+    let versions = parseVersions($board.data('versions'));
+    let poll = () => {
+        // an unchanged board is answered with a 304 from its etag
+        $.ajax({url: $board.data('poll-url'), dataType: 'json', ifModified: true}).done((data, status) => {
+            if (status === 'notmodified' || !data) {
+                return;
+            }
+            data.machines.forEach((machine) => {
+                if (versions[machine.id] !== undefined && versions[machine.id] !== machine.version) {
+                    refreshMachineTable($board, machine.id);
+                }
+                versions[machine.id] = machine.version;
+            });
+        });
+    };
+    setInterval(poll, $board.data('poll-interval') * 1000);
+}
+
+function bindCustomerSearch($selects) {
+    $selects.not('.customer-search-bound').each((i, select) => {
+        let $select = $(select).addClass('customer-search-bound');
+        let $input = $('<input type="search" class="uk-input uk-form-width-large" placeholder="Search customers">');
+        let timer = null;
+        $select.before($input);
+        $input.on('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                $.getJSON($select.data('search-url'), {q: $input.val()}).done((data) => {
+                    // keep the chosen customer, replace the rest with the matches
+                    let chosen = $select.val();
+                    $select.find('option').filter((i, option) => option.value && option.value !== chosen).remove();
+                    data.customers.forEach((customer) => {
+                        if (String(customer.id) !== chosen) {
+                            $select.append($('<option>').val(customer.id).text(customer.name));
+                        }
+                    });
+                });
+            }, 200);
+        });
+    });
+}
+
+function openAddJob($button) {
+    let $modal = $('#form-modal');
+    $modal.find('.machine-name').text($button.data('machine-name'));
+    let $container = $modal.find('.job-form-container');
+    let url = $button.data('form-url');
+    if ($container.data('form-url') === url && $container.find('form').length) {
+        // still this machine's form, keep what's been typed and its errors
+        return;
+    }
+    // a blank form for another machine, rather than carry over what was
+    // typed for the last one
+    $container.data('form-url', url).empty();
+    $.get(url).done((html) => {
+        if ($container.data('form-url') !== url) {
+            // another machine's button was pressed in the meantime
+            return;
+        }
+        $container.html(html);
+        $container.find('.date-input').flatpickr();
+        bindCustomerSearch($container.find('select[data-search-url]'));
+    });
+}
+
+$(document).ready(function () {
+    $(".date-input").flatpickr();
+
+    bindSortable($(".machine-table"));
+    bindCustomerSearch($("select[data-search-url]"));
+
+    $(document).on('click', '.add-job', (e) => openAddJob($(e.currentTarget)));
+    if ($('#form-modal[data-open]').length) {
+        UIkit.modal('#form-modal').show();
+    }
+
+    let $board = $(".priority-board");
+    if ($board.is('[data-events-url]')) {
+        listenForChanges($board);
+    } else if ($board.is('[data-poll-url]')) {
+        pollForChanges($board);
+    }
 });
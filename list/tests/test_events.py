@@ -0,0 +1,172 @@
+import threading
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from list import events
+from list.models import Customer, Machine, Profile, bump_queue_version
+from list.tests.util import create_jobs
+
+
+class LocalBrokerTestCase(TestCase):
+    def test_publish(self):
+        broker = events.LocalBroker()
+        first = broker.subscribe()
+        second = broker.subscribe()
+        broker.unsubscribe(second)
+
+        broker.publish({'machines': [1]})
+
+        self.assertEqual(first.get_nowait(), {'machines': [1]})
+        self.assertTrue(second.empty())
+
+    def test_versions(self):
+        self.assertDictEqual(events.parse_versions("1:4,2:10,x,3:y"),
+                             {1: 4, 2: 10})
+        self.assertEqual(events.format_versions({1: 4, 2: 10}), "1:4,2:10")
+        self.assertDictEqual(events.parse_versions(""), {})
+
+
+class BoardStreamTestCase(TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        self.starvision = Machine.objects.create(name="Starvision")
+        self.versions = dict(Machine.objects.values_list('pk', 'queue_version'))
+        self.machine_ids = [self.pin1.pk, self.pin2.pk]
+
+    def stream(self, versions, **kwargs):
+        kwargs.setdefault('heartbeat', 0.01)
+        kwargs.setdefault('max_age', 5)
+        stream = events.board_stream(self.machine_ids, versions, **kwargs)
+        self.assertEqual(next(stream), "retry: 3000\n\n")
+        return stream
+
+    def test_stale_versions(self):
+        versions = dict(self.versions)
+        versions[self.pin2.pk] -= 1
+        stream = self.stream(versions)
+
+        event = next(stream)
+        self.assertIn("event: machine\n", event)
+        self.assertIn(f'"machine": {self.pin2.pk}', event)
+        self.assertIn(f"id: {events.format_versions(self.versions)}", event)
+        stream.close()
+
+    def test_change_is_sent(self):
+        stream = self.stream(self.versions)
+        self.assertEqual(next(stream), ": keepalive\n\n")
+
+        bump_queue_version(self.starvision.pk)
+        self.assertEqual(next(stream), ": keepalive\n\n")
+
+        bump_queue_version(self.pin1.pk)
+        event = next(stream)
+        self.assertIn(f'"machine": {self.pin1.pk}', event)
+        self.assertIn(f'"version": {self.versions[self.pin1.pk] + 1}', event)
+        stream.close()
+
+    def test_published_change_wakes_stream(self):
+        # without the broker the stream would wait for the heartbeat
+        stream = self.stream(self.versions, heartbeat=60)
+        next(stream)
+        bump_queue_version(self.pin1.pk)
+        timer = threading.Timer(
+            0.05, events.publish_queue_changes, [[self.pin1.pk]])
+        timer.start()
+
+        self.assertIn(f'"machine": {self.pin1.pk}', next(stream))
+        stream.close()
+        timer.join()
+
+    def test_stream_ends(self):
+        stream = self.stream(self.versions, max_age=0)
+        next(stream)
+        self.assertListEqual(list(stream), [])
+        self.assertFalse(events.get_broker()._subscribers)
+
+
+class PublishTestCase(TransactionTestCase):
+    def test_published_on_commit(self):
+        machine = Machine.objects.create(name="Pinnacle 1")
+        customer = Customer.objects.create(name="Custy 1")
+        subscriber = events.get_broker().subscribe()
+        try:
+            create_jobs(1, machine, [customer])
+            self.assertIn(machine.pk, subscriber.get_nowait()['machines'])
+        finally:
+            events.get_broker().unsubscribe(subscriber)
+
+
+@override_settings(BOARD_EVENTS_ENABLED=True)
+class BoardEventsViewTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        self.c1 = Customer.objects.create(name="Custy 1")
+        create_jobs(2, self.pin1, [self.c1])
+        Profile.objects.get(user=self.u1).machines.set([self.pin1])
+        self.pin1.refresh_from_db()
+
+    def test_redirect_if_not_logged_in(self):
+        url = reverse('list:board-events')
+        response = self.client.get(url)
+        self.assertRedirects(response, '/accounts/login/?next=' + url)
+
+    def test_events(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:board-events'),
+                                   {'v': f"{self.pin1.pk}:0"})
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = iter(response.streaming_content)
+        next(stream)
+        self.assertIn(f'"machine": {self.pin1.pk}'.encode(), next(stream))
+        response.close()
+
+    def test_last_event_id(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(
+            reverse('list:board-events'), {'v': f"{self.pin1.pk}:0"},
+            HTTP_LAST_EVENT_ID=f"{self.pin1.pk}:{self.pin1.queue_version}")
+
+        stream = iter(response.streaming_content)
+        next(stream)
+        self.assertEqual(next(stream), b": keepalive\n\n")
+        response.close()
+
+    def test_events_turned_off(self):
+        self.client.login(username="testuser1", password="testing123")
+        with self.settings(BOARD_EVENTS_ENABLED=False):
+            response = self.client.get(reverse('list:board-events'))
+            self.assertEqual(response.status_code, 404)
+
+            # the board polls the board api instead
+            response = self.client.get(reverse('list:priority-list'))
+            self.assertNotContains(response, reverse('list:board-events'))
+            self.assertContains(response, 'data-poll-url="%s"'
+                                % reverse('list:board-api'))
+
+    def test_board_versions(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertEqual(response.context['board_versions'],
+                         f"{self.pin1.pk}:{self.pin1.queue_version}")
+        self.assertContains(
+            response, reverse('list:machine-table', args=[self.pin1.pk]))
+
+    def test_machine_table(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:machine-table',
+                                           args=[self.pin1.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Queue-Version'],
+                         str(self.pin1.queue_version))
+        self.assertContains(response, 'class="uk-width-1-1 machine-table')
+        self.assertContains(response, 'data-job-id', count=2)
@@ -0,0 +1,80 @@
+import csv
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from list.models import Customer, Job, Machine, Profile
+
+
+class CsvExportTestCase(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        Profile.objects.get(user=self.u1).machines.set([self.pin1])
+
+        self.c1 = Customer.objects.create(name="Acme Tooling")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        self.bracket = Job.objects.create(
+            job_number=1234, description="Mounting Bracket", add_tools=True,
+            customer=self.c1, machine=self.pin1, setup_sheets=Job.YES)
+        self.plate = Job.objects.create(
+            job_number=5678, description="base plate for bracket",
+            add_tools=False, customer=self.c2, machine=self.pin2)
+        self.shaft = Job.objects.create(
+            job_number=1299, description="drive shaft", add_tools=False,
+            customer=self.c2, machine=self.pin1)
+        for job in (self.plate, self.shaft):
+            job.active = False
+            job.save()
+
+    def export(self, url, data=None):
+        self.client.login(username="testuser1", password="testing123")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+            self.assertTrue(response.streaming)
+            content = b''.join(response.streaming_content).decode()
+        self.queries = queries
+        return response, list(csv.reader(content.splitlines()))
+
+    def test_redirect_if_not_logged_in(self):
+        url = reverse('list:archive-export')
+        response = self.client.get(url)
+        self.assertRedirects(response, '/accounts/login/?next=' + url)
+
+    def test_search_export(self):
+        response, rows = self.export(reverse('list:search-export'),
+                                     {'description': "bracket"})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'],
+                         'attachment; filename="job-search.csv"')
+        self.assertEqual(rows[0][:4],
+                         ["Job Number", "Description", "Customer", "Machine"])
+        self.assertCountEqual([row[0] for row in rows[1:]], ["1234", "5678"])
+        bracket = next(row for row in rows if row[0] == "1234")
+        self.assertEqual(bracket[2:6],
+                         ["Acme Tooling", "Pinnacle 1", "Yes", "Yes"])
+        self.assertEqual(bracket[-1], "Yes")
+
+    def test_search_filters(self):
+        _, rows = self.export(reverse('list:search-export'),
+                              {'machine': self.pin1.pk, 'job_number': 1299})
+        self.assertListEqual([row[0] for row in rows[1:]], ["1299"])
+
+    def test_archive_export(self):
+        _, rows = self.export(reverse('list:archive-export'))
+
+        # only archived jobs on the user's machines
+        self.assertListEqual([row[0] for row in rows[1:]], ["1299"])
+        self.assertNotEqual(rows[1][8], "")
+        self.assertEqual(rows[1][9], "No")
+        # one query for the rows, without a query per job
+        job_queries = [query for query in self.queries
+                       if 'FROM "list_job"' in query['sql']]
+        self.assertEqual(len(job_queries), 1)
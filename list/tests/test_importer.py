@@ -0,0 +1,202 @@
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from list import search
+from list.importer import ImportFileError, JobImporter, read_csv, read_rows
+from list.models import Customer, Job, Machine
+from list.tests.util import create_jobs
+
+CSV = """Job Number,Description,Customer,Machine,Due Date,Add Tools,Setup Sheets
+1234,Mounting bracket,Acme Tooling,Pinnacle 1,2019-07-10,yes,Y
+1235,Base plate,ABC Co.,pinnacle 2,,no,N/A
+12,Too short,Acme Tooling,Pinnacle 1,,,
+1236,Drive shaft,Nobody Inc,Lathe,,,
+1237,Cover,acme tooling,Pinnacle 1,,,
+"""
+
+
+class JobImporterTestCase(TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        self.c1 = Customer.objects.create(name="Acme Tooling")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+        create_jobs(2, self.pin1, [self.c1])
+
+    def run_import(self, text, **kwargs):
+        return JobImporter(**kwargs).run(
+            read_csv(io.BytesIO(text.encode())))
+
+    def queue(self, machine):
+        return list(Job.objects
+                    .filter(machine=machine, active=True)
+                    .order_by('order')
+                    .values_list('description', 'order'))
+
+    def test_import(self):
+        version = Machine.objects.get(pk=self.pin1.pk).queue_version
+        report = self.run_import(CSV)
+
+        self.assertEqual(report.created, 3)
+        self.assertListEqual(self.queue(self.pin1),
+                             [("Pinnacle 1 job 0", 0), ("Pinnacle 1 job 1", 1),
+                              ("Mounting bracket", 2), ("Cover", 3)])
+        self.assertListEqual(self.queue(self.pin2), [("Base plate", 0)])
+
+        bracket = Job.objects.get(description="Mounting bracket")
+        self.assertEqual(bracket.job_number, 1234)
+        self.assertEqual(bracket.customer, self.c1)
+        self.assertEqual(str(bracket.due_date), "2019-07-10")
+        self.assertTrue(bracket.add_tools)
+        self.assertEqual(bracket.setup_sheets, Job.YES)
+        self.assertIsNotNone(bracket.date_added)
+        self.assertEqual(Job.objects.get(description="Base plate")
+                         .setup_sheets, Job.NA)
+
+        self.assertEqual(Machine.objects.get(pk=self.pin1.pk).queue_version,
+                         version + 1)
+        self.assertIn(bracket, search.search_jobs(Job.objects.all(),
+                                                  "bracket"))
+
+    def test_errors(self):
+        report = self.run_import(CSV)
+
+        self.assertEqual([line for line, _ in report.errors], [4, 5])
+        self.assertIn("job_number", report.errors[0][1])
+        self.assertIn('No customer named "nobody inc"', report.errors[1][1])
+        self.assertIn('No machine named "Lathe"', report.errors[1][1])
+        self.assertEqual(str(report), "3 jobs imported, 2 rows skipped")
+
+    def test_create_customers(self):
+        report = self.run_import(CSV.replace("Lathe", "Pinnacle 2"),
+                                 create_customers=True)
+
+        self.assertEqual(report.created, 4)
+        self.assertTrue(Customer.objects.filter(name="nobody inc").exists())
+
+    def test_created_customer_name_too_long(self):
+        name = "x" * 51
+        report = self.run_import(CSV.replace("Nobody Inc", name)
+                                 .replace("Lathe", "Pinnacle 2"),
+                                 create_customers=True)
+
+        self.assertEqual(report.created, 3)
+        self.assertEqual([line for line, _ in report.errors], [4, 5])
+        self.assertIn("customer: Ensure this value has at most 50 characters",
+                      report.errors[1][1])
+        self.assertFalse(Customer.objects.filter(name=name).exists())
+
+    def test_batches(self):
+        rows = "".join(f"{1000 + i},job {i},ABC Co.,Pinnacle 2,,,\n"
+                       for i in range(25))
+        with CaptureQueriesContext(connection) as queries:
+            report = self.run_import(
+                "job_number,description,customer,machine,due_date,"
+                "add_tools,setup_sheets\n" + rows, batch_size=10)
+
+        self.assertEqual(report.created, 25)
+        inserts = [query for query in queries
+                   if query['sql'].startswith('INSERT INTO "list_job"')]
+        self.assertEqual(len(inserts), 3)
+        self.assertListEqual([order for _, order in self.queue(self.pin2)],
+                             list(range(25)))
+
+    def test_missing_columns(self):
+        with self.assertRaises(ImportFileError):
+            self.run_import("job_number,description\n1234,bracket\n")
+
+    def test_not_utf8(self):
+        text = CSV.replace("Base plate", "Base plaque à bride")
+        with self.assertRaises(ImportFileError) as raised:
+            JobImporter().run(read_csv(io.BytesIO(text.encode('cp1252'))))
+        self.assertIn("Line 3 isn't UTF-8", str(raised.exception))
+        # the rows before it aren't kept either
+        self.assertEqual(Job.objects.count(), 2)
+
+    @unittest.skipUnless(importlib.util.find_spec('openpyxl'),
+                         "openpyxl isn't installed")
+    def test_not_a_workbook(self):
+        with self.assertRaises(ImportFileError):
+            JobImporter().run(read_rows(io.BytesIO(CSV.encode()), "jobs.xlsx"))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ImportFileError):
+            read_rows(io.BytesIO(b""), "jobs.pdf")
+
+    def test_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv',
+                                         delete=False) as file:
+            file.write(CSV)
+        try:
+            stdout, stderr = io.StringIO(), io.StringIO()
+            call_command('import_jobs', file.name, stdout=stdout,
+                         stderr=stderr)
+        finally:
+            os.remove(file.name)
+
+        self.assertIn("3 jobs imported, 2 rows skipped", stdout.getvalue())
+        self.assertIn("line 4: job_number", stderr.getvalue())
+
+
+class JobImportViewTestCase(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        Machine.objects.create(name="Pinnacle 1")
+        Machine.objects.create(name="Pinnacle 2")
+        Customer.objects.create(name="Acme Tooling")
+        Customer.objects.create(name="ABC Co.")
+        self.url = reverse('list:import')
+
+    def upload(self, name, content):
+        return self.client.post(self.url, {
+            'file': SimpleUploadedFile(name, content.encode()),
+        })
+
+    def test_redirect_if_not_logged_in(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, '/accounts/login/?next=' + self.url)
+
+    def test_import(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.upload("jobs.csv", CSV)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['report'].created, 3)
+        self.assertContains(response, "3 jobs imported, 2 rows skipped")
+        self.assertContains(response, "Too short", count=0)
+        self.assertContains(response, "No machine named")
+        self.assertEqual(Job.objects.count(), 3)
+
+    def test_not_utf8(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(self.url, {
+            'file': SimpleUploadedFile("jobs.csv", "Café".encode('cp1252')),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response, 'form', 'file',
+                             'Line 1 isn\'t UTF-8 text, save the file as '
+                             '"CSV UTF-8".')
+
+    def test_bad_file(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.upload("jobs.pdf", CSV)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('report', response.context)
+        self.assertFormError(response, 'form', 'file',
+                             "Can't import \"jobs.pdf\", expected a csv or "
+                             "xlsx file.")
+        self.assertEqual(Job.objects.count(), 0)
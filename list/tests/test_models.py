@@ -1,7 +1,9 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from list.models import Job, Customer, Machine
-from list.tests.util import create_jobs
+from list.models import Job, Customer, Machine, close_gap
+from list.tests.util import QueueAssertionsMixin, create_jobs
 
 
 class JobModelTestCase(TestCase):
@@ -114,4 +116,176 @@ class MachineModelTestCase(TestCase):
         job.active = False
         job.save()
 
-        self.assertEqual(list(self.starvision.active_jobs()), list(Job.objects.filter(machine__pk=self.starvision.pk, active=True)))
\ No newline at end of file
+        self.assertEqual(list(self.starvision.active_jobs()), list(Job.objects.filter(machine__pk=self.starvision.pk, active=True)))
+
+
+class SmoothOrderingTestCase(QueueAssertionsMixin, TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(3, self.pin1, [self.c1, self.c2])
+        create_jobs(30, self.pin2, [self.c1, self.c2])
+
+    def test_close_gap_is_one_update(self):
+        j = Job.objects.get(machine=self.pin2, order=0)
+        Job.objects.filter(pk=j.pk).update(active=False)
+
+        with self.assertNumQueries(1):
+            moved = close_gap(self.pin2.pk, j.order)
+
+        self.assertEqual(moved, 29)
+        self.assertContiguous(self.pin2)
+
+    def test_archive_query_count_independent_of_queue_length(self):
+        short = Job.objects.get(machine=self.pin1, order=0)
+        long = Job.objects.get(machine=self.pin2, order=0)
+
+        with CaptureQueriesContext(connection) as short_queries:
+            short.active = False
+            short.save()
+        with CaptureQueriesContext(connection) as long_queries:
+            long.active = False
+            long.save()
+
+        self.assertEqual(len(short_queries), len(long_queries))
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+
+    def test_machine_change_query_count_independent_of_queue_length(self):
+        short = Job.objects.get(machine=self.pin1, order=0)
+        long = Job.objects.get(machine=self.pin2, order=0)
+
+        with CaptureQueriesContext(connection) as short_queries:
+            short.machine = self.pin2
+            short.save()
+        with CaptureQueriesContext(connection) as long_queries:
+            long.machine = self.pin1
+            long.save()
+
+        self.assertEqual(len(short_queries), len(long_queries))
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+
+
+class JobSaveQueryCountTestCase(QueueAssertionsMixin, TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(3, self.pin1, [self.c1, self.c2])
+        create_jobs(3, self.pin2, [self.c1, self.c2])
+
+    def assertOneJobUpdate(self, queries):
+        job_writes = [query['sql'] for query in queries
+                      if query['sql'].startswith('UPDATE "list_job"')
+                      and 'WHERE "list_job"."id" =' in query['sql']]
+        self.assertEqual(len(job_writes), 1)
+
+    def test_create(self):
+        # max order, insert, queue version, search index
+        with self.assertNumQueries(4):
+            j = Job.objects.create(job_number=6543,
+                                   description="test new job",
+                                   machine=self.pin1, customer=self.c1,
+                                   add_tools=True)
+        self.assertEqual(j.order, 3)
+
+    def test_edit(self):
+        j = Job.objects.get(machine=self.pin1, order=1)
+        j.description = "changed"
+        # update, queue version, search index
+        with self.assertNumQueries(3):
+            j.save()
+        self.assertEqual(Job.objects.get(pk=j.pk).description, "changed")
+
+    def test_edit_without_text_change(self):
+        j = Job.objects.get(machine=self.pin1, order=1)
+        j.add_tools = not j.add_tools
+        # update, queue version
+        with self.assertNumQueries(2):
+            j.save()
+
+    def test_archive(self):
+        j = Job.objects.get(machine=self.pin1, order=0)
+        j.active = False
+        # close gap, update, queue version
+        with CaptureQueriesContext(connection) as queries:
+            j.save()
+        self.assertEqual(len(queries), 3)
+        self.assertOneJobUpdate(queries)
+        self.assertContiguous(self.pin1)
+        self.assertIsNotNone(Job.objects.get(pk=j.pk).datetime_completed)
+
+    def test_reactivate(self):
+        j = Job.objects.get(machine=self.pin1, order=0)
+        j.active = False
+        j.save()
+
+        j.active = True
+        # max order, update, queue version
+        with CaptureQueriesContext(connection) as queries:
+            j.save()
+        self.assertEqual(len(queries), 3)
+        self.assertOneJobUpdate(queries)
+        self.assertContiguous(self.pin1)
+        self.assertEqual(j.order, 2)
+        self.assertIsNone(Job.objects.get(pk=j.pk).datetime_completed)
+
+    def test_machine_move(self):
+        j = Job.objects.get(machine=self.pin1, order=0)
+        j.machine = self.pin2
+        # max order, close gap, update, queue versions
+        with CaptureQueriesContext(connection) as queries:
+            j.save()
+        self.assertEqual(len(queries), 4)
+        self.assertOneJobUpdate(queries)
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+        self.assertEqual(Job.objects.get(pk=j.pk).order, 3)
+
+    def test_archive_stale_instance(self):
+        stale = Job.objects.get(machine=self.pin1, order=2)
+        head = Job.objects.get(machine=self.pin1, order=0)
+        head.active = False
+        head.save()
+
+        # stale still thinks it's at order 2, it is at 1 in the database
+        stale.active = False
+        stale.save()
+
+        self.assertContiguous(self.pin1)
+        self.assertEqual(Job.objects.filter(machine=self.pin1,
+                                            active=True).count(), 1)
+
+    def test_edit_stale_instance_keeps_order(self):
+        stale = Job.objects.get(machine=self.pin1, order=2)
+        head = Job.objects.get(machine=self.pin1, order=0)
+        head.active = False
+        head.save()
+
+        stale.description = "changed"
+        stale.save()
+
+        self.assertContiguous(self.pin1)
+        self.assertEqual(Job.objects.get(pk=stale.pk).order, 1)
+
+    def test_edit_stale_instance_update_fields_keeps_order(self):
+        stale = Job.objects.get(machine=self.pin1, order=2)
+        head = Job.objects.get(machine=self.pin1, order=0)
+        head.active = False
+        head.save()
+
+        stale.description = "changed"
+        stale.save(update_fields=['description', 'order'])
+
+        self.assertContiguous(self.pin1)
+        saved = Job.objects.get(pk=stale.pk)
+        self.assertEqual(saved.order, 1)
+        self.assertEqual(saved.description, "changed")
@@ -0,0 +1,146 @@
+import io
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from list import queue
+from list.models import Job, Customer, Machine
+from list.tests.util import create_jobs
+
+
+@override_settings(JOB_ORDERING='sparse', JOB_ORDER_GAP=1024)
+class SparseOrderingTestCase(TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(5, self.pin1, [self.c1, self.c2])
+        create_jobs(5, self.pin2, [self.c1, self.c2])
+
+    def queue_pks(self, machine):
+        return list(Job.objects
+                    .filter(machine=machine, active=True)
+                    .order_by('order')
+                    .values_list('pk', flat=True))
+
+    def job_writes(self, queries):
+        return [query['sql'] for query in queries
+                if query['sql'].startswith('UPDATE "list_job"')]
+
+    def test_new_jobs_are_gapped(self):
+        orders = list(Job.objects
+                      .filter(machine=self.pin1)
+                      .values_list('order', flat=True))
+        self.assertListEqual(orders, [1024, 2048, 3072, 4096, 5120])
+
+    def test_to_writes_only_the_moved_job(self):
+        pks = self.queue_pks(self.pin1)
+        job = Job.objects.get(pk=pks[-1])
+
+        with CaptureQueriesContext(connection) as queries:
+            job.to(0)
+
+        self.assertEqual(len(self.job_writes(queries)), 1)
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             [pks[-1]] + pks[:-1])
+        self.assertEqual(job.position(), 0)
+
+    def test_to_middle(self):
+        pks = self.queue_pks(self.pin1)
+        job = Job.objects.get(pk=pks[0])
+        job.to(3)
+
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             pks[1:4] + [pks[0]] + pks[4:])
+        self.assertEqual(job.position(), 3)
+
+    def test_up_and_down(self):
+        pks = self.queue_pks(self.pin1)
+        job = Job.objects.get(pk=pks[2])
+
+        job.up()
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             [pks[0], pks[2], pks[1]] + pks[3:])
+        job.down()
+        job.down()
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             [pks[0], pks[1], pks[3], pks[2], pks[4]])
+
+        top = Job.objects.get(pk=pks[0])
+        top.up()
+        bottom = Job.objects.get(pk=pks[4])
+        bottom.down()
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             [pks[0], pks[1], pks[3], pks[2], pks[4]])
+
+    def test_archive_leaves_other_jobs_alone(self):
+        pks = self.queue_pks(self.pin1)
+        orders = dict(Job.objects.values_list('pk', 'order'))
+        job = Job.objects.get(pk=pks[0])
+        job.active = False
+
+        with CaptureQueriesContext(connection) as queries:
+            job.save()
+
+        self.assertEqual(len(self.job_writes(queries)), 1)
+        for pk in pks[1:]:
+            self.assertEqual(Job.objects.get(pk=pk).order, orders[pk])
+        self.assertEqual(Job.objects.get(pk=pks[1]).position(), 0)
+
+    def test_machine_move_goes_to_bottom(self):
+        job = Job.objects.get(pk=self.queue_pks(self.pin1)[0])
+        job.machine = self.pin2
+        job.save()
+
+        self.assertEqual(self.queue_pks(self.pin2)[-1], job.pk)
+        self.assertEqual(job._find_max_order(include_self=True), job.order)
+
+    @override_settings(JOB_ORDER_GAP=2)
+    def test_rebalance_when_gaps_run_out(self):
+        for i, pk in enumerate(self.queue_pks(self.pin1)):
+            Job.objects.filter(pk=pk).update(order=(i + 1) * 2)
+        pks = self.queue_pks(self.pin1)
+
+        # keep moving the last job to the top until the gap at the top is
+        # gone, the queue has to be rebalanced to make room
+        expected = pks
+        for _ in range(6):
+            job = Job.objects.get(pk=expected[-1])
+            queue.move_to(job, 0)
+            expected = [expected[-1]] + expected[:-1]
+            self.assertListEqual(self.queue_pks(self.pin1), expected)
+
+        orders = list(Job.objects
+                      .filter(machine=self.pin1, active=True)
+                      .values_list('order', flat=True))
+        self.assertEqual(len(set(orders)), len(orders))
+
+    def test_move_to_uses_positions(self):
+        pks = self.queue_pks(self.pin1)
+        job = Job.objects.get(pk=pks[4])
+        queue.move_to(job, 1)
+
+        self.assertListEqual(self.queue_pks(self.pin1),
+                             [pks[0], pks[4]] + pks[1:4])
+
+    def test_rebalance_command(self):
+        Job.objects.filter(machine=self.pin1).update(order=F('order') / 1024)
+        versions = dict(Machine.objects.values_list('pk', 'queue_version'))
+
+        call_command('rebalance_job_order', self.pin1.pk, stdout=io.StringIO())
+
+        orders = list(Job.objects
+                      .filter(machine=self.pin1)
+                      .order_by('order')
+                      .values_list('order', flat=True))
+        self.assertListEqual(orders, [1024, 2048, 3072, 4096, 5120])
+        self.assertEqual(Machine.objects.get(pk=self.pin1.pk).queue_version,
+                         versions[self.pin1.pk] + 1)
+        self.assertEqual(Machine.objects.get(pk=self.pin2.pk).queue_version,
+                         versions[self.pin2.pk])
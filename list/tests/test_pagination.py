@@ -0,0 +1,77 @@
+import base64
+import datetime
+import json
+
+from django.core.paginator import InvalidPage
+from django.test import TestCase
+from django.utils import timezone
+
+from list.models import Job, Customer, Machine
+from list.pagination import KeysetPaginator
+from list.tests.util import create_jobs
+
+
+class KeysetPaginatorTestCase(TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.c1 = Customer.objects.create(name="Custy 1")
+        create_jobs(11, self.pin1, [self.c1])
+
+        # several jobs completed at the same moment, and some from before
+        # completion times were recorded
+        now = timezone.now()
+        jobs = list(Job.objects.order_by('pk'))
+        completed = [now, now, now, None, now - datetime.timedelta(days=1),
+                     None, now, now - datetime.timedelta(days=2), None,
+                     now, now - datetime.timedelta(days=1)]
+        for job, datetime_completed in zip(jobs, completed):
+            Job.objects.filter(pk=job.pk).update(
+                active=False, datetime_completed=datetime_completed)
+
+        self.ordering = ('-datetime_completed', '-id')
+        self.expected = sorted(
+            Job.objects.all(),
+            key=lambda job: (job.datetime_completed is None,
+                             -(job.datetime_completed or now).timestamp(),
+                             -job.pk))
+
+    def walk(self, per_page):
+        paginator = KeysetPaginator(Job.objects.all(), per_page,
+                                    self.ordering)
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(after=pages[-1].next_cursor()))
+        return paginator, pages
+
+    def test_forwards(self):
+        for per_page in range(1, 12):
+            paginator, pages = self.walk(per_page)
+            self.assertListEqual([job for page in pages for job in page],
+                                 self.expected)
+            self.assertEqual(pages[-1].end_index(), len(self.expected))
+
+    def test_backwards(self):
+        for per_page in range(1, 12):
+            paginator, pages = self.walk(per_page)
+            back = [pages[-1]]
+            while back[-1].has_previous():
+                back.append(paginator.page(before=back[-1].previous_cursor()))
+            self.assertListEqual([page.object_list for page in back],
+                                 [page.object_list for page in pages[::-1]])
+            self.assertEqual(back[-1].start_index(), 1)
+
+    def test_forged_cursor(self):
+        paginator, pages = self.walk(5)
+        cursor = pages[0].next_cursor()
+        position, values = json.loads(base64.urlsafe_b64decode(cursor))
+        for forged in ([-1, values], ["x", values], [position, values[:1]]):
+            forged = base64.urlsafe_b64encode(json.dumps(forged).encode())
+            with self.assertRaises(InvalidPage):
+                paginator.page(after=forged.decode())
+
+    def test_count(self):
+        paginator = KeysetPaginator(Job.objects.all(), 5, self.ordering)
+        self.assertIsNone(paginator.count)
+        paginator = KeysetPaginator(Job.objects.all(), 5, self.ordering,
+                                    count=True)
+        self.assertEqual(paginator.count, 11)
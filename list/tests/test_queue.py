@@ -0,0 +1,194 @@
+import random
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from list import queue
+from list.models import Job, Customer, Machine
+from list.tests.util import QueueAssertionsMixin, create_jobs
+
+
+class QueueTestCase(QueueAssertionsMixin, TestCase):
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(4, self.pin1, [self.c1, self.c2])
+        create_jobs(4, self.pin2, [self.c1, self.c2])
+
+    def queue_pks(self, machine):
+        return list(Job.objects
+                    .filter(machine=machine, active=True)
+                    .order_by('order')
+                    .values_list('pk', flat=True))
+
+    def test_move_up_next_to_archived_job(self):
+        # archived jobs are parked at order 0, they must not be swapped with
+        head = Job.objects.get(machine=self.pin1, order=0)
+        queue.archive(head)
+
+        job = Job.objects.get(machine=self.pin1, order=1, active=True)
+        queue.move_up(job)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).order, 0)
+        self.assertEqual(Job.objects.get(pk=head.pk).order, 0)
+        self.assertFalse(Job.objects.get(pk=head.pk).active)
+        self.assertContiguous(self.pin1)
+
+    def test_move_archived_job(self):
+        job = Job.objects.get(machine=self.pin1, order=1)
+        stale = Job.objects.get(pk=job.pk)
+        queue.archive(job)
+
+        queue.move_down(stale)
+
+        self.assertFalse(Job.objects.get(pk=job.pk).active)
+        self.assertContiguous(self.pin1)
+
+    def test_move_stale_job(self):
+        job = Job.objects.get(machine=self.pin1, order=3)
+        head = Job.objects.get(machine=self.pin1, order=0)
+        queue.archive(head)
+
+        # job is at order 2 now, moving it up should put it at 1
+        queue.move_up(job)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).order, 1)
+        self.assertContiguous(self.pin1)
+
+    def test_move_to_past_end(self):
+        job = Job.objects.get(machine=self.pin1, order=0)
+        queue.move_to(job, 50)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).order, 3)
+        self.assertContiguous(self.pin1)
+
+    def test_save_job_moving_machines(self):
+        job = Job.objects.get(machine=self.pin1, order=1)
+        job.machine = self.pin2
+        queue.save_job(job)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).order, 4)
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+
+    def test_archive_jobs(self):
+        pin1 = self.queue_pks(self.pin1)
+        pin2 = self.queue_pks(self.pin2)
+        versions = dict(Machine.objects.values_list('pk', 'queue_version'))
+
+        with CaptureQueriesContext(connection) as queries:
+            archived = queue.archive_jobs([pin1[0], pin1[2], pin2[1]])
+
+        self.assertEqual(archived, 3)
+        self.assertListEqual(self.queue_pks(self.pin1), [pin1[1], pin1[3]])
+        self.assertListEqual(self.queue_pks(self.pin2),
+                             [pin2[0], pin2[2], pin2[3]])
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+        for job in Job.objects.filter(pk__in=[pin1[0], pin1[2], pin2[1]]):
+            self.assertFalse(job.active)
+            self.assertEqual(job.order, 0)
+            self.assertIsNotNone(job.datetime_completed)
+        self.assertEqual(Machine.objects.get(pk=self.pin1.pk).queue_version,
+                         versions[self.pin1.pk] + 1)
+        # one UPDATE archives them, one renumbers each queue and one bumps
+        # the versions
+        updates = [query for query in queries
+                   if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 4)
+
+    def test_archive_jobs_skips_archived(self):
+        pks = self.queue_pks(self.pin1)
+        queue.archive(Job.objects.get(pk=pks[0]))
+        completed = Job.objects.get(pk=pks[0]).datetime_completed
+
+        self.assertEqual(queue.archive_jobs(pks[:2]), 1)
+        self.assertEqual(Job.objects.get(pk=pks[0]).datetime_completed,
+                         completed)
+        self.assertContiguous(self.pin1)
+
+    def test_move_jobs(self):
+        pin1 = self.queue_pks(self.pin1)
+        pin2 = self.queue_pks(self.pin2)
+
+        moved = queue.move_jobs([pin1[3], pin1[1], pin2[0]], self.pin2.pk)
+
+        # jobs already on the machine stay where they are
+        self.assertEqual(moved, 2)
+        self.assertListEqual(self.queue_pks(self.pin1), [pin1[0], pin1[2]])
+        self.assertListEqual(self.queue_pks(self.pin2),
+                             pin2 + [pin1[1], pin1[3]])
+        self.assertContiguous(self.pin1)
+        self.assertContiguous(self.pin2)
+
+    @override_settings(JOB_ORDERING='sparse', JOB_ORDER_GAP=1024)
+    def test_move_jobs_sparse(self):
+        pin1 = self.queue_pks(self.pin1)
+        pin2 = self.queue_pks(self.pin2)
+        last = Job.objects.get(pk=pin2[-1]).order
+
+        queue.move_jobs(pin1[:2], self.pin2.pk)
+
+        self.assertListEqual(self.queue_pks(self.pin2), pin2 + pin1[:2])
+        self.assertListEqual(
+            [Job.objects.get(pk=pk).order for pk in pin1[:2]],
+            [last + 1024, last + 2048])
+        # gaps are left in the queue the jobs came from
+        self.assertListEqual(
+            [Job.objects.get(pk=pk).order for pk in self.queue_pks(self.pin1)],
+            [2, 3])
+
+
+class QueueConcurrencyTestCase(TransactionTestCase):
+    num_threads = 8
+    moves_per_thread = 15
+
+    def setUp(self):
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.c1 = Customer.objects.create(name="Custy 1")
+        create_jobs(40, self.pin1, [self.c1])
+
+    def mutate(self, errors):
+        try:
+            for _ in range(self.moves_per_thread):
+                # the shared in-memory sqlite test database raises instead of
+                # waiting when a table is read during another thread's write
+                with queue.lock_machines(self.pin1.pk):
+                    jobs = list(Job.objects.filter(machine=self.pin1,
+                                                   active=True))
+                if not jobs:
+                    break
+                job = random.choice(jobs)
+                action = random.choice(['up', 'down', 'to', 'to', 'archive'])
+                if action == 'up':
+                    queue.move_up(job)
+                elif action == 'down':
+                    queue.move_down(job)
+                elif action == 'to':
+                    queue.move_to(job, random.randrange(len(jobs)))
+                else:
+                    queue.archive(job)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    def test_orders_stay_contiguous(self):
+        errors = []
+        threads = [threading.Thread(target=self.mutate, args=(errors,))
+                   for _ in range(self.num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        queryset = Job.objects.filter(active=True, machine=self.pin1)
+        order_list = [job.order for job in queryset]
+        self.assertListEqual(order_list, list(range(queryset.count())))
@@ -0,0 +1,152 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.urls import reverse
+
+from list import cache as list_cache, search
+from list.models import Job, Customer, Machine
+
+
+class JobSearchTestCase(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Acme Tooling")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        self.bracket = Job.objects.create(
+            job_number=1234, description="Mounting Bracket", add_tools=False,
+            customer=self.c1, machine=self.pin1)
+        self.plate = Job.objects.create(
+            job_number=5678, description="base plate for bracket",
+            add_tools=False, customer=self.c2, machine=self.pin2)
+        self.shaft = Job.objects.create(
+            job_number=1299, description="drive shaft", add_tools=False,
+            customer=self.c2, machine=self.pin1)
+
+    def find(self, text, queryset=None):
+        if queryset is None:
+            queryset = Job.objects.all()
+        return list(search.search_jobs(queryset, text)
+                    .order_by('search_rank', 'pk'))
+
+    def test_uses_text_index(self):
+        self.assertIsInstance(search.get_backend(), search.SqliteSearch)
+
+    def test_matches_description_number_and_customer(self):
+        self.assertCountEqual(self.find("BRACKET"),
+                              [self.bracket, self.plate])
+        self.assertListEqual(self.find("1234"), [self.bracket])
+        self.assertCountEqual(self.find("12"), [self.bracket, self.shaft])
+        self.assertListEqual(self.find("acme"), [self.bracket])
+        self.assertListEqual(self.find("brack acme"), [self.bracket])
+        self.assertListEqual(self.find("bracket nothing"), [])
+
+    def test_punctuation_is_ignored(self):
+        self.assertListEqual(self.find('"shaft"* ('), [self.shaft])
+
+    def test_ranked(self):
+        # the bracket is mostly the word searched for
+        self.assertListEqual(self.find("bracket"), [self.bracket, self.plate])
+
+    def test_filters_apply_on_top(self):
+        self.assertListEqual(
+            self.find("bracket", Job.objects.filter(machine=self.pin2)),
+            [self.plate])
+
+    def test_index_follows_edits(self):
+        self.shaft.description = "pulley"
+        self.shaft.save()
+        self.assertListEqual(self.find("shaft"), [])
+        self.assertListEqual(self.find("pulley"), [self.shaft])
+
+        self.c2.name = "Widgets Inc"
+        self.c2.save()
+        self.assertCountEqual(self.find("widgets"), [self.plate, self.shaft])
+
+        self.plate.delete()
+        self.assertListEqual(self.find("widgets"), [self.shaft])
+
+    def test_search_view(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:search'),
+                                   {'description': 'bracket',
+                                    'machine': self.pin1.pk})
+        self.assertListEqual(list(response.context['jobs']), [self.bracket])
+
+        response = self.client.get(reverse('list:search'),
+                                   {'description': 'bracket',
+                                    'date_added': '2000-01-01',
+                                    'date_added_lte': 'on'})
+        self.assertListEqual(list(response.context['jobs']), [])
+
+
+class CustomerSearchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        for name in ("Acme Tooling", "ABC Co.", "Tooling Inc",
+                     "Precision Tooling", "Zed"):
+            Customer.objects.create(name=name)
+
+    def names(self, matches):
+        return [name for _, name in matches]
+
+    def test_prefix_matches_come_first(self):
+        self.assertListEqual(
+            self.names(search.search_customers("TOOL", 10)),
+            ["tooling inc", "acme tooling", "precision tooling"])
+        self.assertListEqual(self.names(search.search_customers("c", 10)),
+                             ["abc co.", "acme tooling", "precision tooling",
+                              "tooling inc"])
+
+    def test_prefix_is_not_a_range_elsewhere(self):
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            prefix = search.name_prefix("ab")
+        self.assertEqual(prefix, Q(name__startswith="ab"))
+
+    def test_limit(self):
+        self.assertListEqual(
+            self.names(search.search_customers("tooling", 2)),
+            ["tooling inc", "acme tooling"])
+        self.assertListEqual(search.search_customers("  ", 10), [])
+
+    def test_prefix_uses_name_index(self):
+        customers = Customer.objects.filter(search.name_prefix("tool"))
+        with connection.cursor() as cursor:
+            sql, params = customers.query.sql_with_params()
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        self.assertIn("USING INDEX", plan)
+
+    def test_results_are_cached_until_customers_change(self):
+        list_cache.search_customers("zed")
+        with self.assertNumQueries(1):
+            # only the version of the customers is read
+            self.assertListEqual(
+                self.names(list_cache.search_customers("Zed ")), ["zed"])
+
+        Customer.objects.create(name="Zed Machining")
+        self.assertListEqual(self.names(list_cache.search_customers("zed")),
+                             ["zed", "zed machining"])
+
+    def test_search_view(self):
+        url = reverse('list:customer-search')
+        response = self.client.get(url, {'q': "acme"})
+        self.assertRedirects(response, '/accounts/login/?next=' + url
+                             + '%3Fq%3Dacme')
+
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(url, {'q': "acme"})
+        customer = Customer.objects.get(name="acme tooling")
+        self.assertJSONEqual(response.content.decode(), {
+            'customers': [{'id': customer.pk, 'name': "Acme Tooling"}],
+        })
@@ -1,5 +1,11 @@
+import json
+from unittest import mock
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from list.models import Machine, Customer, Profile, Job
@@ -8,6 +14,7 @@ from list.tests.util import create_jobs
 
 class TestPriorityListView(TestCase):
     def setUp(self):
+        cache.clear()
         self.u1 = User.objects.create_user(username='testuser1', password="testing123")
 
         self.pin1 = Machine.objects.create(name="Pinnacle 1")
@@ -49,8 +56,9 @@ class TestPriorityListView(TestCase):
             self.assertListEqual(list(machine.active_jobs()),
                                  list(Job.objects.filter(machine=machine,
                                                          active=True)))
-        self.assertListEqual(list(response.context['customers']),
-                             list(Customer.objects.all().order_by('name')))
+        self.assertListEqual(
+            [pk for pk, _ in response.context['form'].fields['customer'].choices][1:],
+            list(Customer.objects.order_by('name').values_list('pk', flat=True)))
         self.assertEqual(
             response.context['form']
                 .get_initial_for_field(
@@ -59,6 +67,160 @@ class TestPriorityListView(TestCase):
             True
         )
 
+    def test_one_add_job_modal(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:priority-list'))
+
+        # the form is loaded into the modal on its own, see test_add_job_form
+        self.assertContains(response, 'id="form-modal"', count=1)
+        self.assertContains(response, 'data-form-url="%s"' % reverse(
+            'list:add-form', args=[self.pin1.pk]))
+        self.assertNotContains(response, 'name="job_number"')
+
+    def test_add_job_form(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:add-form',
+                                           args=[self.pin1.pk]))
+
+        self.assertTemplateUsed(response, "list/job_form.html")
+        self.assertContains(response, 'action="%s"' % reverse(
+            'list:add', args=[self.pin1.pk]))
+        self.assertContains(response, 'data-search-url="%s"'
+                            % reverse('list:customer-search'))
+        self.assertEqual(
+            response.context['form']
+                .get_initial_for_field(
+                response.context['form'].fields['active'], 'active'
+            ),
+            True
+        )
+
+    def test_add_job_errors_open_the_modal(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(reverse('list:add', args=[self.pin2.pk]),
+                                    {'description': "no job number"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['active_machine'], self.pin2)
+        self.assertContains(response, 'data-open')
+        # the modal knows whose form it holds, another machine's button
+        # loads a blank form
+        self.assertContains(response, 'data-form-url="%s"' % reverse(
+            'list:add-form', args=[self.pin2.pk]), count=2)
+        self.assertContains(response, 'action="%s"' % reverse(
+            'list:add', args=[self.pin2.pk]))
+        self.assertFormError(response, 'form', 'job_number',
+                             "This field is required.")
+
+    def test_view_renders_active_jobs(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        archived = Job.objects.filter(machine=self.pin1).first()
+        archived.active = False
+        archived.save()
+
+        response = self.client.get(reverse('list:priority-list'))
+
+        for job in Job.objects.filter(machine__in=[self.pin1, self.pin2],
+                                      active=True):
+            self.assertContains(response, job.description.title())
+        self.assertNotContains(response, archived.description.title())
+
+    def test_view_query_count_is_constant(self):
+        login = self.client.login(username="testuser1", password="testing123")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('list:priority-list'))
+        num_queries = len(queries)
+
+        # add more machines, jobs and customers to the profile, the number
+        # of queries shouldn't change
+        machines = [Machine.objects.create(name=f"Machine {i}")
+                    for i in range(5)]
+        customers = [Customer.objects.create(name=f"Customer {i}")
+                     for i in range(5)]
+        for machine in machines:
+            create_jobs(10, machine, customers)
+        create_jobs(10, self.pin1, customers)
+        self.p1.machines.add(*machines)
+
+        with self.assertNumQueries(num_queries):
+            self.client.get(reverse('list:priority-list'))
+
+    def test_machine_tables_are_cached(self):
+        login = self.client.login(username="testuser1", password="testing123")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('list:priority-list'))
+        num_queries = len(queries)
+
+        # no active jobs are loaded when every table is cached
+        with self.assertNumQueries(num_queries - 1):
+            response = self.client.get(reverse('list:priority-list'))
+        job = Job.objects.get(machine=self.pin1, order=0)
+        self.assertContains(response, job.description.title())
+
+    def test_bad_customer_value(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(reverse('list:add', args=[self.pin1.pk]),
+                                    {'customer': "abc"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('customer', response.context['form'].errors)
+
+        response = self.client.get(reverse('list:search'), {'customer': "abc"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_customer_select_carries_only_the_chosen_customer(self):
+        login = self.client.login(username="testuser1", password="testing123")
+
+        # customers are loaded as they're typed, see CustomerSearchTestCase
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('list:add-form',
+                                               args=[self.pin1.pk]))
+        self.assertFalse([query for query in queries
+                          if 'FROM "list_customer"' in query['sql']])
+        self.assertNotContains(response, "Custy 1")
+
+        response = self.client.post(reverse('list:add', args=[self.pin1.pk]),
+                                    {'customer': self.c1.pk})
+        select = str(response.context['form']['customer'])
+        self.assertIn('<option value="%d" selected>Custy 1</option>'
+                      % self.c1.pk, select)
+        self.assertEqual(select.count('<option'), 2)
+
+    def test_machine_tables_are_invalidated(self):
+        login = self.client.login(username="testuser1", password="testing123")
+        self.client.get(reverse('list:priority-list'))
+
+        job = Job.objects.get(machine=self.pin1, order=0)
+        job.description = "changed description"
+        job.save()
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertContains(response, "Changed Description")
+
+        job.active = False
+        job.save()
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertNotContains(response, "Changed Description")
+
+        moved = Job.objects.get(machine=self.pin1, order=0, active=True)
+        moved.machine = self.starvision
+        moved.save()
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertNotContains(response, moved.description.title())
+
+        customer = Job.objects.filter(machine=self.pin2).first().customer
+        customer.name = "Renamed Customer"
+        customer.save()
+        response = self.client.get(reverse('list:priority-list'))
+        tables = {machine: machine.table_html
+                  for machine in response.context['machines']}
+        self.assertIn("Renamed Customer", tables[self.pin2])
+
+        self.pin2.name = "Renamed Machine"
+        self.pin2.save()
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertContains(response, "Renamed Machine")
+
 
 class TestArchiveView(TestCase):
     def setUp(self):
@@ -115,6 +277,56 @@ class TestArchiveView(TestCase):
         self.assertTrue(len(response.context['jobs']) == 5)
 
 
+    def test_cursor_pages(self):
+        login = self.client.login(username='testuser1', password='testing123')
+        expected = list(Job.objects
+                        .filter(active=False)
+                        .order_by('-datetime_completed', '-id')
+                        .values_list('pk', flat=True))
+
+        response = self.client.get(reverse("list:archive-view"))
+        page = response.context['page_obj']
+        self.assertTrue(response.context['keyset'])
+        self.assertFalse(page.has_previous())
+        self.assertTrue(page.has_next())
+        self.assertListEqual([job.pk for job in response.context['jobs']],
+                             expected[:10])
+
+        response = self.client.get(reverse("list:archive-view"),
+                                   {'after': page.next_cursor()})
+        page = response.context['page_obj']
+        self.assertListEqual([job.pk for job in response.context['jobs']],
+                             expected[10:])
+        self.assertEqual(page.start_index(), 11)
+        self.assertContains(response, "11.")
+        self.assertTrue(page.has_previous())
+        self.assertFalse(page.has_next())
+
+        response = self.client.get(reverse("list:archive-view"),
+                                   {'before': page.previous_cursor()})
+        page = response.context['page_obj']
+        self.assertListEqual([job.pk for job in response.context['jobs']],
+                             expected[:10])
+        self.assertEqual(page.start_index(), 1)
+        self.assertFalse(page.has_previous())
+
+    def test_cursor_page_skips_count(self):
+        login = self.client.login(username='testuser1', password='testing123')
+        response = self.client.get(reverse("list:archive-view"))
+        cursor = response.context['page_obj'].next_cursor()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("list:archive-view"), {'after': cursor})
+        self.assertFalse([query for query in queries
+                          if 'COUNT(' in query['sql']])
+
+    def test_invalid_cursor(self):
+        login = self.client.login(username='testuser1', password='testing123')
+        response = self.client.get(reverse("list:archive-view"),
+                                   {'after': 'not a cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
 class TestJobCreateView(TestCase):
     def setUp(self):
         self.u1 = User.objects.create_user(username='testuser1',
@@ -204,6 +416,33 @@ class TestCustomerCreateView(TestCase):
 
         self.assertTemplateUsed(response, 'list/add_customer.html')
 
+    def test_existing_customer(self):
+        login = self.client.login(username="testuser1", password="testing123")
+
+        # one indexed lookup of the lowercased name, not every customer
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('list:add_customer'),
+                                        {'name': " CUSTY 1"})
+        customer_queries = [query['sql'] for query in queries
+                            if 'FROM "list_customer"' in query['sql']]
+        self.assertEqual(len(customer_queries), 1)
+        self.assertIn('WHERE "list_customer"."name" = ', customer_queries[0])
+        self.assertFormError(response, 'form', 'name',
+                             "This customer already exists.")
+        self.assertEqual(Customer.objects.filter(name="custy 1").count(), 1)
+
+    def test_customer_added_concurrently(self):
+        login = self.client.login(username="testuser1", password="testing123")
+
+        # the customer is added by another request after the unique check
+        with mock.patch('list.forms.CustomerForm.validate_unique'):
+            response = self.client.post(reverse('list:add_customer'),
+                                        {'name': "Custy 1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response, 'form', 'name',
+                             "This customer already exists.")
+        self.assertEqual(Customer.objects.filter(name="custy 1").count(), 1)
+
 
 class TestJobUpdateView(TestCase):
     def setUp(self):
@@ -455,6 +694,245 @@ class TestJobArchiveView(TestCase):
         self.assertRedirects(response, reverse("list:priority-list"))
 
 
+class TestMachineReorderView(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123").save()
+
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(4, self.pin1, [self.c1, self.c2])
+        create_jobs(3, self.pin2, [self.c1, self.c2])
+
+        self.url = reverse('list:machine-reorder', kwargs={'pk': self.pin1.pk})
+
+    def queue_pks(self, machine):
+        return list(Job.objects
+                    .filter(machine=machine, active=True)
+                    .order_by('order')
+                    .values_list('pk', flat=True))
+
+    def post(self, jobs):
+        return self.client.post(self.url, json.dumps({'jobs': jobs}),
+                                content_type='application/json')
+
+    def test_redirect_if_not_logged_in(self):
+        response = self.post([])
+        self.assertRedirects(response, '/accounts/login/?next=' + self.url)
+
+    def test_get_not_allowed(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 405)
+
+    def test_reorder(self):
+        self.client.login(username="testuser1", password="testing123")
+        pks = self.queue_pks(self.pin1)
+        new_order = [pks[2], pks[0], pks[3], pks[1]]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(new_order)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(response.json(), {'machine': self.pin1.pk,
+                                               'jobs': new_order})
+        self.assertListEqual(self.queue_pks(self.pin1), new_order)
+        self.assertListEqual(
+            list(Job.objects.filter(machine=self.pin1, active=True)
+                 .order_by('order').values_list('order', flat=True)),
+            [0, 1, 2, 3])
+        job_writes = [query for query in queries
+                      if query['sql'].startswith('UPDATE "list_job"')]
+        self.assertEqual(len(job_writes), 1)
+
+    def test_reorder_invalidates_machine_table(self):
+        self.client.login(username="testuser1", password="testing123")
+        version = Machine.objects.get(pk=self.pin1.pk).queue_version
+        self.post(list(reversed(self.queue_pks(self.pin1))))
+
+        self.assertEqual(Machine.objects.get(pk=self.pin1.pk).queue_version,
+                         version + 1)
+
+    def test_reorder_rejects_other_queues(self):
+        self.client.login(username="testuser1", password="testing123")
+        pks = self.queue_pks(self.pin1)
+        archived = Job.objects.get(pk=pks[0])
+        archived.active = False
+        archived.save()
+        pks = self.queue_pks(self.pin1)
+
+        bad_orders = [
+            pks[:-1],                               # missing a job
+            pks + [pks[0]],                         # a job twice
+            pks + [self.queue_pks(self.pin2)[0]],   # another machine's job
+            pks + [archived.pk],                    # an archived job
+        ]
+        for jobs in bad_orders:
+            response = self.post(jobs)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.json())
+        self.assertListEqual(self.queue_pks(self.pin1), pks)
+
+    def test_reorder_rejects_bad_body(self):
+        self.client.login(username="testuser1", password="testing123")
+        for body in ['', '{}', '{"jobs": 3}', '{"jobs": ["a"]}']:
+            response = self.client.post(self.url, body,
+                                        content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+
+    def test_unknown_machine(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(
+            reverse('list:machine-reorder', kwargs={'pk': 999}),
+            json.dumps({'jobs': []}), content_type='application/json')
+        self.assertEqual(response.status_code, 404)
+
+
+class TestBoardApi(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        self.starvision = Machine.objects.create(name="Starvision")
+
+        self.p1 = Profile.objects.get(user=self.u1)
+        self.p1.machines.set([self.pin1, self.pin2])
+
+        self.c1 = Customer.objects.create(name="Custy 1")
+        self.c2 = Customer.objects.create(name="ABC Co.")
+
+        create_jobs(3, self.pin1, [self.c1, self.c2])
+        create_jobs(2, self.pin2, [self.c1, self.c2])
+        create_jobs(2, self.starvision, [self.c1, self.c2])
+
+        self.url = reverse('list:board-api')
+
+    def test_redirect_if_not_logged_in(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, '/accounts/login/?next=' + self.url)
+
+    def test_board(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        machines = response.json()['machines']
+        self.assertListEqual([machine['name'] for machine in machines],
+                             ["Pinnacle 1", "Pinnacle 2"])
+        self.pin1.refresh_from_db()
+        self.assertEqual(machines[0]['version'], self.pin1.queue_version)
+        jobs = machines[0]['jobs']
+        first = self.pin1.active_jobs().order_by('order').first()
+        self.assertEqual(len(jobs), 3)
+        self.assertDictEqual(jobs[0], {
+            'id': first.pk,
+            'position': 1,
+            'job_number': first.job_number,
+            'description': first.description,
+            'customer': first.customer.name,
+            'add_tools': first.add_tools,
+            'setup_sheets': "No",
+        })
+        self.assertListEqual([job['position'] for job in jobs], [1, 2, 3])
+
+    def test_not_modified(self):
+        self.client.login(username="testuser1", password="testing123")
+        etag = self.client.get(self.url)['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([query for query in queries
+                          if 'list_job' in query['sql']])
+
+    def test_change_updates_etag(self):
+        self.client.login(username="testuser1", password="testing123")
+        etag = self.client.get(self.url)['ETag']
+
+        # a machine that isn't on the board doesn't change it
+        job = self.starvision.active_jobs().first()
+        job.description = "changed"
+        job.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        job = self.pin2.active_jobs().first()
+        job.description = "changed"
+        job.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['machines'][1]['jobs'][0]
+                         ['description'], "changed")
+
+
+class TestBulkJobViews(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='testuser1',
+                                           password="testing123")
+        self.pin1 = Machine.objects.create(name="Pinnacle 1")
+        self.pin2 = Machine.objects.create(name="Pinnacle 2")
+        Profile.objects.get(user=self.u1).machines.set([self.pin1, self.pin2])
+        self.c1 = Customer.objects.create(name="Custy 1")
+        create_jobs(3, self.pin1, [self.c1])
+        create_jobs(2, self.pin2, [self.c1])
+        self.pks = list(Job.objects.filter(machine=self.pin1)
+                        .order_by('order').values_list('pk', flat=True))
+
+    def test_redirect_if_not_logged_in(self):
+        url = reverse('list:jobs-archive')
+        response = self.client.post(url, {'jobs': self.pks})
+        self.assertRedirects(response, '/accounts/login/?next=' + url)
+        self.assertEqual(Job.objects.filter(active=True).count(), 5)
+
+    def test_archive(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(reverse('list:jobs-archive'),
+                                    {'jobs': self.pks[:2]})
+
+        self.assertRedirects(response, reverse('list:priority-list'))
+        self.assertListEqual(
+            list(self.pin1.active_jobs().values_list('pk', flat=True)),
+            self.pks[2:])
+
+    def test_move(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(reverse('list:jobs-move'),
+                                    {'jobs': self.pks[:2],
+                                     'machine': self.pin2.pk})
+
+        self.assertRedirects(response, reverse('list:priority-list'))
+        self.assertEqual(self.pin2.active_jobs().count(), 4)
+        self.assertEqual(self.pin1.active_jobs().count(), 1)
+
+    def test_bad_requests(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.post(reverse('list:jobs-archive'),
+                                    {'jobs': ['x']})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(reverse('list:jobs-move'),
+                                    {'jobs': self.pks, 'machine': 999})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(reverse('list:jobs-archive'))
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Job.objects.filter(active=True).count(), 5)
+
+    def test_checkboxes(self):
+        self.client.login(username="testuser1", password="testing123")
+        response = self.client.get(reverse('list:priority-list'))
+        self.assertContains(response, 'form="bulk-jobs-form"', count=5)
+        self.assertContains(response, 'id="bulk-jobs-form"')
+
+
 class TestProfileView(TestCase):
     def setUp(self):
         self.u1 = User.objects.create_user(username='testuser1',
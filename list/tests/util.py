@@ -14,4 +14,14 @@ def create_jobs(num_jobs, machine, customers):
             customer=rand_customer,
             add_tools=rand_tools,
             description=f"{machine.name} job {i}"
-        )
\ No newline at end of file
+        )
+
+
+class QueueAssertionsMixin:
+    def assertContiguous(self, machine):
+        """
+        the active jobs of the machine are keyed 0, 1, 2, ...
+        """
+        queryset = Job.objects.filter(active=True, machine=machine)
+        order_list = [job.order for job in queryset]
+        self.assertListEqual(order_list, list(range(queryset.count())))
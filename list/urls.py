@@ -7,15 +7,31 @@ app_name = "list"
 urlpatterns = [
     path('', views.PriorityListView.as_view(), name='priority-list'),
     path('job/add/<int:machine_pk>/', views.JobCreate.as_view(), name='add'),
+    path('job/add/form/<int:machine_pk>/', views.job_add_form,
+         name='add-form'),
+    path('job/import/', views.JobImport.as_view(), name='import'),
     path('job/<int:pk>/', views.JobDetail.as_view(), name='job-detail'),
     path('job/edit/<int:pk>/', views.JobUpdate.as_view(), name='edit'),
     path('search/', views.JobSearch.as_view(), name='search'),
+    path('search/export/', views.JobSearchExport.as_view(),
+         name='search-export'),
     path('job/sort_up/<int:pk>/', views.job_sort_up, name='sort_up'),
     path('job/sort_down/<int:pk>/', views.job_sort_down, name='sort_down'),
     path('job/to/<int:pk>/<int:to>/', views.job_to, name='job_to'),
     path('job/archive/<int:pk>/', views.job_archive, name='archive'),
+    path('jobs/archive/', views.jobs_archive, name='jobs-archive'),
+    path('jobs/move/', views.jobs_move, name='jobs-move'),
+    path('machine/reorder/<int:pk>/', views.machine_reorder,
+         name='machine-reorder'),
+    path('machine/table/<int:pk>/', views.machine_table,
+         name='machine-table'),
+    path('api/board/', views.board_api, name='board-api'),
+    path('api/board/events/', views.board_events, name='board-events'),
     path('archive/', views.ArchiveView.as_view(), name='archive-view'),
+    path('archive/export/', views.ArchiveExport.as_view(),
+         name='archive-export'),
     path('customer/add/', views.CustomerCreate.as_view(), name='add_customer'),
+    path('customer/search/', views.customer_search, name='customer-search'),
     path('profile/<int:pk>/', views.ProfileView.as_view(), name='profile'),
     path('profile/edit/<int:pk>/', views.ProfileEditView.as_view(), name='profile-edit'),
 ]
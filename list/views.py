@@ -1,16 +1,28 @@
+import hashlib
+import json
+
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import UserPassesTestMixin, LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import HttpResponseRedirect
-from django.shortcuts import redirect, reverse, get_object_or_404
+from django.core.paginator import InvalidPage
+from django.db import IntegrityError, transaction
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseRedirect, JsonResponse, \
+    StreamingHttpResponse
+from django.shortcuts import redirect, render, reverse, get_object_or_404
 from django.urls import reverse_lazy
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 from django.views.generic import DetailView
-from django.views.generic.edit import CreateView, UpdateView
+from django.views.generic.edit import CreateView, FormView, UpdateView
 from django.views.generic.list import ListView
 
-from list.forms import CustomerForm, JobForm, ProfileForm, JobSearchForm
-from list.models import Customer, Job, Machine, Profile
+from list import events, export, queue, search
+from list.cache import attach_machine_tables, render_machine_tables, search_customers
+from list.forms import CustomerForm, JobForm, JobImportForm, ProfileForm, JobSearchForm
+from list.importer import ImportFileError, JobImporter, read_rows
+from list.models import Customer, Job, Machine, Profile, prefetch_active_jobs
+from list.pagination import KeysetPaginator
 
 
 # Create your views here.
@@ -26,8 +38,17 @@ class PriorityListView(LoginRequiredMixin, ListView):
         user = get_object_or_404(User, id=self.request.user.id)
         profile = get_object_or_404(Profile, user=user)
 
-        context['machines'] = profile.machines.all()
-        context['customers'] = Customer.objects.all().order_by("name")
+        context['machines'] = attach_machine_tables(profile.machines.all())
+        # the live updates start from the versions the tables were shown at
+        context['board_versions'] = events.format_versions(
+            {machine.pk: machine.queue_version for machine in context['machines']})
+        context['board_events'] = events.events_enabled()
+        context['board_poll_interval'] = getattr(
+            settings, 'BOARD_POLL_INTERVAL', 15)
+        # where ticked jobs can be moved to
+        context['all_machines'] = Machine.objects.all()
+        # not rendered, the add job form is loaded into its modal by
+        # job_add_form
         context['form'] = JobForm(auto_id="", initial={'setup_sheets': 'N'})
         context['customer_form'] = CustomerForm()
         context['debug'] = settings.DEBUG
@@ -43,23 +64,53 @@ class JobCreate(LoginRequiredMixin, CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['machines'] = Machine.objects.all()
-        context['customers'] = Customer.objects.all()
-        if self.request.method == "POST":
-            if kwargs['form'].is_bound:
-                context['active_machine'] = self.kwargs['machine_pk']
-                context['active_machine_form'] = context['form']
-                context['form'] = JobForm
-            else:
-                context['active_machine'] = None
+        context['machines'] = attach_machine_tables(Machine.objects.all())
+        context['all_machines'] = context['machines']
+        # the page opens with the modal showing the form, and its errors
+        context['active_machine'] = get_object_or_404(
+            Machine, pk=self.kwargs['machine_pk'])
+        context['customer_form'] = CustomerForm()
 
         return context
 
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['auto_id'] = ""
+        return kwargs
+
     def form_valid(self, form):
         form.instance.machine = Machine.objects.get(
             pk=self.kwargs['machine_pk'])
-        form.save()
-        return super().form_valid(form)
+        self.object = queue.save_job(form.save(commit=False))
+        return HttpResponseRedirect(self.get_success_url())
+
+
+@login_required()
+def job_add_form(request, machine_pk):
+    """
+    the add job form of a machine, loaded into the shared modal of the
+    priority list the first time it's opened. the modal then only points
+    the form at the machine of whichever add job button was pressed.
+    """
+    machine = get_object_or_404(Machine, pk=machine_pk)
+    form = JobForm(auto_id="", initial={'setup_sheets': 'N'})
+    return render(request, "list/job_form.html", {
+        'form': form,
+        'machine': machine,
+    })
+
+
+@login_required()
+def customer_search(request):
+    """
+    the customers matching what's been typed in a customer field, for the
+    customer selects of the job forms, see cache.search_customers
+    """
+    matches = search_customers(request.GET.get('q', ''))
+    return JsonResponse({
+        'customers': [{'id': pk, 'name': name.title()}
+                      for pk, name in matches],
+    })
 
 
 class JobDetail(LoginRequiredMixin, DetailView):
@@ -73,11 +124,14 @@ class JobUpdate(LoginRequiredMixin, UpdateView):
     success_url = reverse_lazy("list:priority-list")
     template_name_suffix = "_update_form"
 
+    def form_valid(self, form):
+        self.object = queue.save_job(form.save(commit=False))
+        return HttpResponseRedirect(self.get_success_url())
+
     def get_context_data(self, **kwargs):
         job = self.object
         context = super().get_context_data(**kwargs)
         context['machines'] = Machine.objects.all()
-        context['customers'] = Customer.objects.all().order_by("name")
         context['job_form'] = JobForm({'add_tools': job.add_tools,
                                        'job_number': job.job_number,
                                        'description': job.description,
@@ -130,9 +184,13 @@ class JobSearch(LoginRequiredMixin, ListView):
             date_added = data.pop('date_added', None)
             due_date = data.pop('due_date', None)
 
-            qs = Job.objects.filter(**data)
+            qs = Job.objects.filter(**data).select_related('customer',
+                                                           'machine')
+            ordering = ['date_added']
             if description is not None:
-                qs = qs.filter(description__contains=description)
+                # matches the description, job number and customer name
+                qs = search.search_jobs(qs, description)
+                ordering.insert(0, 'search_rank')
             if datetime_completed is not None:
                 if datetime_completed_lte:
                     qs = qs.filter(datetime_completed__lte=datetime_completed)
@@ -154,7 +212,7 @@ class JobSearch(LoginRequiredMixin, ListView):
                     qs = qs.filter(due_date__gte=due_date)
                 else:
                     qs = qs.filter(due_date__date=due_date)
-            return qs.order_by('date_added')
+            return qs.order_by(*ordering)
         return super().get_queryset()
 
 
@@ -163,6 +221,10 @@ class ArchiveView(LoginRequiredMixin, ListView):
     template_name = "list/archive.html"
     context_object_name = "jobs"
     paginate_by = 10
+    ordering = ("-datetime_completed", "-id")
+    # counting every archived job gets slower as the archive grows, pages
+    # are linked with next/previous cursors unless this is turned on
+    exact_count = False
 
     def get_queryset(self):
         user = get_object_or_404(User, id=self.request.user.id)
@@ -171,7 +233,46 @@ class ArchiveView(LoginRequiredMixin, ListView):
         return Job.objects.all() \
             .filter(active=False) \
             .filter(machine__in=profile.machines.all()) \
-            .order_by("-datetime_completed")
+            .select_related("customer", "machine") \
+            .order_by(*self.ordering)
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.page_kwarg in self.request.GET:
+            # numbered ?page= links still work, with OFFSET paging
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size, self.ordering,
+                                    count=self.exact_count)
+        try:
+            page = paginator.page(after=self.request.GET.get('after'),
+                                  before=self.request.GET.get('before'))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['keyset'] = isinstance(context['paginator'], KeysetPaginator)
+        return context
+
+
+class CsvExportMixin:
+    """
+    answer with every job of the view's queryset as a streamed csv file,
+    rather than a page of them
+    """
+    export_filename = "jobs.csv"
+
+    def get(self, request, *args, **kwargs):
+        return export.csv_response(self.get_queryset(), self.export_filename)
+
+
+class JobSearchExport(CsvExportMixin, JobSearch):
+    export_filename = "job-search.csv"
+
+
+class ArchiveExport(CsvExportMixin, ArchiveView):
+    export_filename = "job-archive.csv"
 
 
 class CustomerCreate(LoginRequiredMixin, CreateView):
@@ -180,12 +281,44 @@ class CustomerCreate(LoginRequiredMixin, CreateView):
     form_class = CustomerForm
     success_url = 'list/index.html'
 
+    def form_valid(self, form):
+        # another request can add the same customer between the form's
+        # unique check and the INSERT
+        try:
+            with transaction.atomic():
+                return super().form_valid(form)
+        except IntegrityError:
+            form.add_error('name', form.fields['name'].error_messages['unique'])
+            return self.form_invalid(form)
+
+
+class JobImport(LoginRequiredMixin, FormView):
+    """
+    add the jobs of a spreadsheet exported from the ERP, see list.importer.
+    the page is shown again with the number of jobs added and the rows that
+    were skipped.
+    """
+    template_name = "list/job_import.html"
+    form_class = JobImportForm
+
+    def form_valid(self, form):
+        upload = form.cleaned_data['file']
+        importer = JobImporter(
+            create_customers=form.cleaned_data['create_customers'])
+        try:
+            report = importer.run(read_rows(upload.file, upload.name))
+        except ImportFileError as e:
+            form.add_error('file', str(e))
+            return self.form_invalid(form)
+        return self.render_to_response(
+            self.get_context_data(form=self.form_class(), report=report))
+
 
 @login_required()
 def job_sort_up(request, pk):
     job = get_object_or_404(Job, pk=pk)
 
-    job.up()
+    queue.move_up(job)
 
     return HttpResponseRedirect(reverse("list:priority-list"))
 
@@ -194,7 +327,7 @@ def job_sort_up(request, pk):
 def job_sort_down(request, pk):
     job = get_object_or_404(Job, pk=pk)
 
-    job.down()
+    queue.move_down(job)
 
     return HttpResponseRedirect(reverse("list:priority-list"))
 
@@ -203,7 +336,7 @@ def job_sort_down(request, pk):
 def job_to(request, pk, to):
     job = get_object_or_404(Job, pk=pk)
 
-    job.to(to)
+    queue.move_to(job, to)
 
     return HttpResponseRedirect(reverse("list:priority-list"))
 
@@ -212,12 +345,147 @@ def job_to(request, pk, to):
 def job_archive(request, pk):
     job = get_object_or_404(Job, pk=pk)
 
-    job.active = False
-    job.save()
+    queue.archive(job)
+
+    return redirect(reverse("list:priority-list"))
+
+
+def selected_job_ids(request):
+    """
+    the jobs ticked on the priority list
+    :return: list of job pks, or None if they can't be read
+    """
+    try:
+        return [int(pk) for pk in request.POST.getlist('jobs')]
+    except ValueError:
+        return None
+
+
+@login_required()
+@require_POST
+def jobs_archive(request):
+    job_ids = selected_job_ids(request)
+    if job_ids is None:
+        return HttpResponseBadRequest("Expected a list of job ids.")
+
+    queue.archive_jobs(job_ids)
 
     return redirect(reverse("list:priority-list"))
 
 
+@login_required()
+@require_POST
+def jobs_move(request):
+    job_ids = selected_job_ids(request)
+    if job_ids is None:
+        return HttpResponseBadRequest("Expected a list of job ids.")
+    machine = get_object_or_404(Machine, pk=request.POST.get('machine') or 0)
+
+    queue.move_jobs(job_ids, machine.pk)
+
+    return redirect(reverse("list:priority-list"))
+
+
+@login_required()
+@require_POST
+def machine_reorder(request, pk):
+    """
+    set the whole queue of a machine at once. the body is json with the
+    machine's active job pks in their new order, e.g. {"jobs": [3, 1, 2]}.
+    responds with the saved order, or a 400 with an error message.
+    """
+    machine = get_object_or_404(Machine, pk=pk)
+
+    try:
+        job_ids = [int(job_id) for job_id in json.loads(request.body)['jobs']]
+    except (KeyError, TypeError, ValueError):
+        return JsonResponse({'error': "Expected a list of job ids."},
+                            status=400)
+
+    try:
+        job_ids = queue.reorder(machine.pk, job_ids)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    return JsonResponse({'machine': machine.pk, 'jobs': job_ids})
+
+
+def board_machines(request):
+    return Machine.objects.filter(profile__user=request.user)
+
+
+def board_etag(request):
+    # every change to a job table bumps its machine's queue_version, so the
+    # versions alone tell whether the board changed
+    versions = list(board_machines(request).values_list('pk', 'queue_version'))
+    return hashlib.sha1(json.dumps(versions).encode()).hexdigest()
+
+
+@login_required()
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=board_etag)
+def board_api(request):
+    """
+    the active queue of each of the user's machines as json, for the wall
+    displays. they poll with If-None-Match, and an unchanged board is
+    answered with a 304 from the machines' queue versions alone.
+    """
+    machines = board_machines(request).prefetch_related(prefetch_active_jobs())
+    return JsonResponse({'machines': [
+        {
+            'id': machine.pk,
+            'name': machine.name,
+            'version': machine.queue_version,
+            'jobs': [
+                {
+                    'id': job.pk,
+                    'position': position,
+                    'job_number': job.job_number,
+                    'description': job.description,
+                    'customer': job.customer.name,
+                    'add_tools': job.add_tools,
+                    'setup_sheets': job.get_setup_sheets_display(),
+                }
+                for position, job in enumerate(machine.active_job_list, 1)
+            ],
+        }
+        for machine in machines
+    ]})
+
+
+@login_required()
+def board_events(request):
+    """
+    server-sent events telling a board which of its machines' job tables
+    changed, see events.board_stream. the board then fetches just those
+    tables with machine_table. only served with BOARD_EVENTS_ENABLED, the
+    boards poll board_api otherwise.
+    """
+    if not events.events_enabled():
+        raise Http404("Board events are turned off.")
+    machine_ids = list(board_machines(request).values_list('pk', flat=True))
+    # a reconnecting client sends the versions it had got to
+    versions = events.parse_versions(
+        request.META.get('HTTP_LAST_EVENT_ID') or request.GET.get('v', ''))
+    response = StreamingHttpResponse(events.board_stream(machine_ids, versions),
+                                     content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx would otherwise hold the events back in its buffer
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required()
+def machine_table(request, pk):
+    """
+    the job table of one machine, for a board to swap in when it changes
+    """
+    machine = get_object_or_404(Machine, pk=pk)
+    response = HttpResponse(render_machine_tables([machine])[machine.pk])
+    response['X-Queue-Version'] = machine.queue_version
+    return response
+
+
 # class JobDelete(DeleteView):
 #     model = Job
 #     fields = ['job_number', 'description', 'customer']
@@ -151,6 +151,17 @@ STATICFILES_STORAGE = 'priority_list.storage.WhiteNoiseStaticFilesStorage'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
 
+# How jobs are ordered within a machine's queue. 'dense' keeps the orders
+# 0, 1, 2, ...; 'sparse' leaves gaps of JOB_ORDER_GAP between them so a move
+# only rewrites the moved job. Run `manage.py rebalance_job_order` after
+# switching.
+JOB_ORDERING = 'dense'
+JOB_ORDER_GAP = 1024
+
+# Public holidays shown on the vacation calendar, a name from
+# vacation.holidays.CALENDARS or the dotted path of a workalendar class.
+HOLIDAY_CALENDAR = 'ontario'
+
 EMAIL_BACKEND = 'utils.mailgun_backend.MailgunBackend'
 MAILGUN_API_KEY = os.environ.get("MAILGUN_API_KEY")
 MAILGUN_API_URL = "https://api.mailgun.net/v3/sandboxc3caeaf85ca14955bc3d4a1c3935c1f0.mailgun.org/messages"
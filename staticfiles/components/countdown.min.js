@@ -0,0 +1,3 @@
+/*! UIkit 3.1.4 | http://www.getuikit.com | (c) 2014 - 2018 YOOtheme | MIT License */
+
+!function(t,n){"object"==typeof exports&&"undefined"!=typeof module?module.exports=n(require("uikit-util")):"function"==typeof define&&define.amd?define("uikitcountdown",["uikit-util"],n):(t=t||self).UIkitCountdown=n(t.UIkit.util)}(this,function(s){"use strict";var t={mixins:[{connected:function(){!s.hasClass(this.$el,this.$name)&&s.addClass(this.$el,this.$name)}}],props:{date:String,clsWrapper:String},data:{date:"",clsWrapper:".uk-countdown-%unit%"},computed:{date:function(t){var n=t.date;return Date.parse(n)},days:function(t,n){var e=t.clsWrapper;return s.$(e.replace("%unit%","days"),n)},hours:function(t,n){var e=t.clsWrapper;return s.$(e.replace("%unit%","hours"),n)},minutes:function(t,n){var e=t.clsWrapper;return s.$(e.replace("%unit%","minutes"),n)},seconds:function(t,n){var e=t.clsWrapper;return s.$(e.replace("%unit%","seconds"),n)},units:function(){var n=this;return["days","hours","minutes","seconds"].filter(function(t){return n[t]})}},connected:function(){this.start()},disconnected:function(){var n=this;this.stop(),this.units.forEach(function(t){return s.empty(n[t])})},events:[{name:"visibilitychange",el:document,handler:function(){document.hidden?this.stop():this.start()}}],update:{write:function(){var i=this,r=function(t){var n=t-Date.now();return{total:n,seconds:n/1e3%60,minutes:n/1e3/60%60,hours:n/1e3/60/60%24,days:n/1e3/60/60/24}}(this.date);r.total<=0&&(this.stop(),r.days=r.hours=r.minutes=r.seconds=0),this.units.forEach(function(t){var n=String(Math.floor(r[t]));n=n.length<2?"0"+n:n;var e=i[t];e.textContent!==n&&((n=n.split("")).length!==e.children.length&&s.html(e,n.map(function(){return"<span></span>"}).join("")),n.forEach(function(t,n){return e.children[n].textContent=t}))})}},methods:{start:function(){var t=this;this.stop(),this.date&&this.units.length&&(this.$emit(),this.timer=setInterval(function(){return t.$emit()},1e3))},stop:function(){this.timer&&(clearInterval(this.timer),this.timer=null)}}};return"undefined"!=typeof window&&window.UIkit&&window.UIkit.component("countdown",t),t});
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! UIkit 3.1.4 | http://www.getuikit.com | (c) 2014 - 2018 YOOtheme | MIT License */
+
+!function(t,e){"object"==typeof exports&&"undefined"!=typeof module?module.exports=e(require("uikit-util")):"function"==typeof define&&define.amd?define("uikitlightbox_panel",["uikit-util"],e):(t=t||self).UIkitLightbox_panel=e(t.UIkit.util)}(this,function(f){"use strict";var t={slide:{show:function(t){return[{transform:i(-100*t)},{transform:i()}]},percent:function(t){return function(t){return Math.abs(f.css(t,"transform").split(",")[4]/t.offsetWidth)||0}(t)},translate:function(t,e){return[{transform:i(-100*e*t)},{transform:i(100*e*(1-t))}]}}};function i(t,e){return void 0===t&&(t=0),void 0===e&&(e="%"),"translateX("+t+(t?e:"")+")"}function e(t){return"scale3d("+t+", "+t+", 1)"}var n,s,o=f.assign({},t,{fade:{show:function(){return[{opacity:0},{opacity:1}]},percent:function(t){return 1-f.css(t,"opacity")},translate:function(t){return[{opacity:1-t},{opacity:t}]}},scale:{show:function(){return[{opacity:0,transform:e(.8)},{opacity:1,transform:e(1)}]},percent:function(t){return 1-f.css(t,"opacity")},translate:function(t){return[{opacity:1-t,transform:e(1-.2*t)},{opacity:t,transform:e(.8+.2*t)}]}}}),r={props:{container:Boolean},data:{container:!0},computed:{container:function(t){var e=t.container;return!0===e&&this.$container||e&&f.$(e)}}},a={props:{cls:Boolean,animation:"list",duration:Number,origin:String,transition:String,queued:Boolean},data:{cls:!1,animation:[!1],duration:200,origin:!1,transition:"linear",queued:!1,initProps:{overflow:"",height:"",paddingTop:"",paddingBottom:"",marginTop:"",marginBottom:""},hideProps:{overflow:"hidden",height:0,paddingTop:0,paddingBottom:0,marginTop:0,marginBottom:0}},computed:{hasAnimation:function(t){return!!t.animation[0]},hasTransition:function(t){var e=t.animation;return this.hasAnimation&&!0===e[0]}},methods:{toggleElement:function(l,u,d){var c=this;return new f.Promise(function(t){l=f.toNodes(l);function e(t){return f.Promise.all(t.map(function(t){return c._toggleElement(t,u,d)}))}var i,n=l.filter(function(t){return c.isToggled(t)}),s=l.filter(function(t){return!f.includes(n,t)});if(c.queued&&f.isUndefined(d)&&f.isUndefined(u)&&c.hasAnimation&&!(l.length<2)){var o=document.body,r=o.scrollTop,a=n[0],h=f.Animation.inProgress(a)&&f.hasClass(a,"uk-animation-leave")||f.Transition.inProgress(a)&&"0px"===a.style.height;i=e(n),h||(i=i.then(function(){var t=e(s);return o.scrollTop=r,t}))}else i=e(s.concat(n));i.then(t,f.noop)})},toggleNow:function(e,i){var n=this;return new f.Promise(function(t){return f.Promise.all(f.toNodes(e).map(function(t){return n._toggleElement(t,i,!1)})).then(t,f.noop)})},isToggled:function(t){var e=f.toNodes(t||this.$el);return this.cls?f.hasClass(e,this.cls.split(" ")[0]):!f.hasAttr(e,"hidden")},updateAria:function(t){!1===this.cls&&f.attr(t,"aria-hidden",!this.isToggled(t))},_toggleElement:function(t,e,i){var n=this;if(e=f.isBoolean(e)?e:f.Animation.inProgress(t)?f.hasClass(t,"uk-animation-leave"):f.Transition.inProgress(t)?"0px"===t.style.height:!this.isToggled(t),!f.trigger(t,"before"+(e?"show":"hide"),[this]))return f.Promise.reject();var s=(f.isFunction(i)?i:!1!==i&&this.hasAnimation?this.hasTransition?function(t){var r=t.isToggled,a=t.duration,h=t.initProps,l=t.hideProps,u=t.transition,d=t._toggle;return function(t,e){var i=f.Transition.inProgress(t),n=t.hasChildNodes?f.toFloat(f.css(t.firstElementChild,"marginTop"))+f.toFloat(f.css(t.lastElementChild,"marginBottom")):0,s=f.isVisible(t)?f.height(t)+(i?0:n):0;f.Transition.cancel(t),r(t)||d(t,!0),f.height(t,""),f.fastdom.flush();var o=f.height(t)+(i?0:n);return f.height(t,s),(e?f.Transition.start(t,f.assign({},h,{overflow:"hidden",height:o}),Math.round(a*(1-s/o)),u):f.Transition.start(t,l,Math.round(a*(s/o)),u).then(function(){return d(t,!1)})).then(function(){return f.css(t,h)})}}(this):function(t){var i=t.animation,n=t.duration,s=t.origin,o=t._toggle;return function(t,e){return f.Animation.cancel(t),e?(o(t,!0),f.Animation.in(t,i[0],n,s)):f.Animation.out(t,i[1]||i[0],n,s).then(function(){return o(t,!1)})}}(this):this._toggle)(t,e);f.trigger(t,e?"show":"hide",[this]);function o(){f.trigger(t,e?"shown":"hidden",[n]),n.$update(t)}return s?s.then(o):f.Promise.resolve(o())},_toggle:function(t,e){var i;t&&(e=Boolean(e),this.cls?(i=f.includes(this.cls," ")||e!==f.hasClass(t,this.cls))&&f.toggleClass(t,this.cls,f.includes(this.cls," ")?void 0:e):(i=e===f.hasAttr(t,"hidden"))&&f.attr(t,"hidden",e?null:""),f.$$("[autofocus]",t).some(function(t){return f.isVisible(t)?t.focus()||!0:t.blur()}),this.updateAria(t),i&&this.$update(t))}}};function h(t){var s=t.transitionElement,o=t._toggle;return function(i,n){return new f.Promise(function(t,e){return f.once(i,"show hide",function(){i._reject&&i._reject(),i._reject=e,o(i,n),f.toMs(f.css(s,"transitionDuration"))?f.once(s,"transitionend",t,!1,function(t){return t.target===s}):t()})})}}function d(t,e,i){f.trigger(t,f.createEvent(e,!1,!1,i))}var l={mixins:[r,{mixins:[{connected:function(){!f.hasClass(this.$el,this.$name)&&f.addClass(this.$el,this.$name)}},r,a],props:{selPanel:String,selClose:String,escClose:Boolean,bgClose:Boolean,stack:Boolean},data:{cls:"uk-open",escClose:!0,bgClose:!0,overlay:!0,stack:!1},computed:{panel:function(t,e){var i=t.selPanel;return f.$(i,e)},transitionElement:function(){return this.panel},bgClose:function(t){return t.bgClose&&this.panel}},beforeDisconnect:function(){this.isToggled()&&this.toggleNow(this.$el,!1)},events:[{name:"click",delegate:function(){return this.selClose},handler:function(t){t.preventDefault(),this.hide()}},{name:"toggle",self:!0,handler:function(t){t.defaultPrevented||(t.preventDefault(),this.toggle())}},{name:"beforeshow",self:!0,handler:function(t){var i=n&&n!==this&&n;n=this,i?this.stack?this.prev=i:((n=i).isToggled()?i.hide().then(this.show):f.once(i.$el,"beforeshow hidden",this.show,!1,function(t){var e=t.target;return"hidden"===t.type&&e===i.$el}),t.preventDefault()):function(){if(s)return;s=[f.on(document,f.pointerUp,function(t){var e=t.target,i=t.defaultPrevented;!n||!n.bgClose||i||n.overlay&&!f.within(e,n.$el)||f.within(e,n.panel)||n.hide()}),f.on(document,"keydown",function(t){27===t.keyCode&&n&&n.escClose&&(t.preventDefault(),n.hide())})]}()}},{name:"show",self:!0,handler:function(){f.hasClass(document.documentElement,this.clsPage)||(this.scrollbarWidth=f.width(window)-f.width(document),f.css(document.body,"overflowY",this.scrollbarWidth&&this.overlay?"scroll":"")),f.addClass(document.documentElement,this.clsPage)}},{name:"hide",self:!0,handler:function(){n&&(n!==this||this.prev)||(s&&s.forEach(function(t){return t()}),s=null)}},{name:"hidden",self:!0,handler:function(){var t,e=this.prev;if(n=n&&n!==this&&n||e)for(;e;){if(e.clsPage===this.clsPage){t=!0;break}e=e.prev}else f.css(document.body,"overflowY","");t||f.removeClass(document.documentElement,this.clsPage)}}],methods:{toggle:function(){return this.isToggled()?this.hide():this.show()},show:function(){var e=this;return this.isToggled()?f.Promise.resolve():this.container&&this.$el.parentNode!==this.container?(f.append(this.container,this.$el),new f.Promise(function(t){return requestAnimationFrame(function(){return e.show().then(t)})})):this.toggleElement(this.$el,!0,h(this))},hide:function(){return this.isToggled()?this.toggleElement(this.$el,!1,h(this)):f.Promise.resolve()},getActive:function(){return n}}},a,{mixins:[{mixins:[{props:{autoplay:Boolean,autoplayInterval:Number,pauseOnHover:Boolean},data:{autoplay:!1,autoplayInterval:7e3,pauseOnHover:!0},connected:function(){this.autoplay&&this.startAutoplay()},disconnected:function(){this.stopAutoplay()},update:function(){f.attr(this.slides,"tabindex","-1")},events:[{name:"visibilitychange",el:document,filter:function(){return this.autoplay},handler:function(){document.hidden?this.stopAutoplay():this.startAutoplay()}},{name:"mouseenter",filter:function(){return this.autoplay&&this.pauseOnHover},handler:function(){this.isHovering=!0}},{name:"mouseleave",filter:function(){return this.autoplay&&this.pauseOnHover},handler:function(){this.isHovering=!1}}],methods:{startAutoplay:function(){var t=this;this.stopAutoplay(),this.interval=setInterval(function(){return!f.within(document.activeElement,t.$el)&&!t.isHovering&&!t.stack.length&&t.show("next")},this.autoplayInterval)},stopAutoplay:function(){this.interval&&clearInterval(this.interval)}}},{props:{draggable:Boolean},data:{draggable:!0,threshold:10},created:function(){var n=this;["start","move","end"].forEach(function(t){var i=n[t];n[t]=function(t){var e=f.getEventPos(t).x*(f.isRtl?-1:1);n.prevPos=e!==n.pos?n.pos:n.prevPos,n.pos=e,i(t)}})},events:[{name:f.pointerDown,delegate:function(){return this.selSlides},handler:function(t){!this.draggable||!f.isTouch(t)&&function(t){return!t.children.length&&t.childNodes.length}(t.target)||0<t.button||this.length<2||this.start(t)}},{name:"touchmove",passive:!1,handler:"move",delegate:function(){return this.selSlides}},{name:"dragstart",handler:function(t){t.preventDefault()}}],methods:{start:function(){var t=this;this.drag=this.pos,this._transitioner?(this.percent=this._transitioner.percent(),this.drag+=this._transitioner.getDistance()*this.percent*this.dir,this._transitioner.cancel(),this._transitioner.translate(this.percent),this.dragging=!0,this.stack=[]):this.prevIndex=this.index;var e="touchmove"!==f.pointerMove?f.on(document,f.pointerMove,this.move,{passive:!1}):f.noop;this.unbindMove=function(){e(),t.unbindMove=null},f.on(window,"scroll",this.unbindMove),f.on(document,f.pointerUp,this.end,!0),f.css(this.list,"userSelect","none")},move:function(t){var e=this;if(this.unbindMove){var i=this.pos-this.drag;if(!(0==i||this.prevPos===this.pos||!this.dragging&&Math.abs(i)<this.threshold)){f.css(this.list,"pointerEvents","none"),t.cancelable&&t.preventDefault(),this.dragging=!0,this.dir=i<0?1:-1;for(var n=this.slides,s=this.prevIndex,o=Math.abs(i),r=this.getIndex(s+this.dir,s),a=this._getDistance(s,r)||n[s].offsetWidth;r!==s&&a<o;)this.drag-=a*this.dir,s=r,o-=a,r=this.getIndex(s+this.dir,s),a=this._getDistance(s,r)||n[s].offsetWidth;this.percent=o/a;var h,l=n[s],u=n[r],d=this.index!==r,c=s===r;[this.index,this.prevIndex].filter(function(t){return!f.includes([r,s],t)}).forEach(function(t){f.trigger(n[t],"itemhidden",[e]),c&&(h=!0,e.prevIndex=s)}),(this.index===s&&this.prevIndex!==s||h)&&f.trigger(n[this.index],"itemshown",[this]),d&&(this.prevIndex=s,this.index=r,!c&&f.trigger(l,"beforeitemhide",[this]),f.trigger(u,"beforeitemshow",[this])),this._transitioner=this._translate(Math.abs(this.percent),l,!c&&u),d&&(!c&&f.trigger(l,"itemhide",[this]),f.trigger(u,"itemshow",[this]))}}},end:function(){if(f.off(window,"scroll",this.unbindMove),this.unbindMove&&this.unbindMove(),f.off(document,f.pointerUp,this.end,!0),this.dragging)if(this.dragging=null,this.index===this.prevIndex)this.percent=1-this.percent,this.dir*=-1,this._show(!1,this.index,!0),this._transitioner=null;else{var t=(f.isRtl?this.dir*(f.isRtl?1:-1):this.dir)<0==this.prevPos>this.pos;this.index=t?this.index:this.prevIndex,t&&(this.percent=1-this.percent),this.show(0<this.dir&&!t||this.dir<0&&t?"next":"previous",!0)}f.css(this.list,{userSelect:"",pointerEvents:""}),this.drag=this.percent=null}}},{data:{selNav:!1},computed:{nav:function(t,e){var i=t.selNav;return f.$(i,e)},selNavItem:function(t){var e=t.attrItem;return"["+e+"],[data-"+e+"]"},navItems:function(t,e){return f.$$(this.selNavItem,e)}},update:{write:function(){var i=this;this.nav&&this.length!==this.nav.children.length&&f.html(this.nav,this.slides.map(function(t,e){return"<li "+i.attrItem+'="'+e+'"><a href="#"></a></li>'}).join("")),f.toggleClass(f.$$(this.selNavItem,this.$el).concat(this.nav),"uk-hidden",!this.maxIndex),this.updateNav()},events:["resize"]},events:[{name:"click",delegate:function(){return this.selNavItem},handler:function(t){t.preventDefault(),this.show(f.data(t.current,this.attrItem))}},{name:"itemshow",handler:"updateNav"}],methods:{updateNav:function(){var i=this,n=this.getValidIndex();this.navItems.forEach(function(t){var e=f.data(t,i.attrItem);f.toggleClass(t,i.clsActive,f.toNumber(e)===n),f.toggleClass(t,"uk-invisible",i.finite&&("previous"===e&&0===n||"next"===e&&n>=i.maxIndex))})}}}],props:{clsActivated:Boolean,easing:String,index:Number,finite:Boolean,velocity:Number},data:function(){return{easing:"ease",finite:!1,velocity:1,index:0,stack:[],percent:0,clsActive:"uk-active",clsActivated:!1,Transitioner:!1,transitionOptions:{}}},computed:{duration:function(t,e){var i=t.velocity;return function(t){return.5*t+300}(e.offsetWidth/i)},length:function(){return this.slides.length},list:function(t,e){var i=t.selList;return f.$(i,e)},maxIndex:function(){return this.length-1},selSlides:function(t){return t.selList+" > *"},slides:function(){return f.toNodes(this.list.children)}},events:{itemshown:function(){this.$update(this.list)}},methods:{show:function(t,e){var i=this;if(void 0===e&&(e=!1),!this.dragging&&this.length){var n=this.stack,s=e?0:n.length,o=function(){n.splice(s,1),n.length&&i.show(n.shift(),!0)};if(n[e?"unshift":"push"](t),!e&&1<n.length)2===n.length&&this._transitioner.forward(Math.min(this.duration,200));else{var r=this.index,a=f.hasClass(this.slides,this.clsActive)&&this.slides[r],h=this.getIndex(t,this.index),l=this.slides[h];if(a!==l){if(this.dir=function(t,e){return"next"===t?1:"previous"===t?-1:t<e?-1:1}(t,r),this.prevIndex=r,this.index=h,a&&f.trigger(a,"beforeitemhide",[this]),!f.trigger(l,"beforeitemshow",[this,a]))return this.index=this.prevIndex,void o();var u=this._show(a,l,e).then(function(){return a&&f.trigger(a,"itemhidden",[i]),f.trigger(l,"itemshown",[i]),new f.Promise(function(t){f.fastdom.write(function(){n.shift(),n.length?i.show(n.shift(),!0):i._transitioner=null,t()})})});return a&&f.trigger(a,"itemhide",[this]),f.trigger(l,"itemshow",[this]),u}o()}}},getIndex:function(t,e){return void 0===t&&(t=this.index),void 0===e&&(e=this.index),f.clamp(f.getIndex(t,this.slides,e,this.finite),0,this.maxIndex)},getValidIndex:function(t,e){return void 0===t&&(t=this.index),void 0===e&&(e=this.prevIndex),this.getIndex(t,e)},_show:function(t,e,i){if(this._transitioner=this._getTransitioner(t,e,this.dir,f.assign({easing:i?e.offsetWidth<600?"cubic-bezier(0.25, 0.46, 0.45, 0.94)":"cubic-bezier(0.165, 0.84, 0.44, 1)":this.easing},this.transitionOptions)),!i&&!t)return this._transitioner.translate(1),f.Promise.resolve();var n=this.stack.length;return this._transitioner[1<n?"forward":"show"](1<n?Math.min(this.duration,75+75/(n-1)):this.duration,this.percent)},_getDistance:function(t,e){return new this._getTransitioner(t,t!==e&&e).getDistance()},_translate:function(t,e,i){void 0===e&&(e=this.prevIndex),void 0===i&&(i=this.index);var n=this._getTransitioner(e!==i&&e,i);return n.translate(t),n},_getTransitioner:function(t,e,i,n){return void 0===t&&(t=this.prevIndex),void 0===e&&(e=this.index),void 0===i&&(i=this.dir||1),void 0===n&&(n=this.transitionOptions),new this.Transitioner(f.isNumber(t)?this.slides[t]:t,f.isNumber(e)?this.slides[e]:e,i*(f.isRtl?-1:1),n)}}}],props:{animation:String},data:{animation:"slide",clsActivated:"uk-transition-active",Animations:t,Transitioner:function(o,r,a,t){var e=t.animation,h=t.easing,i=e.percent,n=e.translate,s=e.show;void 0===s&&(s=f.noop);var l=s(a),u=new f.Deferred;return{dir:a,show:function(t,e,i){var n=this;void 0===e&&(e=0);var s=i?"linear":h;return t-=Math.round(t*f.clamp(e,-1,1)),this.translate(e),d(r,"itemin",{percent:e,duration:t,timing:s,dir:a}),d(o,"itemout",{percent:1-e,duration:t,timing:s,dir:a}),f.Promise.all([f.Transition.start(r,l[1],t,s),f.Transition.start(o,l[0],t,s)]).then(function(){n.reset(),u.resolve()},f.noop),u.promise},stop:function(){return f.Transition.stop([r,o])},cancel:function(){f.Transition.cancel([r,o])},reset:function(){for(var t in l[0])f.css([r,o],t,"")},forward:function(t,e){return void 0===e&&(e=this.percent()),f.Transition.cancel([r,o]),this.show(t,e,!0)},translate:function(t){this.reset();var e=n(t,a);f.css(r,e[1]),f.css(o,e[0]),d(r,"itemtranslatein",{percent:t,dir:a}),d(o,"itemtranslateout",{percent:1-t,dir:a})},percent:function(){return i(o||r,r,a)},getDistance:function(){return o&&o.offsetWidth}}}},computed:{animation:function(t){var e=t.animation,i=t.Animations;return f.assign(e in i?i[e]:i.slide,{name:e})},transitionOptions:function(){return{animation:this.animation}}},events:{"itemshow itemhide itemshown itemhidden":function(t){var e=t.target;this.$update(e)},itemshow:function(){f.isNumber(this.prevIndex)&&f.fastdom.flush()},beforeitemshow:function(t){var e=t.target;f.addClass(e,this.clsActive)},itemshown:function(t){var e=t.target;f.addClass(e,this.clsActivated)},itemhidden:function(t){var e=t.target;f.removeClass(e,this.clsActive,this.clsActivated)}}}],functional:!0,props:{delayControls:Number,preload:Number,videoAutoplay:Boolean,template:String},data:function(){return{preload:1,videoAutoplay:!1,delayControls:3e3,items:[],cls:"uk-open",clsPage:"uk-lightbox-page",selList:".uk-lightbox-items",attrItem:"uk-lightbox-item",selClose:".uk-close-large",pauseOnHover:!1,velocity:2,Animations:o,template:'<div class="uk-lightbox uk-overflow-hidden"> <ul class="uk-lightbox-items"></ul> <div class="uk-lightbox-toolbar uk-position-top uk-text-right uk-transition-slide-top uk-transition-opaque"> <button class="uk-lightbox-toolbar-icon uk-close-large" type="button" uk-close></button> </div> <a class="uk-lightbox-button uk-position-center-left uk-position-medium uk-transition-fade" href="#" uk-slidenav-previous uk-lightbox-item="previous"></a> <a class="uk-lightbox-button uk-position-center-right uk-position-medium uk-transition-fade" href="#" uk-slidenav-next uk-lightbox-item="next"></a> <div class="uk-lightbox-toolbar uk-lightbox-caption uk-position-bottom uk-text-center uk-transition-slide-bottom uk-transition-opaque"></div> </div>'}},created:function(){var t=this;this.$mount(f.append(this.container,this.template)),this.caption=f.$(".uk-lightbox-caption",this.$el),this.items.forEach(function(){return f.append(t.list,"<li></li>")})},events:[{name:f.pointerMove+" "+f.pointerDown+" keydown",handler:"showControls"},{name:"click",self:!0,delegate:function(){return this.selSlides},handler:function(t){t.defaultPrevented||this.hide()}},{name:"shown",self:!0,handler:function(){this.showControls()}},{name:"hide",self:!0,handler:function(){this.hideControls(),f.removeClass(this.slides,this.clsActive),f.Transition.stop(this.slides)}},{name:"hidden",self:!0,handler:function(){this.$destroy(!0)}},{name:"keyup",el:document,handler:function(t){if(this.isToggled(this.$el))switch(t.keyCode){case 37:this.show("previous");break;case 39:this.show("next")}}},{name:"beforeitemshow",handler:function(t){this.isToggled()||(this.draggable=!1,t.preventDefault(),this.toggleNow(this.$el,!0),this.animation=o.scale,f.removeClass(t.target,this.clsActive),this.stack.splice(1,0,this.index))}},{name:"itemshow",handler:function(t){var e=t.target,i=f.index(e),n=this.getItem(i).caption;f.css(this.caption,"display",n?"":"none"),f.html(this.caption,n);for(var s=0;s<=this.preload;s++)this.loadItem(this.getIndex(i+s)),this.loadItem(this.getIndex(i-s))}},{name:"itemshown",handler:function(){this.draggable=this.$props.draggable}},{name:"itemload",handler:function(t,s){var o,r=this,e=s.source,i=s.type,n=s.alt;if(this.setItem(s,"<span uk-spinner></span>"),e)if("image"===i||e.match(/\.(jp(e)?g|png|gif|svg|webp)($|\?)/i))f.getImage(e).then(function(t){return r.setItem(s,'<img width="'+t.width+'" height="'+t.height+'" src="'+e+'" alt="'+(n||"")+'">')},function(){return r.setError(s)});else if("video"===i||e.match(/\.(mp4|webm|ogv)($|\?)/i)){var a=f.$("<video controls playsinline"+(s.poster?' poster="'+s.poster+'"':"")+' uk-video="'+this.videoAutoplay+'"></video>');f.attr(a,"src",e),f.once(a,"error loadedmetadata",function(t){"error"===t?r.setError(s):(f.attr(a,{width:a.videoWidth,height:a.videoHeight}),r.setItem(s,a))})}else if("iframe"===i||e.match(/\.(html|php)($|\?)/i))this.setItem(s,'<iframe class="uk-lightbox-iframe" src="'+e+'" frameborder="0" allowfullscreen></iframe>');else if(o=e.match(/\/\/.*?youtube(-nocookie)?\.[a-z]+\/watch\?v=([^&\s]+)/)||e.match(/()youtu\.be\/(.*)/)){var h=o[2],l=function(t,e){return void 0===t&&(t=640),void 0===e&&(e=450),r.setItem(s,u("https://www.youtube"+(o[1]||"")+".com/embed/"+h,t,e,r.videoAutoplay))};f.getImage("https://img.youtube.com/vi/"+h+"/maxresdefault.jpg").then(function(t){var e=t.width,i=t.height;120===e&&90===i?f.getImage("https://img.youtube.com/vi/"+h+"/0.jpg").then(function(t){var e=t.width,i=t.height;return l(e,i)},l):l(e,i)},l)}else(o=e.match(/(\/\/.*?)vimeo\.[a-z]+\/([0-9]+).*?/))&&f.ajax("https://vimeo.com/api/oembed.json?maxwidth=1920&url="+encodeURI(e),{responseType:"json",withCredentials:!1}).then(function(t){var e=t.response,i=e.height,n=e.width;return r.setItem(s,u("https://player.vimeo.com/video/"+o[2],n,i,r.videoAutoplay))},function(){return r.setError(s)})}}],methods:{loadItem:function(t){void 0===t&&(t=this.index);var e=this.getItem(t);e.content||f.trigger(this.$el,"itemload",[e])},getItem:function(t){return void 0===t&&(t=this.index),this.items[t]||{}},setItem:function(t,e){f.assign(t,{content:e});var i=f.html(this.slides[this.items.indexOf(t)],e);f.trigger(this.$el,"itemloaded",[this,i]),this.$update(i)},setError:function(t){this.setItem(t,'<span uk-icon="icon: bolt; ratio: 2"></span>')},showControls:function(){clearTimeout(this.controlsTimer),this.controlsTimer=setTimeout(this.hideControls,this.delayControls),f.addClass(this.$el,"uk-active","uk-transition-active")},hideControls:function(){f.removeClass(this.$el,"uk-active","uk-transition-active")}}};function u(t,e,i,n){return'<iframe src="'+t+'" width="'+e+'" height="'+i+'" style="max-width: 100%; box-sizing: border-box;" frameborder="0" allowfullscreen uk-video="autoplay: '+n+'" uk-responsive></iframe>'}return"undefined"!=typeof window&&window.UIkit&&window.UIkit.component("lightboxPanel",l),l});
\ No newline at end of file
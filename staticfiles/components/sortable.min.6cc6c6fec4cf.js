@@ -0,0 +1,3 @@
+/*! UIkit 3.1.4 | http://www.getuikit.com | (c) 2014 - 2018 YOOtheme | MIT License */
+
+!function(t,e){"object"==typeof exports&&"undefined"!=typeof module?module.exports=e(require("uikit-util")):"function"==typeof define&&define.amd?define("uikitsortable",["uikit-util"],e):(t=t||self).UIkitSortable=e(t.UIkit.util)}(this,function(a){"use strict";var l,c="uk-animation-target";function d(t,e){var i=a.css(t,"zIndex");return!!a.isVisible(t)&&a.assign({display:"",opacity:e?a.css(t,"opacity"):"0",pointerEvents:"none",position:"absolute",zIndex:"auto"===i?a.index(t):i},u(t))}function p(t){a.css(t.children,{height:"",left:"",opacity:"",pointerEvents:"",position:"",top:"",width:""}),a.removeClass(t,c),a.css(t,"height","")}function u(t){var e=t.getBoundingClientRect(),i=e.height,s=e.width,o=a.position(t),n=o.top,r=o.left;return{top:n+=a.toFloat(a.css(t,"marginTop")),left:r,height:i,width:s}}var t={mixins:[{connected:function(){!a.hasClass(this.$el,this.$name)&&a.addClass(this.$el,this.$name)}},{props:{animation:Number},data:{animation:150},computed:{target:function(){return this.$el}},methods:{animate:function(t){var s=this;!function(){if(l)return;(l=a.append(document.head,"<style>").sheet).insertRule("."+c+" > * {\n            margin-top: 0 !important;\n            transform: none !important;\n        }",0)}();var o=a.toNodes(this.target.children),n=o.map(function(t){return d(t,!0)}),e=a.height(this.target),i=window.pageYOffset;t(),a.Transition.cancel(this.target),o.forEach(a.Transition.cancel),p(this.target),this.$update(this.target),a.fastdom.flush();var r=a.height(this.target),h=(o=o.concat(a.toNodes(this.target.children).filter(function(t){return!a.includes(o,t)}))).map(function(t,e){return!!(t.parentNode&&e in n)&&(n[e]?a.isVisible(t)?u(t):{opacity:0}:{opacity:a.isVisible(t)?1:0})});return n=h.map(function(t,e){var i=o[e].parentNode===s.target&&(n[e]||d(o[e]));if(i)if(t){if(!("opacity"in t)){i.opacity%1?t.opacity=1:delete i.opacity}}else delete i.opacity;return i}),a.addClass(this.target,c),o.forEach(function(t,e){return n[e]&&a.css(t,n[e])}),a.css(this.target,"height",e),a.scrollTop(window,i),a.Promise.all(o.map(function(t,e){return n[e]&&h[e]?a.Transition.start(t,h[e],s.animation,"ease"):a.Promise.resolve()}).concat(a.Transition.start(this.target,{height:r},this.animation,"ease"))).then(function(){o.forEach(function(t,e){return a.css(t,{display:0===h[e].opacity?"none":"",zIndex:""})}),p(s.target),s.$update(s.target),a.fastdom.flush()},a.noop)}}}],props:{group:String,threshold:Number,clsItem:String,clsPlaceholder:String,clsDrag:String,clsDragState:String,clsBase:String,clsNoDrag:String,clsEmpty:String,clsCustom:String,handle:String},data:{group:!1,threshold:5,clsItem:"uk-sortable-item",clsPlaceholder:"uk-sortable-placeholder",clsDrag:"uk-sortable-drag",clsDragState:"uk-drag",clsBase:"uk-sortable",clsNoDrag:"uk-sortable-nodrag",clsEmpty:"uk-sortable-empty",clsCustom:"",handle:!1},created:function(){var n=this;["init","start","move","end"].forEach(function(t){var o=n[t];n[t]=function(t){n.scrollY=window.pageYOffset;var e=a.getEventPos(t,"page"),i=e.x,s=e.y;n.pos={x:i,y:s},o(t)}})},events:{name:a.pointerDown,passive:!1,handler:"init"},update:{write:function(){if(this.clsEmpty&&a.toggleClass(this.$el,this.clsEmpty,a.isEmpty(this.$el.children)),a.css(this.handle?a.$$(this.handle,this.$el):this.$el.children,{touchAction:"none",userSelect:"none"}),this.drag){a.offset(this.drag,{top:this.pos.y+this.origin.top,left:this.pos.x+this.origin.left});var t,e=a.offset(this.drag),i=e.top,s=i+e.height;0<i&&i<this.scrollY?t=this.scrollY-5:s<a.height(document)&&s>a.height(window)+this.scrollY&&(t=this.scrollY+5),t&&setTimeout(function(){return a.scrollTop(window,t)},5)}}},methods:{init:function(t){var e=t.target,i=t.button,s=t.defaultPrevented,o=a.toNodes(this.$el.children).filter(function(t){return a.within(e,t)})[0];!o||s||0<i||a.isInput(e)||a.within(e,"."+this.clsNoDrag)||this.handle&&!a.within(e,this.handle)||(t.preventDefault(),this.touched=[this],this.placeholder=o,this.origin=a.assign({target:e,index:a.index(o)},this.pos),a.on(document,a.pointerMove,this.move),a.on(document,a.pointerUp,this.end),a.on(window,"scroll",this.scroll),this.threshold||this.start(t))},start:function(t){this.drag=a.append(this.$container,this.placeholder.outerHTML.replace(/^<li/i,"<div").replace(/li>$/i,"div>")),a.css(this.drag,a.assign({boxSizing:"border-box",width:this.placeholder.offsetWidth,height:this.placeholder.offsetHeight},a.css(this.placeholder,["paddingLeft","paddingRight","paddingTop","paddingBottom"]))),a.attr(this.drag,"uk-no-boot",""),a.addClass(this.drag,this.clsDrag,this.clsCustom),a.height(this.drag.firstElementChild,a.height(this.placeholder.firstElementChild));var e=a.offset(this.placeholder),i=e.left,s=e.top;a.assign(this.origin,{left:i-this.pos.x,top:s-this.pos.y}),a.css(this.origin.target,"pointerEvents","none"),a.addClass(this.placeholder,this.clsPlaceholder),a.addClass(this.$el.children,this.clsItem),a.addClass(document.documentElement,this.clsDragState),a.trigger(this.$el,"start",[this,this.placeholder]),this.move(t)},move:function(t){if(this.drag){this.$emit();var e="mousemove"===t.type?t.target:document.elementFromPoint(this.pos.x-window.pageXOffset,this.pos.y-window.pageYOffset),i=this.getSortable(e),s=this.getSortable(this.placeholder),o=i!==s;if(i&&!a.within(e,this.placeholder)&&(!o||i.group&&i.group===s.group)){if(e=i.$el===e.parentNode&&e||a.toNodes(i.$el.children).filter(function(t){return a.within(e,t)})[0],o)s.remove(this.placeholder);else if(!e)return;i.insert(this.placeholder,e),a.includes(this.touched,i)||this.touched.push(i)}}else(Math.abs(this.pos.x-this.origin.x)>this.threshold||Math.abs(this.pos.y-this.origin.y)>this.threshold)&&this.start(t)},end:function(t){if(a.off(document,a.pointerMove,this.move),a.off(document,a.pointerUp,this.end),a.off(window,"scroll",this.scroll),a.css(this.origin.target,"pointerEvents",""),this.drag){var e=this.getSortable(this.placeholder);this===e?this.origin.index!==a.index(this.placeholder)&&a.trigger(this.$el,"moved",[this,this.placeholder]):(a.trigger(e.$el,"added",[e,this.placeholder]),a.trigger(this.$el,"removed",[this,this.placeholder])),a.trigger(this.$el,"stop",[this,this.placeholder]),a.remove(this.drag),this.drag=null;var i=this.touched.map(function(t){return t.clsPlaceholder+" "+t.clsItem}).join(" ");this.touched.forEach(function(t){return a.removeClass(t.$el.children,i)}),a.removeClass(document.documentElement,this.clsDragState)}else"touchend"===t.type&&t.target.click()},scroll:function(){var t=window.pageYOffset;t!==this.scrollY&&(this.pos.y+=t-this.scrollY,this.scrollY=t,this.$emit())},insert:function(t,e){var i=this;a.addClass(this.$el.children,this.clsItem);function s(){e?!a.within(t,i.$el)||function(t,e){return t.parentNode===e.parentNode&&a.index(t)>a.index(e)}(t,e)?a.before(e,t):a.after(e,t):a.append(i.$el,t)}this.animation?this.animate(s):s()},remove:function(t){a.within(t,this.$el)&&(a.css(this.handle?a.$$(this.handle,t):t,{touchAction:"",userSelect:""}),this.animation?this.animate(function(){return a.remove(t)}):a.remove(t))},getSortable:function(t){return t&&(this.$getComponent(t,"sortable")||this.getSortable(t.parentNode))}}};return"undefined"!=typeof window&&window.UIkit&&window.UIkit.component("sortable",t),t});
\ No newline at end of file
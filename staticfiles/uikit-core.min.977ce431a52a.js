@@ -0,0 +1,3 @@
+/*! UIkit 3.1.4 | http://www.getuikit.com | (c) 2014 - 2018 YOOtheme | MIT License */
+
+!function(t,e){"object"==typeof exports&&"undefined"!=typeof module?module.exports=e():"function"==typeof define&&define.amd?define("uikit",e):(t=t||self).UIkit=e()}(this,function(){"use strict";function h(n,i){return function(t){var e=arguments.length;return e?1<e?n.apply(i,arguments):n.call(i,t):n.call(i)}}var e=Object.prototype,n=e.hasOwnProperty;function c(t,e){return n.call(t,e)}var i={},r=/([a-z\d])([A-Z])/g;function f(t){return t in i||(i[t]=t.replace(r,"$1-$2").toLowerCase()),i[t]}var o=/-(\w)/g;function d(t){return t.replace(o,s)}function s(t,e){return e?e.toUpperCase():""}function a(t){return t.length?s(0,t.charAt(0))+t.slice(1):""}var t=String.prototype,u=t.startsWith||function(t){return 0===this.lastIndexOf(t,0)};function p(t,e){return u.call(t,e)}var l=t.endsWith||function(t){return this.substr(-t.length)===t};function g(t,e){return l.call(t,e)}function v(t,e){return~this.indexOf(t,e)}var m=Array.prototype,w=t.includes||v,b=m.includes||v;function y(t,e){return t&&(M(t)?w:b).call(t,e)}var x=m.findIndex||function(t){for(var e=arguments,n=0;n<this.length;n++)if(t.call(e[1],this[n],n,this))return n;return-1};var k=Array.isArray;function $(t){return"function"==typeof t}function T(t){return null!==t&&"object"==typeof t}function S(t){return T(t)&&Object.getPrototypeOf(t)===e}function E(t){return T(t)&&t===t.window}function C(t){return T(t)&&9===t.nodeType}function _(t){return T(t)&&!!t.jquery}function A(t){return t instanceof Node||T(t)&&1<=t.nodeType}var N=e.toString;function B(t){return N.call(t).match(/^\[object (NodeList|HTMLCollection)\]$/)}function O(t){return"boolean"==typeof t}function M(t){return"string"==typeof t}function D(t){return"number"==typeof t}function H(t){return D(t)||M(t)&&!isNaN(t-parseFloat(t))}function P(t){return!(k(t)?t.length:T(t)&&Object.keys(t).length)}function I(t){return void 0===t}function z(t){return O(t)?t:"true"===t||"1"===t||""===t||"false"!==t&&"0"!==t&&t}function L(t){var e=Number(t);return!isNaN(e)&&e}function F(t){return parseFloat(t)||0}function j(t){return A(t)||E(t)||C(t)?t:B(t)||_(t)?t[0]:k(t)?j(t[0]):null}function V(t){return A(t)?[t]:B(t)?m.slice.call(t):k(t)?t.map(j).filter(Boolean):_(t)?t.toArray():[]}function W(t){return k(t)?t:M(t)?t.split(/,(?![^(]*\))/).map(function(t){return H(t)?L(t):z(t.trim())}):[t]}function q(t){return t?g(t,"ms")?F(t):1e3*F(t):0}function R(t,n){return t===n||T(t)&&T(n)&&Object.keys(t).length===Object.keys(n).length&&X(t,function(t,e){return t===n[e]})}function Y(t,e,n){return t.replace(new RegExp(e+"|"+n,"mg"),function(t){return t===e?n:e})}var U=Object.assign||function(t){for(var e=[],n=arguments.length-1;0<n--;)e[n]=arguments[n+1];t=Object(t);for(var i=0;i<e.length;i++){var r=e[i];if(null!==r)for(var o in r)c(r,o)&&(t[o]=r[o])}return t};function X(t,e){for(var n in t)if(!1===e(t[n],n))return!1;return!0}function G(t,r){return t.sort(function(t,e){var n=t[r];void 0===n&&(n=0);var i=e[r];return void 0===i&&(i=0),i<n?1:n<i?-1:0})}function J(t,e,n){return void 0===e&&(e=0),void 0===n&&(n=1),Math.min(Math.max(L(t)||0,e),n)}function K(){}function Z(t,e){return t.left<e.right&&t.right>e.left&&t.top<e.bottom&&t.bottom>e.top}function Q(t,e){return t.x<=e.right&&t.x>=e.left&&t.y<=e.bottom&&t.y>=e.top}var tt={ratio:function(t,e,n){var i,r="width"===e?"height":"width";return(i={})[r]=t[e]?Math.round(n*t[r]/t[e]):t[r],i[e]=n,i},contain:function(n,i){var r=this;return X(n=U({},n),function(t,e){return n=n[e]>i[e]?r.ratio(n,e,i[e]):n}),n},cover:function(n,i){var r=this;return X(n=this.contain(n,i),function(t,e){return n=n[e]<i[e]?r.ratio(n,e,i[e]):n}),n}};function et(t,e,n){if(T(e))for(var i in e)et(t,i,e[i]);else{if(I(n))return(t=j(t))&&t.getAttribute(e);V(t).forEach(function(t){$(n)&&(n=n.call(t,et(t,e))),null===n?it(t,e):t.setAttribute(e,n)})}}function nt(t,e){return V(t).some(function(t){return t.hasAttribute(e)})}function it(t,e){t=V(t),e.split(" ").forEach(function(e){return t.forEach(function(t){return t.hasAttribute(e)&&t.removeAttribute(e)})})}function rt(t,e){for(var n=0,i=[e,"data-"+e];n<i.length;n++)if(nt(t,i[n]))return et(t,i[n])}function ot(t,e){return j(t)||ut(t,at(t,e))}function st(t,e){var n=V(t);return n.length&&n||ct(t,at(t,e))}function at(t,e){return void 0===e&&(e=document),dt(t)||C(e)?e:e.ownerDocument}function ut(t,e){return j(lt(t,e,"querySelector"))}function ct(t,e){return V(lt(t,e,"querySelectorAll"))}function lt(t,s,e){if(void 0===s&&(s=document),!t||!M(t))return null;var a;dt(t=t.replace(ft,"$1 *"))&&(a=[],t=function(t){return t.match(pt).map(function(t){return t.replace(/,$/,"").trim()})}(t).map(function(t,e){var n=s;if("!"===t[0]){var i=t.substr(1).trim().split(" ");n=bt(s.parentNode,i[0]),t=i.slice(1).join(" ").trim()}if("-"===t[0]){var r=t.substr(1).trim().split(" "),o=(n||s).previousElementSibling;n=mt(o,t.substr(1))?o:null,t=r.slice(1).join(" ")}return n?(n.id||(n.id="uk-"+Date.now()+e,a.push(function(){return it(n,"id")})),"#"+kt(n.id)+" "+t):null}).filter(Boolean).join(","),s=document);try{return s[e](t)}catch(t){return null}finally{a&&a.forEach(function(t){return t()})}}var ht=/(^|[^\\],)\s*[!>+~-]/,ft=/([!>+~-])(?=\s+[!>+~-]|\s*$)/g;function dt(t){return M(t)&&t.match(ht)}var pt=/.*?[^\\](?:,|$)/g;var gt=Element.prototype,vt=gt.matches||gt.webkitMatchesSelector||gt.msMatchesSelector;function mt(t,e){return V(t).some(function(t){return vt.call(t,e)})}var wt=gt.closest||function(t){var e=this;do{if(mt(e,t))return e;e=e.parentNode}while(e&&1===e.nodeType)};function bt(t,e){return p(e,">")&&(e=e.slice(1)),A(t)?t.parentNode&&wt.call(t,e):V(t).map(function(t){return bt(t,e)}).filter(Boolean)}function yt(t,e){for(var n=[],i=j(t).parentNode;i&&1===i.nodeType;)mt(i,e)&&n.push(i),i=i.parentNode;return n}var xt=window.CSS&&CSS.escape||function(t){return t.replace(/([^\x7f-\uFFFF\w-])/g,function(t){return"\\"+t})};function kt(t){return M(t)?xt.call(null,t):""}var $t={area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,menuitem:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0};function Tt(t){return V(t).some(function(t){return $t[t.tagName.toLowerCase()]})}function St(t){return V(t).some(function(t){return t.offsetWidth||t.offsetHeight||t.getClientRects().length})}var Et="input,select,textarea,button";function Ct(t){return V(t).some(function(t){return mt(t,Et)})}function _t(t,e){return V(t).filter(function(t){return mt(t,e)})}function At(t,e){return M(e)?mt(t,e)||bt(t,e):t===e||(C(e)?e.documentElement:j(e)).contains(j(t))}function Nt(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];var n=Ht(t),i=n[0],r=n[1],o=n[2],s=n[3],a=n[4];return i=zt(i),o&&(s=function(t,i,r){var o=this;return function(n){t.forEach(function(t){var e=">"===i[0]?ct(i,t).reverse().filter(function(t){return At(n.target,t)})[0]:bt(n.target,i);e&&(n.delegate=t,n.current=e,r.call(o,n))})}}(i,o,s)),1<s.length&&(s=function(e){return function(t){return k(t.detail)?e.apply(void 0,[t].concat(t.detail)):e(t)}}(s)),r.split(" ").forEach(function(e){return i.forEach(function(t){return t.addEventListener(e,s,a)})}),function(){return Bt(i,r,s,a)}}function Bt(t,e,n,i){void 0===i&&(i=!1),t=zt(t),e.split(" ").forEach(function(e){return t.forEach(function(t){return t.removeEventListener(e,n,i)})})}function Ot(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];var n=Ht(t),i=n[0],r=n[1],o=n[2],s=n[3],a=n[4],u=n[5],c=Nt(i,r,o,function(t){var e=!u||u(t);e&&(c(),s(t,e))},a);return c}function Mt(t,n,i){return zt(t).reduce(function(t,e){return t&&e.dispatchEvent(Dt(n,!0,!0,i))},!0)}function Dt(t,e,n,i){if(void 0===e&&(e=!0),void 0===n&&(n=!1),M(t)){var r=document.createEvent("CustomEvent");r.initCustomEvent(t,e,n,i),t=r}return t}function Ht(t){return $(t[2])&&t.splice(2,0,!1),t}function Pt(t){return t&&"addEventListener"in t}function It(t){return Pt(t)?t:j(t)}function zt(t){return k(t)?t.map(It).filter(Boolean):M(t)?ct(t):Pt(t)?[t]:V(t)}function Lt(t){return"touch"===t.pointerType||t.touches}function Ft(t,e){void 0===e&&(e="client");var n=t.touches,i=t.changedTouches,r=n&&n[0]||i&&i[0]||t;return{x:r[e+"X"],y:r[e+"Y"]}}var jt="Promise"in window?window.Promise:qt,Vt=2,Wt="setImmediate"in window?setImmediate:setTimeout;function qt(t){this.state=Vt,this.value=void 0,this.deferred=[];var e=this;try{t(function(t){e.resolve(t)},function(t){e.reject(t)})}catch(t){e.reject(t)}}qt.reject=function(n){return new qt(function(t,e){e(n)})},qt.resolve=function(n){return new qt(function(t,e){t(n)})},qt.all=function(s){return new qt(function(n,t){var i=[],r=0;function e(e){return function(t){i[e]=t,(r+=1)===s.length&&n(i)}}0===s.length&&n(i);for(var o=0;o<s.length;o+=1)qt.resolve(s[o]).then(e(o),t)})},qt.race=function(i){return new qt(function(t,e){for(var n=0;n<i.length;n+=1)qt.resolve(i[n]).then(t,e)})};var Rt=qt.prototype;function Yt(s,a){return new jt(function(t,e){var n=U({data:null,method:"GET",headers:{},xhr:new XMLHttpRequest,beforeSend:K,responseType:""},a);n.beforeSend(n);var i=n.xhr;for(var r in n)if(r in i)try{i[r]=n[r]}catch(t){}for(var o in i.open(n.method.toUpperCase(),s),n.headers)i.setRequestHeader(o,n.headers[o]);Nt(i,"load",function(){0===i.status||200<=i.status&&i.status<300||304===i.status?t(i):e(U(Error(i.statusText),{xhr:i,status:i.status}))}),Nt(i,"error",function(){return e(U(Error("Network Error"),{xhr:i}))}),Nt(i,"timeout",function(){return e(U(Error("Network Timeout"),{xhr:i}))}),i.send(n.data)})}function Ut(i,r,o){return new jt(function(t,e){var n=new Image;n.onerror=e,n.onload=function(){return t(n)},o&&(n.sizes=o),r&&(n.srcset=r),n.src=i})}Rt.resolve=function(t){var e=this;if(e.state===Vt){if(t===e)throw new TypeError("Promise settled with itself.");var n=!1;try{var i=t&&t.then;if(null!==t&&T(t)&&$(i))return void i.call(t,function(t){n||e.resolve(t),n=!0},function(t){n||e.reject(t),n=!0})}catch(t){return void(n||e.reject(t))}e.state=0,e.value=t,e.notify()}},Rt.reject=function(t){var e=this;if(e.state===Vt){if(t===e)throw new TypeError("Promise settled with itself.");e.state=1,e.value=t,e.notify()}},Rt.notify=function(){var o=this;Wt(function(){if(o.state!==Vt)for(;o.deferred.length;){var t=o.deferred.shift(),e=t[0],n=t[1],i=t[2],r=t[3];try{0===o.state?$(e)?i(e.call(void 0,o.value)):i(o.value):1===o.state&&($(n)?i(n.call(void 0,o.value)):r(o.value))}catch(t){r(t)}}})},Rt.then=function(n,i){var r=this;return new qt(function(t,e){r.deferred.push([n,i,t,e]),r.notify()})},Rt.catch=function(t){return this.then(void 0,t)};var Xt=/msie|trident/i.test(window.navigator.userAgent),Gt="rtl"===et(document.documentElement,"dir"),Jt="ontouchstart"in window,Kt=window.PointerEvent,Zt=Jt||window.DocumentTouch&&document instanceof DocumentTouch||navigator.maxTouchPoints,Qt=Kt?"pointerdown":Jt?"touchstart":"mousedown",te=Kt?"pointermove":Jt?"touchmove":"mousemove",ee=Kt?"pointerup":Jt?"touchend":"mouseup",ne=Kt?"pointerenter":Jt?"":"mouseenter",ie=Kt?"pointerleave":Jt?"":"mouseleave",re=Kt?"pointercancel":"touchcancel";function oe(t){if("loading"===document.readyState)var e=Nt(document,"DOMContentLoaded",function(){e(),t()});else t()}function se(t,e){return e?V(t).indexOf(j(e)):V((t=j(t))&&t.parentNode.children).indexOf(t)}function ae(t,e,n,i){void 0===n&&(n=0),void 0===i&&(i=!1);var r=(e=V(e)).length;return t=H(t)?L(t):"next"===t?n+1:"previous"===t?n-1:se(e,t),i?J(t,0,r-1):(t%=r)<0?t+r:t}function ue(t){return(t=ke(t)).innerHTML="",t}function ce(t,e){return t=ke(t),I(e)?t.innerHTML:le(t.hasChildNodes()?ue(t):t,e)}function le(e,t){return e=ke(e),de(t,function(t){return e.appendChild(t)})}function he(e,t){return e=ke(e),de(t,function(t){return e.parentNode.insertBefore(t,e)})}function fe(e,t){return e=ke(e),de(t,function(t){return e.nextSibling?he(e.nextSibling,t):le(e.parentNode,t)})}function de(t,e){return(t=M(t)?ye(t):t)?"length"in t?V(t).map(e):e(t):null}function pe(t){V(t).map(function(t){return t.parentNode&&t.parentNode.removeChild(t)})}function ge(t,e){for(e=j(he(t,e));e.firstChild;)e=e.firstChild;return le(e,t),e}function ve(t,e){return V(V(t).map(function(t){return t.hasChildNodes?ge(V(t.childNodes),e):le(t,e)}))}function me(t){V(t).map(function(t){return t.parentNode}).filter(function(t,e,n){return n.indexOf(t)===e}).forEach(function(t){he(t,t.childNodes),pe(t)})}var we=/^\s*<(\w+|!)[^>]*>/,be=/^<(\w+)\s*\/?>(?:<\/\1>)?$/;function ye(t){var e=be.exec(t);if(e)return document.createElement(e[1]);var n=document.createElement("div");return we.test(t)?n.insertAdjacentHTML("beforeend",t.trim()):n.textContent=t,1<n.childNodes.length?V(n.childNodes):n.firstChild}function xe(t,e){if(t&&1===t.nodeType)for(e(t),t=t.firstElementChild;t;)xe(t,e),t=t.nextElementSibling}function ke(t,e){return M(t)?Te(t)?j(ye(t)):ut(t,e):j(t)}function $e(t,e){return M(t)?Te(t)?V(ye(t)):ct(t,e):V(t)}function Te(t){return"<"===t[0]||t.match(/^\s*</)}function Se(t){for(var e=[],n=arguments.length-1;0<n--;)e[n]=arguments[n+1];Be(t,e,"add")}function Ee(t){for(var e=[],n=arguments.length-1;0<n--;)e[n]=arguments[n+1];Be(t,e,"remove")}function Ce(t,e){et(t,"class",function(t){return(t||"").replace(new RegExp("\\b"+e+"\\b","g"),"")})}function _e(t){for(var e=[],n=arguments.length-1;0<n--;)e[n]=arguments[n+1];e[0]&&Ee(t,e[0]),e[1]&&Se(t,e[1])}function Ae(t,e){return e&&V(t).some(function(t){return t.classList.contains(e.split(" ")[0])})}function Ne(t){for(var i=[],e=arguments.length-1;0<e--;)i[e]=arguments[e+1];if(i.length){var r=M((i=Oe(i))[i.length-1])?[]:i.pop();i=i.filter(Boolean),V(t).forEach(function(t){for(var e=t.classList,n=0;n<i.length;n++)Me.Force?e.toggle.apply(e,[i[n]].concat(r)):e[(I(r)?!e.contains(i[n]):r)?"add":"remove"](i[n])})}}function Be(t,n,i){(n=Oe(n).filter(Boolean)).length&&V(t).forEach(function(t){var e=t.classList;Me.Multiple?e[i].apply(e,n):n.forEach(function(t){return e[i](t)})})}function Oe(t){return t.reduce(function(t,e){return t.concat.call(t,M(e)&&y(e," ")?e.trim().split(" "):e)},[])}var Me={get Multiple(){return this.get("_multiple")},get Force(){return this.get("_force")},get:function(t){if(!c(this,t)){var e=document.createElement("_").classList;e.add("a","b"),e.toggle("c",!1),this._multiple=e.contains("b"),this._force=!e.contains("c")}return this[t]}},De={"animation-iteration-count":!0,"column-count":!0,"fill-opacity":!0,"flex-grow":!0,"flex-shrink":!0,"font-weight":!0,"line-height":!0,opacity:!0,order:!0,orphans:!0,"stroke-dasharray":!0,"stroke-dashoffset":!0,widows:!0,"z-index":!0,zoom:!0};function He(t,e,r){return V(t).map(function(n){if(M(e)){if(e=je(e),I(r))return Ie(n,e);r||D(r)?n.style[e]=H(r)&&!De[e]?r+"px":r:n.style.removeProperty(e)}else{if(k(e)){var i=Pe(n);return e.reduce(function(t,e){return t[e]=i[je(e)],t},{})}T(e)&&X(e,function(t,e){return He(n,e,t)})}return n})[0]}function Pe(t,e){return(t=j(t)).ownerDocument.defaultView.getComputedStyle(t,e)}function Ie(t,e,n){return Pe(t,n)[e]}var ze={};function Le(t){var e=document.documentElement;if(!Xt)return Pe(e).getPropertyValue("--uk-"+t);if(!(t in ze)){var n=le(e,document.createElement("div"));Se(n,"uk-"+t),ze[t]=Ie(n,"content",":before").replace(/^["'](.*)["']$/,"$1"),pe(n)}return ze[t]}var Fe={};function je(t){var e=Fe[t];return e||(e=Fe[t]=function(t){t=f(t);var e=document.documentElement.style;if(t in e)return t;var n,i=Ve.length;for(;i--;)if((n="-"+Ve[i]+"-"+t)in e)return n}(t)||t),e}var Ve=["webkit","moz","ms"];function We(t,s,a,u){return void 0===a&&(a=400),void 0===u&&(u="linear"),jt.all(V(t).map(function(o){return new jt(function(n,i){for(var t in s){var e=He(o,t);""===e&&He(o,t,e)}var r=setTimeout(function(){return Mt(o,"transitionend")},a);Ot(o,"transitionend transitioncanceled",function(t){var e=t.type;clearTimeout(r),Ee(o,"uk-transition"),He(o,{"transition-property":"","transition-duration":"","transition-timing-function":""}),"transitioncanceled"===e?i():n()},!1,function(t){var e=t.target;return o===e}),Se(o,"uk-transition"),He(o,U({"transition-property":Object.keys(s).map(je).join(","),"transition-duration":a+"ms","transition-timing-function":u},s))})}))}var qe={start:We,stop:function(t){return Mt(t,"transitionend"),jt.resolve()},cancel:function(t){Mt(t,"transitioncanceled")},inProgress:function(t){return Ae(t,"uk-transition")}},Re="uk-animation-",Ye="uk-cancel-animation";function Ue(t,e,n,a,u){var c=arguments;return void 0===n&&(n=200),jt.all(V(t).map(function(s){return new jt(function(i,r){if(Ae(s,Ye))requestAnimationFrame(function(){return jt.resolve().then(function(){return Ue.apply(void 0,c).then(i,r)})});else{var t=e+" "+Re+(u?"leave":"enter");p(e,Re)&&(a&&(t+=" uk-transform-origin-"+a),u&&(t+=" "+Re+"reverse")),o(),Ot(s,"animationend animationcancel",function(t){var e=t.type,n=!1;"animationcancel"===e?(r(),o()):(i(),jt.resolve().then(function(){n=!0,o()})),requestAnimationFrame(function(){n||(Se(s,Ye),requestAnimationFrame(function(){return Ee(s,Ye)}))})},!1,function(t){var e=t.target;return s===e}),He(s,"animationDuration",n+"ms"),Se(s,t)}function o(){He(s,"animationDuration",""),Ce(s,Re+"\\S*")}})}))}var Xe=new RegExp(Re+"(enter|leave)"),Ge={in:function(t,e,n,i){return Ue(t,e,n,i,!1)},out:function(t,e,n,i){return Ue(t,e,n,i,!0)},inProgress:function(t){return Xe.test(et(t,"class"))},cancel:function(t){Mt(t,"animationcancel")}},Je={width:["x","left","right"],height:["y","top","bottom"]};function Ke(t,e,l,h,f,n,i,r){l=an(l),h=an(h);var d={element:l,target:h};if(!t||!e)return d;var p=Qe(t),g=Qe(e),v=g;if(sn(v,l,p,-1),sn(v,h,g,1),f=un(f,p.width,p.height),n=un(n,g.width,g.height),f.x+=n.x,f.y+=n.y,v.left+=f.x,v.top+=f.y,i){var o=[Qe(vn(t))];r&&o.unshift(Qe(r)),X(Je,function(t,s){var a=t[0],u=t[1],c=t[2];(!0===i||y(i,a))&&o.some(function(i){var t=l[a]===u?-p[s]:l[a]===c?p[s]:0,e=h[a]===u?g[s]:h[a]===c?-g[s]:0;if(v[u]<i[u]||v[u]+p[s]>i[c]){var n=p[s]/2,r="center"===h[a]?-g[s]/2:0;return"center"===l[a]&&(o(n,r)||o(-n,-r))||o(t,e)}function o(e,t){var n=v[u]+e+t-2*f[a];if(n>=i[u]&&n+p[s]<=i[c])return v[u]=n,["element","target"].forEach(function(t){d[t][a]=e?d[t][a]===Je[s][1]?Je[s][2]:Je[s][1]:d[t][a]}),!0}})})}return Ze(t,v),d}function Ze(n,i){if(n=j(n),!i)return Qe(n);var r=Ze(n),o=He(n,"position");["left","top"].forEach(function(t){if(t in i){var e=He(n,t);He(n,t,i[t]-r[t]+F("absolute"===o&&"auto"===e?tn(n)[t]:e))}})}function Qe(t){var e,n,i=vn(t=j(t)),r=i.pageYOffset,o=i.pageXOffset;if(E(t)){var s=t.innerHeight,a=t.innerWidth;return{top:r,left:o,height:s,width:a,bottom:r+s,right:o+a}}St(t)||"none"!==He(t,"display")||(e=et(t,"style"),n=et(t,"hidden"),et(t,{style:(e||"")+";display:block !important;",hidden:null}));var u=t.getBoundingClientRect();return I(e)||et(t,{style:e,hidden:n}),{height:u.height,width:u.width,top:u.top+r,left:u.left+o,bottom:u.bottom+r,right:u.right+o}}function tn(i){var r=(i=j(i)).offsetParent||function(t){return mn(t).documentElement}(i),o=Ze(r),t=["top","left"].reduce(function(t,e){var n=a(e);return t[e]-=o[e]+F(He(i,"margin"+n))+F(He(r,"border"+n+"Width")),t},Ze(i));return{top:t.top,left:t.left}}var en=rn("height"),nn=rn("width");function rn(i){var r=a(i);return function(t,e){if(t=j(t),I(e)){if(E(t))return t["inner"+r];if(C(t)){var n=t.documentElement;return Math.max(n["offset"+r],n["scroll"+r])}return(e="auto"===(e=He(t,i))?t["offset"+r]:F(e)||0)-on(i,t)}He(t,i,e||0===e?+e+on(i,t)+"px":"")}}function on(t,n,e){return void 0===e&&(e="border-box"),He(n,"boxSizing")===e?Je[t].slice(1).map(a).reduce(function(t,e){return t+F(He(n,"padding"+e))+F(He(n,"border"+e+"Width"))},0):0}function sn(o,s,a,u){X(Je,function(t,e){var n=t[0],i=t[1],r=t[2];s[n]===r?o[i]+=a[e]*u:"center"===s[n]&&(o[i]+=a[e]*u/2)})}function an(t){var e=/left|center|right/,n=/top|center|bottom/;return 1===(t=(t||"").split(" ")).length&&(t=e.test(t[0])?t.concat(["center"]):n.test(t[0])?["center"].concat(t):["center","center"]),{x:e.test(t[0])?t[0]:"center",y:n.test(t[1])?t[1]:"center"}}function un(t,e,n){var i=(t||"").split(" "),r=i[0],o=i[1];return{x:r?F(r)*(g(r,"%")?e/100:1):0,y:o?F(o)*(g(o,"%")?n/100:1):0}}function cn(t){switch(t){case"left":return"right";case"right":return"left";case"top":return"bottom";case"bottom":return"top";default:return t}}function ln(t,e,n){if(void 0===e&&(e=0),void 0===n&&(n=0),!St(t))return!1;var i=vn(t=j(t)),r=t.getBoundingClientRect(),o={top:-e,left:-n,bottom:e+en(i),right:n+nn(i)};return Z(r,o)||Q({x:r.left,y:r.top},o)}function hn(t,e){if(void 0===e&&(e=0),!St(t))return 0;var n=vn(t=j(t)),i=mn(t),r=t.offsetHeight+e,o=dn(t)[0],s=en(n),a=s+Math.min(0,o-s),u=Math.max(0,s-(en(i)+e-(o+r)));return J((a+n.pageYOffset-o)/((a+(r-(u<s?u:0)))/100)/100)}function fn(t,e){if(E(t=j(t))||C(t)){var n=vn(t);(0,n.scrollTo)(n.pageXOffset,e)}else t.scrollTop=e}function dn(t){var e=[0,0];do{if(e[0]+=t.offsetTop,e[1]+=t.offsetLeft,"fixed"===He(t,"position")){var n=vn(t);return e[0]+=n.pageYOffset,e[1]+=n.pageXOffset,e}}while(t=t.offsetParent);return e}function pn(t,e,n){return void 0===e&&(e="width"),void 0===n&&(n=window),H(t)?+t:g(t,"vh")?gn(en(vn(n)),t):g(t,"vw")?gn(nn(vn(n)),t):g(t,"%")?gn(Qe(n)[e],t):F(t)}function gn(t,e){return t*F(e)/100}function vn(t){return E(t)?t:mn(t).defaultView}function mn(t){return j(t).ownerDocument}var wn={reads:[],writes:[],read:function(t){return this.reads.push(t),bn(),t},write:function(t){return this.writes.push(t),bn(),t},clear:function(t){return xn(this.reads,t)||xn(this.writes,t)},flush:function(){yn(this.reads),yn(this.writes.splice(0,this.writes.length)),this.scheduled=!1,(this.reads.length||this.writes.length)&&bn()}};function bn(){wn.scheduled||(wn.scheduled=!0,requestAnimationFrame(wn.flush.bind(wn)))}function yn(t){for(var e;e=t.shift();)e()}function xn(t,e){var n=t.indexOf(e);return!!~n&&!!t.splice(n,1)}function kn(){}function $n(t,e){return(e.y-t.y)/(e.x-t.x)}kn.prototype={positions:[],position:null,init:function(){var i=this;this.positions=[],this.position=null;var r=!1;this.unbind=Nt(document,"mousemove",function(n){r||(setTimeout(function(){var t=Date.now(),e=i.positions.length;e&&100<t-i.positions[e-1].time&&i.positions.splice(0,e),i.positions.push({time:t,x:n.pageX,y:n.pageY}),5<i.positions.length&&i.positions.shift(),r=!1},5),r=!0)})},cancel:function(){this.unbind&&this.unbind()},movesTo:function(t){if(this.positions.length<2)return!1;var e=Ze(t),n=this.positions[this.positions.length-1],i=this.positions[0];if(e.left<=n.x&&n.x<=e.right&&e.top<=n.y&&n.y<=e.bottom)return!1;var r=[[{x:e.left,y:e.top},{x:e.right,y:e.bottom}],[{x:e.right,y:e.top},{x:e.left,y:e.bottom}]];return e.right<=n.x||(e.left>=n.x?(r[0].reverse(),r[1].reverse()):e.bottom<=n.y?r[0].reverse():e.top>=n.y&&r[1].reverse()),!!r.reduce(function(t,e){return t+($n(i,e[0])<$n(n,e[0])&&$n(i,e[1])>$n(n,e[1]))},0)}};var Tn={};function Sn(t,e,n){return Tn.computed($(t)?t.call(n,n):t,$(e)?e.call(n,n):e)}function En(t,e){return t=t&&!k(t)?[t]:t,e?t?t.concat(e):k(e)?e:[e]:t}function Cn(e,n,i){var r={};if($(n)&&(n=n.options),n.extends&&(e=Cn(e,n.extends,i)),n.mixins)for(var t=0,o=n.mixins.length;t<o;t++)e=Cn(e,n.mixins[t],i);for(var s in e)u(s);for(var a in n)c(e,a)||u(a);function u(t){r[t]=(Tn[t]||function(t,e){return I(e)?t:e})(e[t],n[t],i)}return r}function _n(t,e){var n;void 0===e&&(e=[]);try{return t?p(t,"{")?JSON.parse(t):e.length&&!y(t,":")?((n={})[e[0]]=t,n):t.split(";").reduce(function(t,e){var n=e.split(/:(.*)/),i=n[0],r=n[1];return i&&!I(r)&&(t[i.trim()]=r.trim()),t},{}):{}}catch(t){return{}}}Tn.events=Tn.created=Tn.beforeConnect=Tn.connected=Tn.beforeDisconnect=Tn.disconnected=Tn.destroy=En,Tn.args=function(t,e){return En(e||t)},Tn.update=function(t,e){return G(En(t,$(e)?{read:e}:e),"order")},Tn.props=function(t,e){return k(e)&&(e=e.reduce(function(t,e){return t[e]=String,t},{})),Tn.methods(t,e)},Tn.computed=Tn.methods=function(t,e){return e?t?U({},t,e):e:t},Tn.data=function(e,n,t){return t?Sn(e,n,t):n?e?function(t){return Sn(e,n,t)}:n:e};function An(t){this.id=++Nn,this.el=j(t)}var Nn=0;function Bn(t,e){try{t.contentWindow.postMessage(JSON.stringify(U({event:"command"},e)),"*")}catch(t){}}An.prototype.isVideo=function(){return this.isYoutube()||this.isVimeo()||this.isHTML5()},An.prototype.isHTML5=function(){return"VIDEO"===this.el.tagName},An.prototype.isIFrame=function(){return"IFRAME"===this.el.tagName},An.prototype.isYoutube=function(){return this.isIFrame()&&!!this.el.src.match(/\/\/.*?youtube(-nocookie)?\.[a-z]+\/(watch\?v=[^&\s]+|embed)|youtu\.be\/.*/)},An.prototype.isVimeo=function(){return this.isIFrame()&&!!this.el.src.match(/vimeo\.com\/video\/.*/)},An.prototype.enableApi=function(){var e=this;if(this.ready)return this.ready;var n,i=this.isYoutube(),r=this.isVimeo();return i||r?this.ready=new jt(function(t){Ot(e.el,"load",function(){if(i){var t=function(){return Bn(e.el,{event:"listening",id:e.id})};n=setInterval(t,100),t()}}),function(i){return new jt(function(n){Ot(window,"message",function(t,e){return n(e)},!1,function(t){var e=t.data;if(e&&M(e)){try{e=JSON.parse(e)}catch(t){return}return e&&i(e)}})})}(function(t){return i&&t.id===e.id&&"onReady"===t.event||r&&Number(t.player_id)===e.id}).then(function(){t(),n&&clearInterval(n)}),et(e.el,"src",e.el.src+(y(e.el.src,"?")?"&":"?")+(i?"enablejsapi=1":"api=1&player_id="+e.id))}):jt.resolve()},An.prototype.play=function(){var t=this;if(this.isVideo())if(this.isIFrame())this.enableApi().then(function(){return Bn(t.el,{func:"playVideo",method:"play"})});else if(this.isHTML5())try{var e=this.el.play();e&&e.catch(K)}catch(t){}},An.prototype.pause=function(){var t=this;this.isVideo()&&(this.isIFrame()?this.enableApi().then(function(){return Bn(t.el,{func:"pauseVideo",method:"pause"})}):this.isHTML5()&&this.el.pause())},An.prototype.mute=function(){var t=this;this.isVideo()&&(this.isIFrame()?this.enableApi().then(function(){return Bn(t.el,{func:"mute",method:"setVolume",value:0})}):this.isHTML5()&&(this.el.muted=!0,et(this.el,"muted","")))};var On="IntersectionObserver"in window?window.IntersectionObserver:function(){function t(e,t){var n=this;void 0===t&&(t={});var i=t.rootMargin;void 0===i&&(i="0 0"),this.targets=[];var r,o=(i||"0 0").split(" ").map(F),s=o[0],a=o[1];this.offsetTop=s,this.offsetLeft=a,this.apply=function(){r||(r=requestAnimationFrame(function(){return setTimeout(function(){var t=n.takeRecords();t.length&&e(t,n),r=!1})}))},this.off=Nt(window,"scroll resize load",this.apply,{passive:!0,capture:!0})}return t.prototype.takeRecords=function(){var n=this;return this.targets.filter(function(t){var e=ln(t.target,n.offsetTop,n.offsetLeft);if(null===t.isIntersecting||e^t.isIntersecting)return t.isIntersecting=e,!0})},t.prototype.observe=function(t){this.targets.push({target:t,isIntersecting:null}),this.apply()},t.prototype.disconnect=function(){this.targets=[],this.off()},t}();function Mn(t){return!(!p(t,"uk-")&&!p(t,"data-uk-"))&&d(t.replace("data-uk-","").replace("uk-",""))}function Dn(t){this._init(t)}var Hn,Pn,In,zn,Ln,Fn,jn,Vn,Wn;function qn(t,e){if(t)for(var n in t)t[n]._connected&&t[n]._callUpdate(e)}function Rn(t,e){var n={},i=t.args;void 0===i&&(i=[]);var r=t.props;void 0===r&&(r={});var o=t.el;if(!r)return n;for(var s in r){var a=f(s),u=rt(o,a);if(!I(u)){if(u=r[s]===Boolean&&""===u||Gn(r[s],u),"target"===a&&(!u||p(u,"_")))continue;n[s]=u}}var c=_n(rt(o,e),i);for(var l in c){var h=d(l);void 0!==r[h]&&(n[h]=Gn(r[h],c[l]))}return n}function Yn(i,r,o){Object.defineProperty(i,r,{enumerable:!0,get:function(){var t=i._computeds,e=i.$props,n=i.$el;return c(t,r)||(t[r]=(o.get||o).call(i,e,n)),t[r]},set:function(t){var e=i._computeds;e[r]=o.set?o.set.call(i,t):t,I(e[r])&&delete e[r]}})}function Un(e,n,i){S(n)||(n={name:i,handler:n});var t=n.name,r=n.el,o=n.handler,s=n.capture,a=n.passive,u=n.delegate,c=n.filter,l=n.self;r=$(r)?r.call(e):r||e.$el,k(r)?r.forEach(function(t){return Un(e,U({},n,{el:t}),i)}):!r||c&&!c.call(e)||(o=function(e){return function(t){return k(t.detail)?e.apply(void 0,[t].concat(t.detail)):e(t)}}(M(o)?e[o]:h(o,e)),l&&(o=function(e){return function(t){if(t.target===t.currentTarget||t.target===t.current)return e.call(null,t)}}(o)),e._events.push(Nt(r,t,u?M(u)?u:u.call(e):null,o,O(a)?{passive:a,capture:s}:s)))}function Xn(t,e){return t.every(function(t){return!t||!c(t,e)})}function Gn(t,e){return t===Boolean?z(e):t===Number?L(e):"list"===t?W(e):t?t(e):e}Dn.util=Object.freeze({ajax:Yt,getImage:Ut,transition:We,Transition:qe,animate:Ue,Animation:Ge,attr:et,hasAttr:nt,removeAttr:it,data:rt,addClass:Se,removeClass:Ee,removeClasses:Ce,replaceClass:_e,hasClass:Ae,toggleClass:Ne,positionAt:Ke,offset:Ze,position:tn,height:en,width:nn,boxModelAdjust:on,flipPosition:cn,isInView:ln,scrolledOver:hn,scrollTop:fn,offsetPosition:dn,toPx:pn,ready:oe,index:se,getIndex:ae,empty:ue,html:ce,prepend:function(e,t){return(e=ke(e)).hasChildNodes()?de(t,function(t){return e.insertBefore(t,e.firstChild)}):le(e,t)},append:le,before:he,after:fe,remove:pe,wrapAll:ge,wrapInner:ve,unwrap:me,fragment:ye,apply:xe,$:ke,$$:$e,isIE:Xt,isRtl:Gt,hasTouch:Zt,pointerDown:Qt,pointerMove:te,pointerUp:ee,pointerEnter:ne,pointerLeave:ie,pointerCancel:re,on:Nt,off:Bt,once:Ot,trigger:Mt,createEvent:Dt,toEventTargets:zt,isTouch:Lt,getEventPos:Ft,fastdom:wn,isVoidElement:Tt,isVisible:St,selInput:Et,isInput:Ct,filter:_t,within:At,bind:h,hasOwn:c,hyphenate:f,camelize:d,ucfirst:a,startsWith:p,endsWith:g,includes:y,findIndex:function(t,e){return x.call(t,e)},isArray:k,isFunction:$,isObject:T,isPlainObject:S,isWindow:E,isDocument:C,isJQuery:_,isNode:A,isNodeCollection:B,isBoolean:O,isString:M,isNumber:D,isNumeric:H,isEmpty:P,isUndefined:I,toBoolean:z,toNumber:L,toFloat:F,toNode:j,toNodes:V,toList:W,toMs:q,isEqual:R,swap:Y,assign:U,each:X,sortBy:G,uniqueBy:function(t,n){var i=new Set;return t.filter(function(t){var e=t[n];return!i.has(e)&&(i.add(e)||!0)})},clamp:J,noop:K,intersectRect:Z,pointInRect:Q,Dimensions:tt,MouseTracker:kn,mergeOptions:Cn,parseOptions:_n,Player:An,Promise:jt,Deferred:function(){var n=this;this.promise=new jt(function(t,e){n.reject=e,n.resolve=t})},IntersectionObserver:On,query:ot,queryAll:st,find:ut,findAll:ct,matches:mt,closest:bt,parents:yt,escape:kt,css:He,getStyles:Pe,getStyle:Ie,getCssVar:Le,propName:je}),Dn.data="__uikit__",Dn.prefix="uk-",Dn.options={},In=(Hn=Dn).data,Hn.use=function(t){if(!t.installed)return t.call(null,this),t.installed=!0,this},Hn.mixin=function(t,e){(e=(M(e)?Hn.component(e):e)||this).options=Cn(e.options,t)},Hn.extend=function(t){function e(t){this._init(t)}return t=t||{},((e.prototype=Object.create(this.prototype)).constructor=e).options=Cn(this.options,t),e.super=this,e.extend=this.extend,e},Hn.update=function(t,e){(function t(e,n){e&&e!==document.body&&e.parentNode&&(t(e.parentNode,n),n(e.parentNode))})(t=t?j(t):document.body,function(t){return qn(t[In],e)}),xe(t,function(t){return qn(t[In],e)})},Object.defineProperty(Hn,"container",{get:function(){return Pn||document.body},set:function(t){Pn=ke(t)}}),(zn=Dn).prototype._callHook=function(t){var e=this,n=this.$options[t];n&&n.forEach(function(t){return t.call(e)})},zn.prototype._callConnected=function(){this._connected||(this._data={},this._computeds={},this._initProps(),this._callHook("beforeConnect"),this._connected=!0,this._initEvents(),this._initObserver(),this._callHook("connected"),this._callUpdate())},zn.prototype._callDisconnected=function(){this._connected&&(this._callHook("beforeDisconnect"),this._observer&&(this._observer.disconnect(),this._observer=null),this._unbindEvents(),this._callHook("disconnected"),this._connected=!1)},zn.prototype._callUpdate=function(t){var o=this;void 0===t&&(t="update");var s=t.type||t;y(["update","resize"],s)&&this._callWatches();var e=this.$options.update,n=this._frames,a=n.reads,u=n.writes;e&&e.forEach(function(t,e){var n=t.read,i=t.write,r=t.events;("update"===s||y(r,s))&&(n&&!y(wn.reads,a[e])&&(a[e]=wn.read(function(){var t=o._connected&&n.call(o,o._data,s);!1===t&&i?wn.clear(u[e]):S(t)&&U(o._data,t)})),i&&!y(wn.writes,u[e])&&(u[e]=wn.write(function(){return o._connected&&i.call(o,o._data,s)})))})},Fn=0,(Ln=Dn).prototype._init=function(t){(t=t||{}).data=function(t,e){var n=t.data,i=(t.el,e.args),r=e.props;if(void 0===r&&(r={}),n=k(n)?P(i)?void 0:n.slice(0,i.length).reduce(function(t,e,n){return S(e)?U(t,e):t[i[n]]=e,t},{}):n)for(var o in n)I(n[o])?delete n[o]:n[o]=r[o]?Gn(r[o],n[o]):n[o];return n}(t,this.constructor.options),this.$options=Cn(this.constructor.options,t,this),this.$el=null,this.$props={},this._frames={reads:{},writes:{}},this._events=[],this._uid=Fn++,this._initData(),this._initMethods(),this._initComputeds(),this._callHook("created"),t.el&&this.$mount(t.el)},Ln.prototype._initData=function(){var t=this.$options.data;for(var e in void 0===t&&(t={}),t)this.$props[e]=this[e]=t[e]},Ln.prototype._initMethods=function(){var t=this.$options.methods;if(t)for(var e in t)this[e]=h(t[e],this)},Ln.prototype._initComputeds=function(){var t=this.$options.computed;if(this._computeds={},t)for(var e in t)Yn(this,e,t[e])},Ln.prototype._callWatches=function(){var t=this.$options.computed,e=this._computeds;for(var n in e){var i=e[n];delete e[n],t[n].watch&&!R(i,this[n])&&t[n].watch.call(this,this[n],i)}},Ln.prototype._initProps=function(t){var e;for(e in t=t||Rn(this.$options,this.$name))I(t[e])||(this.$props[e]=t[e]);var n=[this.$options.computed,this.$options.methods];for(e in this.$props)e in t&&Xn(n,e)&&(this[e]=this.$props[e])},Ln.prototype._initEvents=function(){var n=this,t=this.$options.events;t&&t.forEach(function(t){if(c(t,"handler"))Un(n,t);else for(var e in t)Un(n,t[e],e)})},Ln.prototype._unbindEvents=function(){this._events.forEach(function(t){return t()}),this._events=[]},Ln.prototype._initObserver=function(){var n=this,t=this.$options,i=t.attrs,e=t.props,r=t.el;if(!this._observer&&e&&!1!==i){i=k(i)?i:Object.keys(e),this._observer=new MutationObserver(function(){var e=Rn(n.$options,n.$name);i.some(function(t){return!I(e[t])&&e[t]!==n.$props[t]})&&n.$reset()});var o=i.map(function(t){return f(t)}).concat(this.$name);this._observer.observe(r,{attributes:!0,attributeFilter:o.concat(o.map(function(t){return"data-"+t}))})}},Vn=(jn=Dn).data,Wn={},jn.component=function(s,t){if(!t)return S(Wn[s])&&(Wn[s]=jn.extend(Wn[s])),Wn[s];jn[s]=function(t,n){for(var e=arguments.length,i=Array(e);e--;)i[e]=arguments[e];var r=jn.component(s);return S(t)?new r({data:t}):r.options.functional?new r({data:[].concat(i)}):t&&t.nodeType?o(t):$e(t).map(o)[0];function o(t){var e=jn.getComponent(t,s);if(e){if(!n)return e;e.$destroy()}return new r({el:t,data:n})}};var e=S(t)?U({},t):t.options;if(e.name=s,e.install&&e.install(jn,e,s),jn._initialized&&!e.functional){var n=f(s);wn.read(function(){return jn[s]("[uk-"+n+"],[data-uk-"+n+"]")})}return Wn[s]=S(t)?e:t},jn.getComponents=function(t){return t&&t[Vn]||{}},jn.getComponent=function(t,e){return jn.getComponents(t)[e]},jn.connect=function(t){if(t[Vn])for(var e in t[Vn])t[Vn][e]._callConnected();for(var n=0;n<t.attributes.length;n++){var i=Mn(t.attributes[n].name);i&&i in Wn&&jn[i](t)}},jn.disconnect=function(t){for(var e in t[Vn])t[Vn][e]._callDisconnected()},function(i){var r=i.data;i.prototype.$mount=function(t){var e=this.$options.name;t[r]||(t[r]={}),t[r][e]||((t[r][e]=this).$el=this.$options.el=this.$options.el||t,At(t,document)&&this._callConnected())},i.prototype.$emit=function(t){this._callUpdate(t)},i.prototype.$reset=function(){this._callDisconnected(),this._callConnected()},i.prototype.$destroy=function(t){void 0===t&&(t=!1);var e=this.$options,n=e.el,i=e.name;n&&this._callDisconnected(),this._callHook("destroy"),n&&n[r]&&(delete n[r][i],P(n[r])||delete n[r],t&&pe(this.$el))},i.prototype.$create=function(t,e,n){return i[t](e,n)},i.prototype.$update=i.update,i.prototype.$getComponent=i.getComponent;var e={};Object.defineProperties(i.prototype,{$container:Object.getOwnPropertyDescriptor(i,"container"),$name:{get:function(){var t=this.$options.name;return e[t]||(e[t]=i.prefix+f(t)),e[t]}}})}(Dn);var Jn={connected:function(){!Ae(this.$el,this.$name)&&Se(this.$el,this.$name)}},Kn={props:{cls:Boolean,animation:"list",duration:Number,origin:String,transition:String,queued:Boolean},data:{cls:!1,animation:[!1],duration:200,origin:!1,transition:"linear",queued:!1,initProps:{overflow:"",height:"",paddingTop:"",paddingBottom:"",marginTop:"",marginBottom:""},hideProps:{overflow:"hidden",height:0,paddingTop:0,paddingBottom:0,marginTop:0,marginBottom:0}},computed:{hasAnimation:function(t){return!!t.animation[0]},hasTransition:function(t){var e=t.animation;return this.hasAnimation&&!0===e[0]}},methods:{toggleElement:function(c,l,h){var f=this;return new jt(function(t){c=V(c);function e(t){return jt.all(t.map(function(t){return f._toggleElement(t,l,h)}))}var n,i=c.filter(function(t){return f.isToggled(t)}),r=c.filter(function(t){return!y(i,t)});if(f.queued&&I(h)&&I(l)&&f.hasAnimation&&!(c.length<2)){var o=document.body,s=o.scrollTop,a=i[0],u=Ge.inProgress(a)&&Ae(a,"uk-animation-leave")||qe.inProgress(a)&&"0px"===a.style.height;n=e(i),u||(n=n.then(function(){var t=e(r);return o.scrollTop=s,t}))}else n=e(r.concat(i));n.then(t,K)})},toggleNow:function(e,n){var i=this;return new jt(function(t){return jt.all(V(e).map(function(t){return i._toggleElement(t,n,!1)})).then(t,K)})},isToggled:function(t){var e=V(t||this.$el);return this.cls?Ae(e,this.cls.split(" ")[0]):!nt(e,"hidden")},updateAria:function(t){!1===this.cls&&et(t,"aria-hidden",!this.isToggled(t))},_toggleElement:function(t,e,n){var i=this;if(e=O(e)?e:Ge.inProgress(t)?Ae(t,"uk-animation-leave"):qe.inProgress(t)?"0px"===t.style.height:!this.isToggled(t),!Mt(t,"before"+(e?"show":"hide"),[this]))return jt.reject();var r=($(n)?n:!1!==n&&this.hasAnimation?this.hasTransition?function(t){var s=t.isToggled,a=t.duration,u=t.initProps,c=t.hideProps,l=t.transition,h=t._toggle;return function(t,e){var n=qe.inProgress(t),i=t.hasChildNodes?F(He(t.firstElementChild,"marginTop"))+F(He(t.lastElementChild,"marginBottom")):0,r=St(t)?en(t)+(n?0:i):0;qe.cancel(t),s(t)||h(t,!0),en(t,""),wn.flush();var o=en(t)+(n?0:i);return en(t,r),(e?qe.start(t,U({},u,{overflow:"hidden",height:o}),Math.round(a*(1-r/o)),l):qe.start(t,c,Math.round(a*(r/o)),l).then(function(){return h(t,!1)})).then(function(){return He(t,u)})}}(this):function(t){var n=t.animation,i=t.duration,r=t.origin,o=t._toggle;return function(t,e){return Ge.cancel(t),e?(o(t,!0),Ge.in(t,n[0],i,r)):Ge.out(t,n[1]||n[0],i,r).then(function(){return o(t,!1)})}}(this):this._toggle)(t,e);Mt(t,e?"show":"hide",[this]);function o(){Mt(t,e?"shown":"hidden",[i]),i.$update(t)}return r?r.then(o):jt.resolve(o())},_toggle:function(t,e){var n;t&&(e=Boolean(e),this.cls?(n=y(this.cls," ")||e!==Ae(t,this.cls))&&Ne(t,this.cls,y(this.cls," ")?void 0:e):(n=e===nt(t,"hidden"))&&et(t,"hidden",e?null:""),$e("[autofocus]",t).some(function(t){return St(t)?t.focus()||!0:t.blur()}),this.updateAria(t),n&&this.$update(t))}}};var Zn={mixins:[Jn,Kn],props:{targets:String,active:null,collapsible:Boolean,multiple:Boolean,toggle:String,content:String,transition:String},data:{targets:"> *",active:!1,animation:[!0],collapsible:!0,multiple:!1,clsOpen:"uk-open",toggle:"> .uk-accordion-title",content:"> .uk-accordion-content",transition:"ease"},computed:{items:function(t,e){return $e(t.targets,e)}},events:[{name:"click",delegate:function(){return this.targets+" "+this.$props.toggle},handler:function(t){t.preventDefault(),this.toggle(se($e(this.targets+" "+this.$props.toggle,this.$el),t.current))}}],connected:function(){if(!1!==this.active){var t=this.items[Number(this.active)];t&&!Ae(t,this.clsOpen)&&this.toggle(t,!1)}},update:function(){var e=this;this.items.forEach(function(t){return e._toggle(ke(e.content,t),Ae(t,e.clsOpen))});var t=!this.collapsible&&!Ae(this.items,this.clsOpen)&&this.items[0];t&&this.toggle(t,!1)},methods:{toggle:function(r,o){var s=this,t=ae(r,this.items),a=_t(this.items,"."+this.clsOpen);(r=this.items[t])&&[r].concat(!this.multiple&&!y(a,r)&&a||[]).forEach(function(t){var e=t===r,n=e&&!Ae(t,s.clsOpen);if(n||!e||s.collapsible||!(a.length<2)){Ne(t,s.clsOpen,n);var i=t._wrapper?t._wrapper.firstElementChild:ke(s.content,t);t._wrapper||(t._wrapper=ge(i,"<div>"),et(t._wrapper,"hidden",n?"":null)),s._toggle(i,!0),s.toggleElement(t._wrapper,n,o).then(function(){Ae(t,s.clsOpen)===n&&(n||s._toggle(i,!1),t._wrapper=null,me(i))})}})}}},Qn={mixins:[Jn,Kn],args:"animation",props:{close:String},data:{animation:[!0],selClose:".uk-alert-close",duration:150,hideProps:U({opacity:0},Kn.data.hideProps)},events:[{name:"click",delegate:function(){return this.selClose},handler:function(t){t.preventDefault(),this.close()}}],methods:{close:function(){var t=this;this.toggleElement(this.$el).then(function(){return t.$destroy(!0)})}}};function ti(r){var e;oe(function(){var n;r.update(),Nt(window,"load resize",function(){return r.update(null,"resize")}),Nt(document,"loadedmetadata load",function(t){var e=t.target;return r.update(e,"resize")},!0),Nt(window,"scroll",function(t){if(!n){n=!0,wn.write(function(){return n=!1});var e=t.target;r.update(1!==e.nodeType?document.body:e,t.type)}},{passive:!0,capture:!0});var i=0;Nt(document,"animationstart",function(t){var e=t.target;(He(e,"animationName")||"").match(/^uk-.*(left|right)/)&&(i++,He(document.body,"overflowX","hidden"),setTimeout(function(){--i||He(document.body,"overflowX","")},q(He(e,"animationDuration"))+100))},!0)}),Nt(document,Qt,function(t){if(e&&e(),Lt(t)){var r=Ft(t),o="tagName"in t.target?t.target:t.target.parentNode;e=Ot(document,ee,function(t){var e=Ft(t),n=e.x,i=e.y;(o&&n&&100<Math.abs(r.x-n)||i&&100<Math.abs(r.y-i))&&setTimeout(function(){Mt(o,"swipe"),Mt(o,"swipe"+function(t,e,n,i){return Math.abs(t-n)>=Math.abs(e-i)?0<t-n?"Left":"Right":0<e-i?"Up":"Down"}(r.x,r.y,n,i))})})}},{passive:!0})}var ei,ni,ii={args:"autoplay",props:{automute:Boolean,autoplay:Boolean},data:{automute:!1,autoplay:!0},computed:{inView:function(t){return"inview"===t.autoplay}},connected:function(){this.inView&&!nt(this.$el,"preload")&&(this.$el.preload="none"),this.player=new An(this.$el),this.automute&&this.player.mute()},update:{read:function(){return!!this.player&&{visible:St(this.$el)&&"hidden"!==He(this.$el,"visibility"),inView:this.inView&&ln(this.$el)}},write:function(t){var e=t.visible,n=t.inView;!e||this.inView&&!n?this.player.pause():(!0===this.autoplay||this.inView&&n)&&this.player.play()},events:["resize","scroll"]}},ri={mixins:[Jn,ii],props:{width:Number,height:Number},data:{automute:!0},update:{read:function(){var t=this.$el;if(!St(t))return!1;var e=t.parentNode;return{height:e.offsetHeight,width:e.offsetWidth}},write:function(t){var e=t.height,n=t.width,i=this.$el,r=this.width||i.naturalWidth||i.videoWidth||i.clientWidth,o=this.height||i.naturalHeight||i.videoHeight||i.clientHeight;r&&o&&He(i,tt.cover({width:r,height:o},{width:n+(n%2?1:0),height:e+(e%2?1:0)}))},events:["resize"]}},oi={mixins:[{props:{pos:String,offset:null,flip:Boolean,clsPos:String},data:{pos:"bottom-"+(Gt?"right":"left"),flip:!0,offset:!1,clsPos:""},computed:{pos:function(t){var e=t.pos;return(e+(y(e,"-")?"":"-center")).split("-")},dir:function(){return this.pos[0]},align:function(){return this.pos[1]}},methods:{positionAt:function(t,e,n){var i;Ce(t,this.clsPos+"-(top|bottom|left|right)(-[a-z]+)?"),He(t,{top:"",left:""});var r=this.offset,o=this.getAxis();H(r)||(r=(i=ke(r))?Ze(i)["x"===o?"left":"top"]-Ze(e)["x"===o?"right":"bottom"]:0);var s=Ke(t,e,"x"===o?cn(this.dir)+" "+this.align:this.align+" "+cn(this.dir),"x"===o?this.dir+" "+this.align:this.align+" "+this.dir,"x"===o?""+("left"===this.dir?-r:r):" "+("top"===this.dir?-r:r),null,this.flip,n).target,a=s.x,u=s.y;this.dir="x"===o?a:u,this.align="x"===o?u:a,Ne(t,this.clsPos+"-"+this.dir+"-"+this.align,!1===this.offset)},getAxis:function(){return"top"===this.dir||"bottom"===this.dir?"y":"x"}}},Kn],args:"pos",props:{mode:"list",toggle:Boolean,boundary:Boolean,boundaryAlign:Boolean,delayShow:Number,delayHide:Number,clsDrop:String},data:{mode:["click","hover"],toggle:"- *",boundary:window,boundaryAlign:!1,delayShow:0,delayHide:800,clsDrop:!1,hoverIdle:200,animation:["uk-animation-fade"],cls:"uk-open"},computed:{boundary:function(t,e){return ot(t.boundary,e)},clsDrop:function(t){return t.clsDrop||"uk-"+this.$options.name},clsPos:function(){return this.clsDrop}},created:function(){this.tracker=new kn},connected:function(){Se(this.$el,this.clsDrop);var t=this.$props.toggle;this.toggle=t&&this.$create("toggle",ot(t,this.$el),{target:this.$el,mode:this.mode}),!this.toggle&&Mt(this.$el,"updatearia")},events:[{name:"click",delegate:function(){return"."+this.clsDrop+"-close"},handler:function(t){t.preventDefault(),this.hide(!1)}},{name:"click",delegate:function(){return'a[href^="#"]'},handler:function(t){var e=t.target.hash;e||t.preventDefault(),e&&At(e,this.$el)||this.hide(!1)}},{name:"beforescroll",handler:function(){this.hide(!1)}},{name:"toggle",self:!0,handler:function(t,e){t.preventDefault(),this.isToggled()?this.hide(!1):this.show(e,!1)}},{name:ne,filter:function(){return y(this.mode,"hover")},handler:function(t){Lt(t)||(ei&&ei!==this&&ei.toggle&&y(ei.toggle.mode,"hover")&&!At(t.target,ei.toggle.$el)&&!Q({x:t.pageX,y:t.pageY},Ze(ei.$el))&&ei.hide(!1),t.preventDefault(),this.show(this.toggle))}},{name:"toggleshow",handler:function(t,e){e&&!y(e.target,this.$el)||(t.preventDefault(),this.show(e||this.toggle))}},{name:"togglehide "+ie,handler:function(t,e){Lt(t)||e&&!y(e.target,this.$el)||(t.preventDefault(),this.toggle&&y(this.toggle.mode,"hover")&&this.hide())}},{name:"beforeshow",self:!0,handler:function(){this.clearTimers(),Ge.cancel(this.$el),this.position()}},{name:"show",self:!0,handler:function(){this.tracker.init(),Mt(this.$el,"updatearia"),function(){if(ni)return;ni=!0,Nt(document,ee,function(t){var e,n=t.target,i=t.defaultPrevented;if(!i)for(;ei&&ei!==e&&!At(n,ei.$el)&&(!ei.toggle||!At(n,ei.toggle.$el));)(e=ei).hide(!1)})}()}},{name:"beforehide",self:!0,handler:function(){this.clearTimers()}},{name:"hide",handler:function(t){var e=t.target;this.$el===e?(ei=this.isActive()?null:ei,Mt(this.$el,"updatearia"),this.tracker.cancel()):ei=null===ei&&At(e,this.$el)&&this.isToggled()?this:ei}},{name:"updatearia",self:!0,handler:function(t,e){t.preventDefault(),this.updateAria(this.$el),(e||this.toggle)&&(et((e||this.toggle).$el,"aria-expanded",this.isToggled()?"true":"false"),Ne(this.toggle.$el,this.cls,this.isToggled()))}}],update:{write:function(){this.isToggled()&&!Ge.inProgress(this.$el)&&this.position()},events:["resize"]},methods:{show:function(e,n){var i=this;void 0===n&&(n=!0);function r(){return!i.isToggled()&&i.toggleElement(i.$el,!0)}function t(){if(i.toggle=e||i.toggle,i.clearTimers(),!i.isActive())if(n&&ei&&ei!==i&&ei.isDelaying)i.showTimer=setTimeout(i.show,10);else{if(i.isParentOf(ei)){if(!ei.hideTimer)return;ei.hide(!1)}else if(ei&&i.isChildOf(ei))ei.clearTimers();else if(ei&&!i.isChildOf(ei)&&!i.isParentOf(ei))for(var t;ei&&ei!==t&&!i.isChildOf(ei);)(t=ei).hide(!1);n&&i.delayShow?i.showTimer=setTimeout(r,i.delayShow):r(),ei=i}}e&&this.toggle&&e.$el!==this.toggle.$el?(Ot(this.$el,"hide",t),this.hide(!1)):t()},hide:function(t){var e=this;void 0===t&&(t=!0);function n(){return e.toggleNow(e.$el,!1)}this.clearTimers(),this.isDelaying=this.tracker.movesTo(this.$el),t&&this.isDelaying?this.hideTimer=setTimeout(this.hide,this.hoverIdle):t&&this.delayHide?this.hideTimer=setTimeout(n,this.delayHide):n()},clearTimers:function(){clearTimeout(this.showTimer),clearTimeout(this.hideTimer),this.showTimer=null,this.hideTimer=null,this.isDelaying=!1},isActive:function(){return ei===this},isChildOf:function(t){return t&&t!==this&&At(this.$el,t.$el)},isParentOf:function(t){return t&&t!==this&&At(t.$el,this.$el)},position:function(){Ce(this.$el,this.clsDrop+"-(stack|boundary)"),He(this.$el,{top:"",left:"",display:"block"}),Ne(this.$el,this.clsDrop+"-boundary",this.boundaryAlign);var t=Ze(this.boundary),e=this.boundaryAlign?t:Ze(this.toggle.$el);if("justify"===this.align){var n="y"===this.getAxis()?"width":"height";He(this.$el,n,e[n])}else this.$el.offsetWidth>Math.max(t.right-e.left,e.right-t.left)&&Se(this.$el,this.clsDrop+"-stack");this.positionAt(this.$el,this.boundaryAlign?this.boundary:this.toggle.$el,this.boundary),He(this.$el,"display","")}}};var si={extends:oi},ai={mixins:[Jn],args:"target",props:{target:Boolean},data:{target:!1},computed:{input:function(t,e){return ke(Et,e)},state:function(){return this.input.nextElementSibling},target:function(t,e){var n=t.target;return n&&(!0===n&&this.input.parentNode===e&&this.input.nextElementSibling||ot(n,e))}},update:function(){var t=this.target,e=this.input;if(t){var n,i=Ct(t)?"value":"textContent",r=t[i],o=e.files&&e.files[0]?e.files[0].name:mt(e,"select")&&(n=$e("option",e).filter(function(t){return t.selected})[0])?n.textContent:e.value;r!==o&&(t[i]=o)}},events:{change:function(){this.$emit()}}},ui={update:{read:function(t){var e=ln(this.$el);if(!e||t.isInView===e)return!1;t.isInView=e},write:function(){this.$el.src=this.$el.src},events:["scroll","resize"]}},ci={props:{margin:String,firstColumn:Boolean},data:{margin:"uk-margin-small-top",firstColumn:"uk-first-column"},update:{read:function(t){var e=this.$el.children;if(!e.length||!St(this.$el))return t.rows=[[]];t.rows=li(e),t.stacks=!t.rows.some(function(t){return 1<t.length})},write:function(t){var i=this;t.rows.forEach(function(t,n){return t.forEach(function(t,e){Ne(t,i.margin,0!==n),Ne(t,i.firstColumn,0===e)})})},events:["resize"]}};function li(t){for(var e=[[]],n=0;n<t.length;n++){var i=t[n],r=hi(i);if(r.height)for(var o=e.length-1;0<=o;o--){var s=e[o];if(!s[0]){s.push(i);break}var a=void 0;if(a=s[0].offsetParent===i.offsetParent?hi(s[0]):(r=hi(i,!0),hi(s[0],!0)),r.top>=a.bottom-1){e.push([i]);break}if(r.bottom>a.top){if(r.left<a.left&&!Gt){s.unshift(i);break}s.push(i);break}if(0===o){e.unshift([i]);break}}}return e}function hi(t,e){var n;void 0===e&&(e=!1);var i=t.offsetTop,r=t.offsetLeft,o=t.offsetHeight;return e&&(i=(n=dn(t))[0],r=n[1]),{top:i,left:r,height:o,bottom:i+o}}var fi={extends:ci,mixins:[Jn],name:"grid",props:{masonry:Boolean,parallax:Number},data:{margin:"uk-grid-margin",clsStack:"uk-grid-stack",masonry:!1,parallax:0},computed:{length:function(t,e){return e.children.length},parallax:function(t){var e=t.parallax;return e&&this.length?Math.abs(e):""}},connected:function(){this.masonry&&Se(this.$el,"uk-flex-top uk-flex-wrap-top")},update:[{read:function(t){var r=t.rows;(this.masonry||this.parallax)&&(r=r.map(function(t){return G(t,"offsetLeft")}),Gt&&r.map(function(t){return t.reverse()}));var e=r.some(function(t){return t.some(qe.inProgress)}),n=!1,i="";if(this.masonry&&this.length){var o=0;n=r.reduce(function(n,t,i){return n[i]=t.map(function(t,e){return 0===i?0:F(n[i-1][e])+(o-F(r[i-1][e]&&r[i-1][e].offsetHeight))}),o=t.reduce(function(t,e){return Math.max(t,e.offsetHeight)},0),n},[]),i=function(t){return Math.max.apply(Math,t.reduce(function(n,t){return t.forEach(function(t,e){return n[e]=(n[e]||0)+t.offsetHeight}),n},[]))}(r)+function(t,e){var n=V(t.children),i=n.filter(function(t){return Ae(t,e)})[0];return F(i?He(i,"marginTop"):He(n[0],"paddingLeft"))}(this.$el,this.margin)*(r.length-1)}return{rows:r,translates:n,height:!e&&i}},write:function(t){var e=t.stacks,n=t.height;Ne(this.$el,this.clsStack,e),He(this.$el,"paddingBottom",this.parallax),!1!==n&&He(this.$el,"height",n)},events:["resize"]},{read:function(t){var e=t.height;return{scrolled:!!this.parallax&&hn(this.$el,e?e-en(this.$el):0)*this.parallax}},write:function(t){var e=t.rows,i=t.scrolled,r=t.translates;(!1!==i||r)&&e.forEach(function(t,n){return t.forEach(function(t,e){return He(t,"transform",i||r?"translateY("+((r&&-r[n][e])+(i?e%2?i:i/8:0))+"px)":"")})})},events:["scroll","resize"]}]};var di=Xt?{data:{selMinHeight:!1,forceHeight:!1},computed:{elements:function(t,e){var n=t.selMinHeight;return n?$e(n,e):[e]}},update:[{read:function(){He(this.elements,"height","")},order:-5,events:["resize"]},{write:function(){var n=this;this.elements.forEach(function(t){var e=F(He(t,"minHeight"));e&&(n.forceHeight||Math.round(e+on("height",t,"content-box"))>=t.offsetHeight)&&He(t,"height",e)})},order:5,events:["resize"]}]}:{},pi={mixins:[di],args:"target",props:{target:String,row:Boolean},data:{target:"> *",row:!0,forceHeight:!0},computed:{elements:function(t,e){return $e(t.target,e)}},update:{read:function(){return{rows:(this.row?li(this.elements):[this.elements]).map(gi)}},write:function(t){t.rows.forEach(function(t){var n=t.heights;return t.elements.forEach(function(t,e){return He(t,"minHeight",n[e])})})},events:["resize"]}};function gi(t){var e;if(t.length<2)return{heights:[""],elements:t};var n=vi(t),i=n.heights,r=n.max,o=t.some(function(t){return t.style.minHeight}),s=t.some(function(t,e){return!t.style.minHeight&&i[e]<r});return o&&s&&(He(t,"minHeight",""),e=vi(t),i=e.heights,r=e.max),{heights:i=t.map(function(t,e){return i[e]===r&&F(t.style.minHeight).toFixed(2)!==r.toFixed(2)?"":r}),elements:t}}function vi(t){var e=t.map(function(t){return Ze(t).height-on("height",t,"content-box")});return{heights:e,max:Math.max.apply(null,e)}}var mi={mixins:[di],props:{expand:Boolean,offsetTop:Boolean,offsetBottom:Boolean,minHeight:Number},data:{expand:!1,offsetTop:!1,offsetBottom:!1,minHeight:0},update:{read:function(){var t="",e=on("height",this.$el,"content-box");if(this.expand)t=en(window)-(wi(document.documentElement)-wi(this.$el))-e||"";else{if(t="calc(100vh",this.offsetTop){var n=Ze(this.$el).top;t+=n<en(window)/2?" - "+n+"px":""}!0===this.offsetBottom?t+=" - "+wi(this.$el.nextElementSibling)+"px":H(this.offsetBottom)?t+=" - "+this.offsetBottom+"vh":this.offsetBottom&&g(this.offsetBottom,"px")?t+=" - "+F(this.offsetBottom)+"px":M(this.offsetBottom)&&(t+=" - "+wi(ot(this.offsetBottom,this.$el))+"px"),t+=(e?" - "+e+"px":"")+")"}return{minHeight:t}},write:function(t){var e=t.minHeight;He(this.$el,{minHeight:e}),this.minHeight&&F(He(this.$el,"minHeight"))<this.minHeight&&He(this.$el,"minHeight",this.minHeight)},events:["resize"]}};function wi(t){return t&&t.offsetHeight||0}var bi={args:"src",props:{id:Boolean,icon:String,src:String,style:String,width:Number,height:Number,ratio:Number,class:String,strokeAnimation:Boolean,attributes:"list"},data:{ratio:1,include:["style","class"],class:"",strokeAnimation:!1},connected:function(){var t,e=this;if(this.class+=" uk-svg",!this.icon&&y(this.src,"#")){var n=this.src.split("#");1<n.length&&(t=n,this.src=t[0],this.icon=t[1])}this.svg=this.getSvg().then(function(t){return e.applyAttributes(t),e.svgEl=function(t,e){{if(Tt(e)||"CANVAS"===e.tagName){et(e,"hidden",!0);var n=e.nextElementSibling;return $i(t,n)?n:fe(e,t)}var i=e.lastElementChild;return $i(t,i)?i:le(e,t)}}(t,e.$el)},K)},disconnected:function(){var e=this;Tt(this.$el)&&et(this.$el,"hidden",null),this.svg&&this.svg.then(function(t){return(!e._connected||t!==e.svgEl)&&pe(t)},K),this.svg=this.svgEl=null},update:{read:function(){return!!(this.strokeAnimation&&this.svgEl&&St(this.svgEl))},write:function(){!function(t){var e=function(t){return Math.ceil(Math.max.apply(Math,$e("[stroke]",t).map(function(t){return t.getTotalLength&&t.getTotalLength()||0}).concat([0])))}(t);e&&t.style.setProperty("--uk-animation-stroke",e)}(this.svgEl)},type:["resize"]},methods:{getSvg:function(){var e=this;return function(n){if(yi[n])return yi[n];return yi[n]=new jt(function(e,t){n?p(n,"data:")?e(decodeURIComponent(n.split(",")[1])):Yt(n).then(function(t){return e(t.response)},function(){return t("SVG not found.")}):t()})}(this.src).then(function(t){return function(t,e){e&&y(t,"<symbol")&&(t=function(t,e){if(!ki[t]){var n;for(ki[t]={};n=xi.exec(t);)ki[t][n[3]]='<svg xmlns="http://www.w3.org/2000/svg"'+n[1]+"svg>";xi.lastIndex=0}return ki[t][e]}(t,e)||t);return(t=ke(t.substr(t.indexOf("<svg"))))&&t.hasChildNodes()&&t}(t,e.icon)||jt.reject("SVG not found.")})},applyAttributes:function(n){var i=this;for(var t in this.$options.props)this[t]&&y(this.include,t)&&et(n,t,this[t]);for(var e in this.attributes){var r=this.attributes[e].split(":",2),o=r[0],s=r[1];et(n,o,s)}this.id||it(n,"id");var a=["width","height"],u=[this.width,this.height];u.some(function(t){return t})||(u=a.map(function(t){return et(n,t)}));var c=et(n,"viewBox");c&&!u.some(function(t){return t})&&(u=c.split(" ").slice(2)),u.forEach(function(t,e){(t=(0|t)*i.ratio)&&et(n,a[e],t),t&&!u[1^e]&&it(n,a[1^e])}),et(n,"data-svg",this.icon||this.src)}}},yi={};var xi=/<symbol(.*?id=(['"])(.*?)\2[^]*?<\/)symbol>/g,ki={};function $i(t,e){return et(t,"data-svg")===et(e,"data-svg")}var Ti={},Si={spinner:'<svg width="30" height="30" viewBox="0 0 30 30" xmlns="http://www.w3.org/2000/svg"><circle fill="none" stroke="#000" cx="15" cy="15" r="14"/></svg>',totop:'<svg width="18" height="10" viewBox="0 0 18 10" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="1.2" points="1 9 9 1 17 9 "/></svg>',marker:'<svg width="20" height="20" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><rect x="9" y="4" width="1" height="11"/><rect x="4" y="9" width="11" height="1"/></svg>',"close-icon":'<svg width="14" height="14" viewBox="0 0 14 14" xmlns="http://www.w3.org/2000/svg"><line fill="none" stroke="#000" stroke-width="1.1" x1="1" y1="1" x2="13" y2="13"/><line fill="none" stroke="#000" stroke-width="1.1" x1="13" y1="1" x2="1" y2="13"/></svg>',"close-large":'<svg width="20" height="20" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><line fill="none" stroke="#000" stroke-width="1.4" x1="1" y1="1" x2="19" y2="19"/><line fill="none" stroke="#000" stroke-width="1.4" x1="19" y1="1" x2="1" y2="19"/></svg>',"navbar-toggle-icon":'<svg width="20" height="20" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><rect y="9" width="20" height="2"/><rect y="3" width="20" height="2"/><rect y="15" width="20" height="2"/></svg>',"overlay-icon":'<svg width="40" height="40" viewBox="0 0 40 40" xmlns="http://www.w3.org/2000/svg"><rect x="19" y="0" width="1" height="40"/><rect x="0" y="19" width="40" height="1"/></svg>',"pagination-next":'<svg width="7" height="12" viewBox="0 0 7 12" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="1.2" points="1 1 6 6 1 11"/></svg>',"pagination-previous":'<svg width="7" height="12" viewBox="0 0 7 12" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="1.2" points="6 1 1 6 6 11"/></svg>',"search-icon":'<svg width="20" height="20" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><circle fill="none" stroke="#000" stroke-width="1.1" cx="9" cy="9" r="7"/><path fill="none" stroke="#000" stroke-width="1.1" d="M14,14 L18,18 L14,14 Z"/></svg>',"search-large":'<svg width="40" height="40" viewBox="0 0 40 40" xmlns="http://www.w3.org/2000/svg"><circle fill="none" stroke="#000" stroke-width="1.8" cx="17.5" cy="17.5" r="16.5"/><line fill="none" stroke="#000" stroke-width="1.8" x1="38" y1="39" x2="29" y2="30"/></svg>',"search-navbar":'<svg width="24" height="24" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><circle fill="none" stroke="#000" stroke-width="1.1" cx="10.5" cy="10.5" r="9.5"/><line fill="none" stroke="#000" stroke-width="1.1" x1="23" y1="23" x2="17" y2="17"/></svg>',"slidenav-next":'<svg width="14px" height="24px" viewBox="0 0 14 24" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="1.4" points="1.225,23 12.775,12 1.225,1 "/></svg>',"slidenav-next-large":'<svg width="25px" height="40px" viewBox="0 0 25 40" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="2" points="4.002,38.547 22.527,20.024 4,1.5 "/></svg>',"slidenav-previous":'<svg width="14px" height="24px" viewBox="0 0 14 24" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="1.4" points="12.775,1 1.225,12 12.775,23 "/></svg>',"slidenav-previous-large":'<svg width="25px" height="40px" viewBox="0 0 25 40" xmlns="http://www.w3.org/2000/svg"><polyline fill="none" stroke="#000" stroke-width="2" points="20.527,1.5 2,20.024 20.525,38.547 "/></svg>'},Ei={install:function(r){r.icon.add=function(t,e){var n,i=M(t)?((n={})[t]=e,n):t;X(i,function(t,e){Si[e]=t,delete Ti[e]}),r._initialized&&xe(document.body,function(t){return X(r.getComponents(t),function(t){t.$options.isIcon&&t.icon in i&&t.$reset()})})}},mixins:[Jn,bi],args:"icon",props:["icon"],data:{include:[]},isIcon:!0,connected:function(){Se(this.$el,"uk-icon")},methods:{getSvg:function(){var t=function(t){if(!Si[t])return null;Ti[t]||(Ti[t]=ke(Si[t].trim()));return Ti[t].cloneNode(!0)}(function(t){return Gt?Y(Y(t,"left","right"),"previous","next"):t}(this.icon));return t?jt.resolve(t):jt.reject("Icon not found.")}}},Ci={extends:Ei,data:function(t){return{icon:f(t.constructor.options.name)}}},_i={extends:Ci,connected:function(){Se(this.$el,"uk-slidenav")},computed:{icon:function(t,e){var n=t.icon;return Ae(e,"uk-slidenav-large")?n+"-large":n}}},Ai={extends:Ci,computed:{icon:function(t,e){var n=t.icon;return Ae(e,"uk-search-icon")&&yt(e,".uk-search-large").length?"search-large":yt(e,".uk-search-navbar").length?"search-navbar":n}}},Ni={extends:Ci,computed:{icon:function(){return"close-"+(Ae(this.$el,"uk-close-large")?"large":"icon")}}},Bi={extends:Ci,connected:function(){var e=this;this.svg.then(function(t){return 1!==e.ratio&&He(ke("circle",t),"strokeWidth",1/e.ratio)},K)}};var Oi={args:"dataSrc",props:{dataSrc:String,dataSrcset:Boolean,sizes:String,width:Number,height:Number,offsetTop:String,offsetLeft:String,target:String},data:{dataSrc:"",dataSrcset:!1,sizes:!1,width:!1,height:!1,offsetTop:"50vh",offsetLeft:0,target:!1},computed:{cacheKey:function(t){var e=t.dataSrc;return this.$name+"."+e},width:function(t){var e=t.width,n=t.dataWidth;return e||n},height:function(t){var e=t.height,n=t.dataHeight;return e||n},sizes:function(t){var e=t.sizes,n=t.dataSizes;return e||n},isImg:function(t,e){return Li(e)},target:{get:function(t){var e=t.target;return[this.$el].concat(st(e,this.$el))},watch:function(){this.observe()}},offsetTop:function(t){return pn(t.offsetTop,"height")},offsetLeft:function(t){return pn(t.offsetLeft,"width")}},connected:function(){ji[this.cacheKey]?Mi(this.$el,ji[this.cacheKey]||this.dataSrc,this.dataSrcset,this.sizes):this.isImg&&this.width&&this.height&&Mi(this.$el,function(t,e,n){var i;n&&(i=tt.ratio({width:t,height:e},"width",pn(Hi(n))),t=i.width,e=i.height);return'data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="'+t+'" height="'+e+'"></svg>'}(this.width,this.height,this.sizes)),this.observer=new On(this.load,{rootMargin:this.offsetTop+"px "+this.offsetLeft+"px"}),requestAnimationFrame(this.observe)},disconnected:function(){this.observer.disconnect()},update:{read:function(t){var e=this,n=t.image;if(n||"complete"!==document.readyState||this.load(this.observer.takeRecords()),this.isImg)return!1;n&&n.then(function(t){return t&&""!==t.currentSrc&&Mi(e.$el,Fi(t))})},write:function(t){if(this.dataSrcset&&1!==window.devicePixelRatio){var e=He(this.$el,"backgroundSize");(e.match(/^(auto\s?)+$/)||F(e)===t.bgSize)&&(t.bgSize=function(t,e){var n=pn(Hi(e)),i=(t.match(zi)||[]).map(F).sort(function(t,e){return t-e});return i.filter(function(t){return n<=t})[0]||i.pop()||""}(this.dataSrcset,this.sizes),He(this.$el,"backgroundSize",t.bgSize+"px"))}},events:["resize"]},methods:{load:function(t){var e=this;t.some(function(t){return t.isIntersecting})&&(this._data.image=Ut(this.dataSrc,this.dataSrcset,this.sizes).then(function(t){return Mi(e.$el,Fi(t),t.srcset,t.sizes),ji[e.cacheKey]=Fi(t),t},K),this.observer.disconnect())},observe:function(){var e=this;!this._data.image&&this._connected&&this.target.forEach(function(t){return e.observer.observe(t)})}}};function Mi(t,e,n,i){if(Li(t))i&&(t.sizes=i),n&&(t.srcset=n),e&&(t.src=e);else if(e){!y(t.style.backgroundImage,e)&&(He(t,"backgroundImage","url("+kt(e)+")"),Mt(t,Dt("load",!1)))}}var Di=/\s*(.*?)\s*(\w+|calc\(.*?\))\s*(?:,|$)/g;function Hi(t){var e,n;for(Di.lastIndex=0;e=Di.exec(t);)if(!e[1]||window.matchMedia(e[1]).matches){e=p(n=e[2],"calc")?n.substring(5,n.length-1).replace(Pi,function(t){return pn(t)}).replace(/ /g,"").match(Ii).reduce(function(t,e){return t+ +e},0):n;break}return e||"100vw"}var Pi=/\d+(?:\w+|%)/g,Ii=/[+-]?(\d+)/g;var zi=/\s+\d+w\s*(?:,|$)/g;function Li(t){return"IMG"===t.tagName}function Fi(t){return t.currentSrc||t.src}var ji,Vi="__test__";try{(ji=window.sessionStorage||{})[Vi]=1,delete ji[Vi]}catch(t){ji={}}var Wi={props:{media:Boolean},data:{media:!1},computed:{matchMedia:function(){var t=function(t){if(M(t))if("@"===t[0]){var e="breakpoint-"+t.substr(1);t=F(Le(e))}else if(isNaN(t))return t;return!(!t||isNaN(t))&&"(min-width: "+t+"px)"}(this.media);return!t||window.matchMedia(t).matches}}};var qi,Ri,Yi={mixins:[Jn,Wi],props:{fill:String},data:{fill:"",clsWrapper:"uk-leader-fill",clsHide:"uk-leader-hide",attrFill:"data-fill"},computed:{fill:function(t){return t.fill||Le("leader-fill-content")}},connected:function(){var t;t=ve(this.$el,'<span class="'+this.clsWrapper+'">'),this.wrapper=t[0]},disconnected:function(){me(this.wrapper.childNodes)},update:{read:function(t){var e=t.changed,n=t.width,i=n;return{width:n=Math.floor(this.$el.offsetWidth/2),fill:this.fill,changed:e||i!==n,hide:!this.matchMedia}},write:function(t){Ne(this.wrapper,this.clsHide,t.hide),t.changed&&(t.changed=!1,et(this.wrapper,this.attrFill,new Array(t.width).join(t.fill)))},events:["resize"]}},Ui={mixins:[Jn,{props:{container:Boolean},data:{container:!0},computed:{container:function(t){var e=t.container;return!0===e&&this.$container||e&&ke(e)}}},Kn],props:{selPanel:String,selClose:String,escClose:Boolean,bgClose:Boolean,stack:Boolean},data:{cls:"uk-open",escClose:!0,bgClose:!0,overlay:!0,stack:!1},computed:{panel:function(t,e){return ke(t.selPanel,e)},transitionElement:function(){return this.panel},bgClose:function(t){return t.bgClose&&this.panel}},beforeDisconnect:function(){this.isToggled()&&this.toggleNow(this.$el,!1)},events:[{name:"click",delegate:function(){return this.selClose},handler:function(t){t.preventDefault(),this.hide()}},{name:"toggle",self:!0,handler:function(t){t.defaultPrevented||(t.preventDefault(),this.toggle())}},{name:"beforeshow",self:!0,handler:function(t){var n=qi&&qi!==this&&qi;qi=this,n?this.stack?this.prev=n:((qi=n).isToggled()?n.hide().then(this.show):Ot(n.$el,"beforeshow hidden",this.show,!1,function(t){var e=t.target;return"hidden"===t.type&&e===n.$el}),t.preventDefault()):function(){if(Ri)return;Ri=[Nt(document,ee,function(t){var e=t.target,n=t.defaultPrevented;!qi||!qi.bgClose||n||qi.overlay&&!At(e,qi.$el)||At(e,qi.panel)||qi.hide()}),Nt(document,"keydown",function(t){27===t.keyCode&&qi&&qi.escClose&&(t.preventDefault(),qi.hide())})]}()}},{name:"show",self:!0,handler:function(){Ae(document.documentElement,this.clsPage)||(this.scrollbarWidth=nn(window)-nn(document),He(document.body,"overflowY",this.scrollbarWidth&&this.overlay?"scroll":"")),Se(document.documentElement,this.clsPage)}},{name:"hide",self:!0,handler:function(){qi&&(qi!==this||this.prev)||(Ri&&Ri.forEach(function(t){return t()}),Ri=null)}},{name:"hidden",self:!0,handler:function(){var t,e=this.prev;if(qi=qi&&qi!==this&&qi||e)for(;e;){if(e.clsPage===this.clsPage){t=!0;break}e=e.prev}else He(document.body,"overflowY","");t||Ee(document.documentElement,this.clsPage)}}],methods:{toggle:function(){return this.isToggled()?this.hide():this.show()},show:function(){var e=this;return this.isToggled()?jt.resolve():this.container&&this.$el.parentNode!==this.container?(le(this.container,this.$el),new jt(function(t){return requestAnimationFrame(function(){return e.show().then(t)})})):this.toggleElement(this.$el,!0,Xi(this))},hide:function(){return this.isToggled()?this.toggleElement(this.$el,!1,Xi(this)):jt.resolve()},getActive:function(){return qi}}};function Xi(t){var r=t.transitionElement,o=t._toggle;return function(n,i){return new jt(function(t,e){return Ot(n,"show hide",function(){n._reject&&n._reject(),n._reject=e,o(n,i),q(He(r,"transitionDuration"))?Ot(r,"transitionend",t,!1,function(t){return t.target===r}):t()})})}}var Gi={install:function(a){a.modal.dialog=function(t,e){var i=a.modal(' <div class="uk-modal"> <div class="uk-modal-dialog">'+t+"</div> </div> ",e);return i.show(),Nt(i.$el,"hidden",function(t){var e=t.target,n=t.currentTarget;e===n&&jt.resolve(function(){return i.$destroy(!0)})}),i},a.modal.alert=function(e,n){return n=U({bgClose:!1,escClose:!1,labels:a.modal.labels},n),new jt(function(t){return Nt(a.modal.dialog(' <div class="uk-modal-body">'+(M(e)?e:ce(e))+'</div> <div class="uk-modal-footer uk-text-right"> <button class="uk-button uk-button-primary uk-modal-close" autofocus>'+n.labels.ok+"</button> </div> ",n).$el,"hide",t)})},a.modal.confirm=function(r,o){return o=U({bgClose:!1,escClose:!0,labels:a.modal.labels},o),new jt(function(e,t){var n=a.modal.dialog(' <form> <div class="uk-modal-body">'+(M(r)?r:ce(r))+'</div> <div class="uk-modal-footer uk-text-right"> <button class="uk-button uk-button-default uk-modal-close" type="button">'+o.labels.cancel+'</button> <button class="uk-button uk-button-primary" autofocus>'+o.labels.ok+"</button> </div> </form> ",o),i=!1;Nt(n.$el,"submit","form",function(t){t.preventDefault(),e(),i=!0,n.hide()}),Nt(n.$el,"hide",function(){i||t()})})},a.modal.prompt=function(t,o,s){return s=U({bgClose:!1,escClose:!0,labels:a.modal.labels},s),new jt(function(e){var n=a.modal.dialog(' <form class="uk-form-stacked"> <div class="uk-modal-body"> <label>'+(M(t)?t:ce(t))+'</label> <input class="uk-input" autofocus> </div> <div class="uk-modal-footer uk-text-right"> <button class="uk-button uk-button-default uk-modal-close" type="button">'+s.labels.cancel+'</button> <button class="uk-button uk-button-primary">'+s.labels.ok+"</button> </div> </form> ",s),i=ke("input",n.$el);i.value=o;var r=!1;Nt(n.$el,"submit","form",function(t){t.preventDefault(),e(i.value),r=!0,n.hide()}),Nt(n.$el,"hide",function(){r||e(null)})})},a.modal.labels={ok:"Ok",cancel:"Cancel"}},mixins:[Ui],data:{clsPage:"uk-modal-page",selPanel:".uk-modal-dialog",selClose:".uk-modal-close, .uk-modal-close-default, .uk-modal-close-outside, .uk-modal-close-full"},events:[{name:"show",self:!0,handler:function(){Ae(this.panel,"uk-margin-auto-vertical")?Se(this.$el,"uk-flex"):He(this.$el,"display","block"),en(this.$el)}},{name:"hidden",self:!0,handler:function(){He(this.$el,"display",""),Ee(this.$el,"uk-flex")}}]};var Ji={extends:Zn,data:{targets:"> .uk-parent",toggle:"> a",content:"> ul"}},Ki={mixins:[Jn,di],props:{dropdown:String,mode:"list",align:String,offset:Number,boundary:Boolean,boundaryAlign:Boolean,clsDrop:String,delayShow:Number,delayHide:Number,dropbar:Boolean,dropbarMode:String,dropbarAnchor:Boolean,duration:Number},data:{dropdown:".uk-navbar-nav > li",align:Gt?"right":"left",clsDrop:"uk-navbar-dropdown",mode:void 0,offset:void 0,delayShow:void 0,delayHide:void 0,boundaryAlign:void 0,flip:"x",boundary:!0,dropbar:!1,dropbarMode:"slide",dropbarAnchor:!1,duration:200,forceHeight:!0,selMinHeight:".uk-navbar-nav > li > a, .uk-navbar-item, .uk-navbar-toggle"},computed:{boundary:function(t,e){var n=t.boundary,i=t.boundaryAlign;return!0===n||i?e:n},dropbarAnchor:function(t,e){return ot(t.dropbarAnchor,e)},pos:function(t){return"bottom-"+t.align},dropdowns:function(t,e){return $e(t.dropdown+" ."+t.clsDrop,e)}},beforeConnect:function(){var t=this.$props.dropbar;this.dropbar=t&&(ot(t,this.$el)||ke("+ .uk-navbar-dropbar",this.$el)||ke("<div></div>")),this.dropbar&&(Se(this.dropbar,"uk-navbar-dropbar"),"slide"===this.dropbarMode&&Se(this.dropbar,"uk-navbar-dropbar-slide"))},disconnected:function(){this.dropbar&&pe(this.dropbar)},update:function(){var e=this;this.$create("drop",this.dropdowns.filter(function(t){return!e.getDropdown(t)}),U({},this.$props,{boundary:this.boundary,pos:this.pos,offset:this.dropbar||this.offset}))},events:[{name:"mouseover",delegate:function(){return this.dropdown},handler:function(t){var e=t.current,n=this.getActive();n&&n.toggle&&!At(n.toggle.$el,e)&&!n.tracker.movesTo(n.$el)&&n.hide(!1)}},{name:"mouseleave",el:function(){return this.dropbar},handler:function(){var t=this.getActive();t&&!mt(this.dropbar,":hover")&&t.hide()}},{name:"beforeshow",capture:!0,filter:function(){return this.dropbar},handler:function(){this.dropbar.parentNode||fe(this.dropbarAnchor||this.$el,this.dropbar)}},{name:"show",capture:!0,filter:function(){return this.dropbar},handler:function(t,e){var n=e.$el,i=e.dir;this.clsDrop&&Se(n,this.clsDrop+"-dropbar"),"bottom"===i&&this.transitionTo(n.offsetHeight+F(He(n,"marginTop"))+F(He(n,"marginBottom")),n)}},{name:"beforehide",filter:function(){return this.dropbar},handler:function(t,e){var n=e.$el,i=this.getActive();mt(this.dropbar,":hover")&&i&&i.$el===n&&t.preventDefault()}},{name:"hide",filter:function(){return this.dropbar},handler:function(t,e){var n=e.$el,i=this.getActive();(!i||i&&i.$el===n)&&this.transitionTo(0)}}],methods:{getActive:function(){var t=this.dropdowns.map(this.getDropdown).filter(function(t){return t&&t.isActive()})[0];return t&&y(t.mode,"hover")&&At(t.toggle.$el,this.$el)&&t},transitionTo:function(t,e){var n=this,i=this.dropbar,r=St(i)?en(i):0;return He(e=r<t&&e,"clip","rect(0,"+e.offsetWidth+"px,"+r+"px,0)"),en(i,r),qe.cancel([e,i]),jt.all([qe.start(i,{height:t},this.duration),qe.start(e,{clip:"rect(0,"+e.offsetWidth+"px,"+t+"px,0)"},this.duration)]).catch(K).then(function(){He(e,{clip:""}),n.$update(i)})},getDropdown:function(t){return this.$getComponent(t,"drop")||this.$getComponent(t,"dropdown")}}},Zi={mixins:[Ui],args:"mode",props:{mode:String,flip:Boolean,overlay:Boolean},data:{mode:"slide",flip:!1,overlay:!1,clsPage:"uk-offcanvas-page",clsContainer:"uk-offcanvas-container",selPanel:".uk-offcanvas-bar",clsFlip:"uk-offcanvas-flip",clsContainerAnimation:"uk-offcanvas-container-animation",clsSidebarAnimation:"uk-offcanvas-bar-animation",clsMode:"uk-offcanvas",clsOverlay:"uk-offcanvas-overlay",selClose:".uk-offcanvas-close"},computed:{clsFlip:function(t){var e=t.flip,n=t.clsFlip;return e?n:""},clsOverlay:function(t){var e=t.overlay,n=t.clsOverlay;return e?n:""},clsMode:function(t){var e=t.mode;return t.clsMode+"-"+e},clsSidebarAnimation:function(t){var e=t.mode,n=t.clsSidebarAnimation;return"none"===e||"reveal"===e?"":n},clsContainerAnimation:function(t){var e=t.mode,n=t.clsContainerAnimation;return"push"!==e&&"reveal"!==e?"":n},transitionElement:function(t){return"reveal"===t.mode?this.panel.parentNode:this.panel}},events:[{name:"click",delegate:function(){return'a[href^="#"]'},handler:function(t){var e=t.current;e.hash&&ke(e.hash,document.body)&&this.hide()}},{name:"touchstart",passive:!0,el:function(){return this.panel},handler:function(t){var e=t.targetTouches;1===e.length&&(this.clientY=e[0].clientY)}},{name:"touchmove",self:!0,passive:!1,filter:function(){return this.overlay},handler:function(t){t.preventDefault()}},{name:"touchmove",passive:!1,el:function(){return this.panel},handler:function(t){if(1===t.targetTouches.length){var e=event.targetTouches[0].clientY-this.clientY,n=this.panel,i=n.scrollTop,r=n.scrollHeight,o=n.clientHeight;(r<=o||0===i&&0<e||r-i<=o&&e<0)&&t.preventDefault()}}},{name:"show",self:!0,handler:function(){"reveal"!==this.mode||Ae(this.panel.parentNode,this.clsMode)||(ge(this.panel,"<div>"),Se(this.panel.parentNode,this.clsMode)),He(document.documentElement,"overflowY",this.overlay?"hidden":""),Se(document.body,this.clsContainer,this.clsFlip),He(this.$el,"display","block"),Se(this.$el,this.clsOverlay),Se(this.panel,this.clsSidebarAnimation,"reveal"!==this.mode?this.clsMode:""),en(document.body),Se(document.body,this.clsContainerAnimation),this.clsContainerAnimation&&(Qi().content+=",user-scalable=0")}},{name:"hide",self:!0,handler:function(){Ee(document.body,this.clsContainerAnimation);var t=this.getActive();("none"===this.mode||t&&t!==this&&t!==this.prev)&&Mt(this.panel,"transitionend")}},{name:"hidden",self:!0,handler:function(){this.clsContainerAnimation&&function(){var t=Qi();t.content=t.content.replace(/,user-scalable=0$/,"")}(),"reveal"===this.mode&&me(this.panel),Ee(this.panel,this.clsSidebarAnimation,this.clsMode),Ee(this.$el,this.clsOverlay),He(this.$el,"display",""),Ee(document.body,this.clsContainer,this.clsFlip),He(document.documentElement,"overflowY","")}},{name:"swipeLeft swipeRight",handler:function(t){this.isToggled()&&g(t.type,"Left")^this.flip&&this.hide()}}]};function Qi(){return ke('meta[name="viewport"]',document.head)||le(document.head,'<meta name="viewport">')}var tr={mixins:[Jn],props:{selContainer:String,selContent:String},data:{selContainer:".uk-modal",selContent:".uk-modal-dialog"},computed:{container:function(t,e){return bt(e,t.selContainer)},content:function(t,e){return bt(e,t.selContent)}},connected:function(){He(this.$el,"minHeight",150)},update:{read:function(){return!(!this.content||!this.container)&&{current:F(He(this.$el,"maxHeight")),max:Math.max(150,en(this.container)-(Ze(this.content).height-en(this.$el)))}},write:function(t){var e=t.current,n=t.max;He(this.$el,"maxHeight",n),Math.round(e)!==Math.round(n)&&Mt(this.$el,"resize")},events:["resize"]}},er={props:["width","height"],connected:function(){Se(this.$el,"uk-responsive-width")},update:{read:function(){return!!(St(this.$el)&&this.width&&this.height)&&{width:nn(this.$el.parentNode),height:this.height}},write:function(t){en(this.$el,tt.contain({height:this.height,width:this.width},t).height)},events:["resize"]}},nr={props:{duration:Number,offset:Number},data:{duration:1e3,offset:0},methods:{scrollTo:function(e){var n=this;e=e&&ke(e)||document.body;var t=en(document),i=en(window),r=Ze(e).top-this.offset;if(t<r+i&&(r=t-i),Mt(this.$el,"beforescroll",[this,e])){var o=Date.now(),s=window.pageYOffset,a=function(){var t=s+(r-s)*function(t){return.5*(1-Math.cos(Math.PI*t))}(J((Date.now()-o)/n.duration));fn(window,t),t!==r?requestAnimationFrame(a):Mt(n.$el,"scrolled",[n,e])};a()}}},events:{click:function(t){t.defaultPrevented||(t.preventDefault(),this.scrollTo(kt(decodeURIComponent(this.$el.hash)).substr(1)))}}};var ir={args:"cls",props:{cls:String,target:String,hidden:Boolean,offsetTop:Number,offsetLeft:Number,repeat:Boolean,delay:Number},data:function(){return{cls:!1,target:!1,hidden:!0,offsetTop:0,offsetLeft:0,repeat:!1,delay:0,inViewClass:"uk-scrollspy-inview"}},computed:{elements:function(t,e){var n=t.target;return n?$e(n,e):[e]}},update:[{write:function(){this.hidden&&He(_t(this.elements,":not(."+this.inViewClass+")"),"visibility","hidden")}},{read:function(t){var n=this;t.update&&this.elements.forEach(function(t){var e=t._ukScrollspyState;e||(e={cls:rt(t,"uk-scrollspy-class")||n.cls}),e.show=ln(t,n.offsetTop,n.offsetLeft),t._ukScrollspyState=e})},write:function(r){var o=this;if(!r.update)return this.$emit(),r.update=!0;this.elements.forEach(function(t){var n=t._ukScrollspyState,e=n.cls;if(!n.show||n.inview||n.queued){if(!n.show&&(n.inview||n.queued)&&o.repeat){if(n.abort&&n.abort(),!n.inview)return;He(t,"visibility",o.hidden?"hidden":""),Ee(t,o.inViewClass),Ne(t,e),Mt(t,"outview"),o.$update(t),n.inview=!1}}else{var i=function(){He(t,"visibility",""),Se(t,o.inViewClass),Ne(t,e),Mt(t,"inview"),o.$update(t),n.inview=!0,n.abort&&n.abort()};o.delay?(n.queued=!0,r.promise=(r.promise||jt.resolve()).then(function(){return!n.inview&&new jt(function(t){var e=setTimeout(function(){i(),t()},r.promise||1===o.elements.length?o.delay:0);n.abort=function(){clearTimeout(e),t(),n.queued=!1}})})):i()}})},events:["scroll","resize"]}]},rr={props:{cls:String,closest:String,scroll:Boolean,overflow:Boolean,offset:Number},data:{cls:"uk-active",closest:!1,scroll:!1,overflow:!0,offset:0},computed:{links:function(t,e){return $e('a[href^="#"]',e).filter(function(t){return t.hash})},elements:function(t){var e=t.closest;return bt(this.links,e||"*")},targets:function(){return $e(this.links.map(function(t){return kt(t.hash).substr(1)}).join(","))}},update:[{read:function(){this.scroll&&this.$create("scroll",this.links,{offset:this.offset||0})}},{read:function(o){var s=this,a=window.pageYOffset+this.offset+1,u=en(document)-en(window)+this.offset;o.active=!1,this.targets.every(function(t,e){var n=Ze(t).top,i=e+1===s.targets.length;if(!s.overflow&&(0===e&&a<n||i&&n+t.offsetTop<a))return!1;if(!i&&Ze(s.targets[e+1]).top<=a)return!0;if(u<=a)for(var r=s.targets.length-1;e<r;r--)if(ln(s.targets[r])){t=s.targets[r];break}return!(o.active=ke(_t(s.links,'[href="#'+t.id+'"]')))})},write:function(t){var e=t.active;this.links.forEach(function(t){return t.blur()}),Ee(this.elements,this.cls),e&&Mt(this.$el,"active",[e,Se(this.closest?bt(e,this.closest):e,this.cls)])},events:["scroll","resize"]}]},or={mixins:[Jn,Wi],props:{top:null,bottom:Boolean,offset:Number,animation:String,clsActive:String,clsInactive:String,clsFixed:String,clsBelow:String,selTarget:String,widthElement:Boolean,showOnUp:Boolean,targetOffset:Number},data:{top:0,bottom:!1,offset:0,animation:"",clsActive:"uk-active",clsInactive:"",clsFixed:"uk-sticky-fixed",clsBelow:"uk-sticky-below",selTarget:"",widthElement:!1,showOnUp:!1,targetOffset:!1},computed:{selTarget:function(t,e){var n=t.selTarget;return n&&ke(n,e)||e},widthElement:function(t,e){return ot(t.widthElement,e)||this.placeholder},isActive:{get:function(){return Ae(this.selTarget,this.clsActive)},set:function(t){t&&!this.isActive?(_e(this.selTarget,this.clsInactive,this.clsActive),Mt(this.$el,"active")):t||Ae(this.selTarget,this.clsInactive)||(_e(this.selTarget,this.clsActive,this.clsInactive),Mt(this.$el,"inactive"))}}},connected:function(){this.placeholder=ke("+ .uk-sticky-placeholder",this.$el)||ke('<div class="uk-sticky-placeholder"></div>'),this.isFixed=!1,this.isActive=!1},disconnected:function(){this.isFixed&&(this.hide(),Ee(this.selTarget,this.clsInactive)),pe(this.placeholder),this.placeholder=null,this.widthElement=null},events:[{name:"load hashchange popstate",el:window,handler:function(){var i=this;if(!1!==this.targetOffset&&location.hash&&0<window.pageYOffset){var r=ke(location.hash);r&&wn.read(function(){var t=Ze(r).top,e=Ze(i.$el).top,n=i.$el.offsetHeight;i.isFixed&&t<=e+n&&e<=t+r.offsetHeight&&fn(window,t-n-(H(i.targetOffset)?i.targetOffset:0)-i.offset)})}}}],update:[{read:function(t,e){var n=t.height;this.isActive&&"update"!==e&&(this.hide(),n=this.$el.offsetHeight,this.show()),n=this.isActive?n:this.$el.offsetHeight,this.topOffset=Ze(this.isFixed?this.placeholder:this.$el).top,this.bottomOffset=this.topOffset+n;var i=sr("bottom",this);return this.top=Math.max(F(sr("top",this)),this.topOffset)-this.offset,this.bottom=i&&i-n,this.inactive=!this.matchMedia,{lastScroll:!1,height:n,margins:He(this.$el,["marginTop","marginBottom","marginLeft","marginRight"])}},write:function(t){var e=t.height,n=t.margins,i=this.placeholder;He(i,U({height:e},n)),At(i,document)||(fe(this.$el,i),et(i,"hidden","")),this.isActive=this.isActive},events:["resize"]},{read:function(t){var e=t.scroll;return void 0===e&&(e=0),this.width=(St(this.widthElement)?this.widthElement:this.$el).offsetWidth,this.scroll=window.pageYOffset,{dir:e<=this.scroll?"down":"up",scroll:this.scroll,visible:St(this.$el),top:dn(this.placeholder)[0]}},write:function(t,e){var n=this,i=t.initTimestamp;void 0===i&&(i=0);var r=t.dir,o=t.lastDir,s=t.lastScroll,a=t.scroll,u=t.top,c=t.visible,l=performance.now();if(!((t.lastScroll=a)<0||a===s||!c||this.disabled||this.showOnUp&&"scroll"!==e||((300<l-i||r!==o)&&(t.initScroll=a,t.initTimestamp=l),t.lastDir=r,this.showOnUp&&Math.abs(t.initScroll-a)<=30&&Math.abs(s-a)<=10)))if(this.inactive||a<this.top||this.showOnUp&&(a<=this.top||"down"===r||"up"===r&&!this.isFixed&&a<=this.bottomOffset)){if(!this.isFixed)return void(Ge.inProgress(this.$el)&&a<u&&(Ge.cancel(this.$el),this.hide()));this.isFixed=!1,this.animation&&a>this.topOffset?(Ge.cancel(this.$el),Ge.out(this.$el,this.animation).then(function(){return n.hide()},K)):this.hide()}else this.isFixed?this.update():this.animation?(Ge.cancel(this.$el),this.show(),Ge.in(this.$el,this.animation).catch(K)):this.show()},events:["resize","scroll"]}],methods:{show:function(){this.isFixed=!0,this.update(),et(this.placeholder,"hidden",null)},hide:function(){this.isActive=!1,Ee(this.$el,this.clsFixed,this.clsBelow),He(this.$el,{position:"",top:"",width:""}),et(this.placeholder,"hidden","")},update:function(){var t=0!==this.top||this.scroll>this.top,e=Math.max(0,this.offset);this.bottom&&this.scroll>this.bottom-this.offset&&(e=this.bottom-this.scroll),He(this.$el,{position:"fixed",top:e+"px",width:this.width}),this.isActive=t,Ne(this.$el,this.clsBelow,this.scroll>this.bottomOffset),Se(this.$el,this.clsFixed)}}};function sr(t,e){var n=e.$props,i=e.$el,r=e[t+"Offset"],o=n[t];if(o){if(H(o))return r+F(o);if(M(o)&&o.match(/^-?\d+vh$/))return en(window)*F(o)/100;var s=!0===o?i.parentNode:ot(o,i);return s?Ze(s).top+s.offsetHeight:void 0}}var ar,ur,cr,lr,hr={mixins:[Kn],args:"connect",props:{connect:String,toggle:String,active:Number,swiping:Boolean},data:{connect:"~.uk-switcher",toggle:"> * > :first-child",active:0,swiping:!0,cls:"uk-active",clsContainer:"uk-switcher",attrItem:"uk-switcher-item",queued:!0},computed:{connects:function(t,e){return st(t.connect,e)},toggles:function(t,e){return $e(t.toggle,e)}},events:[{name:"click",delegate:function(){return this.toggle+":not(.uk-disabled)"},handler:function(e){e.preventDefault(),this.show(V(this.$el.children).filter(function(t){return At(e.current,t)})[0])}},{name:"click",el:function(){return this.connects},delegate:function(){return"["+this.attrItem+"],[data-"+this.attrItem+"]"},handler:function(t){t.preventDefault(),this.show(rt(t.current,this.attrItem))}},{name:"swipeRight swipeLeft",filter:function(){return this.swiping},el:function(){return this.connects},handler:function(t){var e=t.type;this.show(g(e,"Left")?"next":"previous")}}],update:function(){var e=this;this.connects.forEach(function(t){return e.updateAria(t.children)});var t=this.$el.children;this.show(_t(t,"."+this.cls)[0]||t[this.active]||t[0])},methods:{index:function(){return!P(this.connects)&&se(_t(this.connects[0].children,"."+this.cls)[0])},show:function(t){for(var e,n,i=this,r=this.$el.children,o=r.length,s=this.index(),a=0<=s,u="previous"===t?-1:1,c=ae(t,r,s),l=0;l<o;l++,c=(c+u+o)%o)if(!mt(this.toggles[c],".uk-disabled *, .uk-disabled, [disabled]")){e=this.toggles[c],n=r[c];break}!n||0<=s&&Ae(n,this.cls)||s===c||(Ee(r,this.cls),Se(n,this.cls),et(this.toggles,"aria-expanded",!1),et(e,"aria-expanded",!0),this.connects.forEach(function(t){a?i.toggleElement([t.children[s],t.children[c]]):i.toggleNow(t.children[c])}))}}},fr={mixins:[Jn],extends:hr,props:{media:Boolean},data:{media:960,attrItem:"uk-tab-item"},connected:function(){var t=Ae(this.$el,"uk-tab-left")?"uk-tab-left":!!Ae(this.$el,"uk-tab-right")&&"uk-tab-right";t&&this.$create("toggle",this.$el,{cls:t,mode:"media",media:this.media})}},dr={mixins:[Wi,Kn],args:"target",props:{href:String,target:null,mode:"list"},data:{href:!1,target:!1,mode:"click",queued:!0},computed:{target:function(t,e){var n=t.href,i=t.target;return(i=st(i||n,e)).length&&i||[e]}},connected:function(){Mt(this.target,"updatearia",[this])},events:[{name:ne+" "+ie,filter:function(){return y(this.mode,"hover")},handler:function(t){Lt(t)||this.toggle("toggle"+(t.type===ne?"show":"hide"))}},{name:"click",filter:function(){return y(this.mode,"click")||Zt&&y(this.mode,"hover")},handler:function(t){var e;(bt(t.target,'a[href="#"], a[href=""]')||(e=bt(t.target,"a[href]"))&&(this.cls||!St(this.target)||e.hash&&mt(this.target,e.hash)))&&t.preventDefault(),this.toggle()}}],update:{read:function(){return!(!y(this.mode,"media")||!this.media)&&{match:this.matchMedia}},write:function(t){var e=t.match,n=this.isToggled(this.target);(e?!n:n)&&this.toggle()},events:["resize"]},methods:{toggle:function(t){Mt(this.target,t||"toggle",[this])&&this.toggleElement(this.target)}}};function pr(){vr(document.body,cr),wn.flush(),new MutationObserver(function(t){return t.forEach(gr)}).observe(document,{childList:!0,subtree:!0,characterData:!0,attributes:!0}),ur._initialized=!0}function gr(t){var e=t.target;("attributes"!==t.type?function(t){for(var e=t.addedNodes,n=t.removedNodes,i=0;i<e.length;i++)vr(e[i],cr);for(var r=0;r<n.length;r++)vr(n[r],lr);return!0}(t):function(t){var e=t.target,n=t.attributeName;if("href"===n)return!0;var i=Mn(n);if(i&&i in ur){if(nt(e,n))return ur[i](e),!0;var r=ur.getComponent(e,i);return r?(r.$destroy(),!0):void 0}}(t))&&ur.update(e)}function vr(t,e){if(1===t.nodeType&&!nt(t,"uk-no-boot"))for(e(t),t=t.firstElementChild;t;){var n=t.nextElementSibling;vr(t,e),t=n}}return Dn.version="3.1.4",(ar=Dn).component("accordion",Zn),ar.component("alert",Qn),ar.component("cover",ri),ar.component("drop",oi),ar.component("dropdown",si),ar.component("formCustom",ai),ar.component("gif",ui),ar.component("grid",fi),ar.component("heightMatch",pi),ar.component("heightViewport",mi),ar.component("icon",Ei),ar.component("img",Oi),ar.component("leader",Yi),ar.component("margin",ci),ar.component("modal",Gi),ar.component("nav",Ji),ar.component("navbar",Ki),ar.component("offcanvas",Zi),ar.component("overflowAuto",tr),ar.component("responsive",er),ar.component("scroll",nr),ar.component("scrollspy",ir),ar.component("scrollspyNav",rr),ar.component("sticky",or),ar.component("svg",bi),ar.component("switcher",hr),ar.component("tab",fr),ar.component("toggle",dr),ar.component("video",ii),ar.component("close",Ni),ar.component("marker",Ci),ar.component("navbarToggleIcon",Ci),ar.component("overlayIcon",Ci),ar.component("paginationNext",Ci),ar.component("paginationPrevious",Ci),ar.component("searchIcon",Ai),ar.component("slidenavNext",_i),ar.component("slidenavPrevious",_i),ar.component("spinner",Bi),ar.component("totop",Ci),ar.use(ti),cr=(ur=Dn).connect,lr=ur.disconnect,"MutationObserver"in window&&(document.body?pr():new MutationObserver(function(){document.body&&(this.disconnect(),pr())}).observe(document,{childList:!0,subtree:!0})),Dn});
\ No newline at end of file
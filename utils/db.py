@@ -0,0 +1,14 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+@contextmanager
+def rolled_back():
+    """
+    run the block in a transaction that is rolled back once it's done, for
+    the benchmark commands, which seed data only to measure with it
+    """
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class VacationConfig(AppConfig):
     name = 'vacation'
+
+    def ready(self):
+        from vacation import holidays
+
+        # so no calendar page has to work out the holidays itself
+        holidays.warm()
@@ -0,0 +1,75 @@
+import datetime
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from vacation.models import MonthVersion
+
+# rendered months are only ever looked up by their current version, so old
+# ones can simply be left to expire
+MONTH_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def month_versions(months):
+    """
+    :param months: list of (year, month)
+    :return: dict - (year, month): version, 0 for months never changed
+    """
+    if not months:
+        return {}
+    match = Q()
+    for year, month in months:
+        match |= Q(year=year, month=month)
+    versions = dict.fromkeys(months, 0)
+    versions.update(((year, month), version) for year, month, version in
+                    MonthVersion.objects
+                    .filter(match)
+                    .values_list('year', 'month', 'version'))
+    return versions
+
+
+def month_key(cal, year, month, version, today):
+    """
+    the cache key of a rendered month. the months that show today's date
+    are keyed by it too, so today is highlighted afresh each day, the rest
+    keep their key until a vacation on them changes.
+    """
+    weeks = cal.monthdatescalendar(year, month)
+    today_marker = today.isoformat() if weeks[0][0] <= today <= weeks[-1][-1] else "-"
+    return (f"vacation:month:{cal.firstweekday}:{year}:{month}:"
+            f"{today_marker}:{version}")
+
+
+def render_months(cal, year, months):
+    """
+    render the months of a year, reusing the cached copy of every month that
+    hasn't changed since it was rendered. the months that have to be
+    rendered again are rendered together, from one query. months are
+    yielded in order as soon as they are ready.
+    :param cal: VacationCalendar
+    :param year: int
+    :param months: list of int
+    :return: generator of str
+    """
+    today = datetime.date.today()
+    versions = month_versions([(year, month) for month in months])
+    keys = {month: month_key(cal, year, month, versions[year, month], today)
+            for month in months}
+    cached = cache.get_many(keys.values())
+
+    missing = [month for month in months if keys[month] not in cached]
+    rendered = cal.formatmonths(year, missing) if missing else iter(())
+    for month in months:
+        html = cached.get(keys[month])
+        if html is None:
+            html = next(rendered)
+            cache.set(keys[month], html, MONTH_TIMEOUT)
+        yield html
+
+
+def render_month(cal, year, month):
+    """
+    render one month, from the cache if it hasn't changed.
+    :return: str
+    """
+    return next(render_months(cal, year, [month]))
@@ -1,11 +1,10 @@
 import datetime
+import itertools
 from calendar import HTMLCalendar, monthrange, month_name, day_abbr, weekday
-from operator import attrgetter, methodcaller
 
-from django.db.models import Q
 from django.urls import reverse
-from workalendar.america import Ontario
 
+from vacation import holidays
 from vacation.models import Vacation
 
 
@@ -15,43 +14,72 @@ class VacationCalendar(HTMLCalendar):
         self.events = events
         self.event_dict = {}
 
-    def formatday(self, theyear, themonth, date, events):
+    def load_events(self, first, last):
+        """
+        the vacations that overlap the days from first to last, with one query
+        :return: list of Vacation
+        """
+        if self.events is not None:
+            return list(self.events)
+        return list(Vacation.objects
+                    .filter(start_date__lte=last, end_date__gte=first)
+                    .select_related('user'))
+
+    @staticmethod
+    def index_events(events, first, last):
+        """
+        bucket the events by the days they cover. each day's events come
+        out sorted by start date, longest first for the same start, which is
+        the order they are stacked in.
+        :param events: iterable of Vacation
+        :param first: datetime.date - first day of the index
+        :param last: datetime.date - last day of the index
+        :return: dict - date: list of Vacation
+        """
+        day_events = {}
+        for event in sorted(events, key=lambda event: (
+                event.start_date, -event.event_length_days())):
+            day = max(event.start_date, first)
+            end = min(event.end_date, last)
+            while day <= end:
+                day_events.setdefault(day, []).append(event)
+                day += datetime.timedelta(days=1)
+        return day_events
+
+    @staticmethod
+    def holidays_between(first, last):
+        """
+        :return: dict - date: holiday name, for every holiday from first to last
+        """
+        return holidays.holidays_between(first, last)
+
+    def formatday(self, theyear, themonth, date, day_events):
         wday = weekday(date.year, date.month, date.day)
         day = date.day
         if day == 0:
             return '<td class="noday">&nbsp;</td>'
 
-        empty_rows = 0
+        today = self.today
+        last_day_of_month = self.last_day_of_month
 
-        today = datetime.date.today()
-        last_day_of_month = monthrange(theyear, themonth)[1]
-        ontario = Ontario()
-        ontario_holidays = ontario.holidays(theyear)
-
-        events_from_day = events.filter(Q(start_date__lte=date) & Q(end_date__gte=date))
-        events_from_day = sorted(events_from_day, key=methodcaller('event_length_days'), reverse=True)
-        events_from_day = sorted(events_from_day, key=attrgetter("start_date"))
+        events_from_day = day_events.get(date, [])
         events_html = ""
-        for i, event in enumerate(events_from_day):
-            # reset event_dict to empty at the beggining of each week
-            if wday == 6:
-                self.event_dict = {}
-
-            # check if the current event has been processed in a previous day this week
-            # if it has, set the order to whatever it was set to previously
-            # it it hasn't set the order to the order from this day for future days
-            if event.id in self.event_dict:
-                order = self.event_dict[event.id]
-            else:
-                self.event_dict[event.id] = i + empty_rows  # set the order for future days
-                order = 0  # order for this day stays the same. it will go directly below the previous event for the day
-
-            # the the set order is different from the current loop order, add as many empty rows as required to make
-            # the events line up when viewed side by side
-            if order != i + empty_rows:
-                for _ in range(order):
-                    empty_rows += 1
-                    events_html += f"<tr><td><span class='calendar-event-hidden'>{event.user.username}</span></td></tr>"
+        # every event keeps the row it was given on the first day it was
+        # drawn this week, so multi-day events line up from day to day. rows
+        # of events that aren't on this day are filled with hidden spacers.
+        rows = self.event_dict
+        taken = {rows[event.id] for event in events_from_day if event.id in rows}
+        free_rows = (row for row in itertools.count() if row not in taken)
+        for event in events_from_day:
+            if event.id not in rows:
+                rows[event.id] = next(free_rows)
+        events_by_row = {rows[event.id]: event for event in events_from_day}
+
+        for row in range(max(events_by_row, default=-1) + 1):
+            event = events_by_row.get(row)
+            if event is None:
+                events_html += "<tr><td><span class='calendar-event-hidden'>&nbsp;</span></td></tr>"
+                continue
 
             # event is a single day event
             events_html += "<tr><td class='day-table-cell'>"
@@ -86,10 +114,10 @@ class VacationCalendar(HTMLCalendar):
         else:
             string = f"<td height=150 valign='top' class='{self.cssclasses[wday]}'>"
 
-        for d, holiday_name in ontario_holidays:
-            if date == d:
-                holidays_html = f"<span class='canada-holiday'>&nbsp;{holiday_name}</span>"
-                string = f"<td height=150 valign='top' class='holiday {self.cssclasses[wday]}'>"
+        holiday_name = self.holidays.get(date)
+        if holiday_name is not None:
+            holidays_html = f"<span class='canada-holiday'>&nbsp;{holiday_name}</span>"
+            string = f"<td height=150 valign='top' class='holiday {self.cssclasses[wday]}'>"
 
         string += "<table class='day-table'><tbody>"
 
@@ -113,8 +141,10 @@ class VacationCalendar(HTMLCalendar):
         """
         return '<th class="%s-header">%s</th>' % (self.cssclasses[day], day_abbr[day])
 
-    def formatweek(self, theyear, themonth, theweek, events):
-        s = ''.join(self.formatday(theyear, themonth, date, events) for date in theweek)
+    def formatweek(self, theyear, themonth, theweek, day_events):
+        # rows are handed out afresh each week
+        self.event_dict = {}
+        s = ''.join(self.formatday(theyear, themonth, date, day_events) for date in theweek)
         return f"<tr>{s}</tr>"
 
     def formatweekheader(self):
@@ -134,11 +164,41 @@ class VacationCalendar(HTMLCalendar):
             s = '%s' % month_name[themonth]
         return '<tr><th colspan="7" class="month-name">%s</th></tr>' % s
 
+    def prepare(self, first, last):
+        """
+        work out everything the days from first to last are rendered from:
+        their vacations, with one query, and their holidays.
+        :return: None
+        """
+        self.day_events = self.index_events(self.load_events(first, last), first, last)
+        self.holidays = self.holidays_between(first, last)
+        self.today = datetime.date.today()
+
     def formatmonth(self, theyear, themonth, withyear=True):
-        if self.events:
-            events = self.events
-        else:
-            events = Vacation.objects.filter(Q(start_date__month=themonth) | Q(end_date__month=themonth))
+        weeks = self.monthdatescalendar(theyear, themonth)
+        self.prepare(weeks[0][0], weeks[-1][-1])
+        return self.rendermonth(theyear, themonth, weeks, withyear=withyear)
+
+    def formatmonths(self, theyear, months, withyear=True):
+        """
+        render several months of a year from one shared index of their
+        vacations, yielding each month's table as soon as it is rendered.
+        :param theyear: int
+        :param months: list of int - consecutive months, e.g. [4, 5, 6]
+        :return: generator of str
+        """
+        weeks = {themonth: self.monthdatescalendar(theyear, themonth)
+                 for themonth in months}
+        self.prepare(weeks[months[0]][0][0], weeks[months[-1]][-1][-1])
+        for themonth in months:
+            yield self.rendermonth(theyear, themonth, weeks[themonth],
+                                   withyear=withyear)
+
+    def rendermonth(self, theyear, themonth, weeks, withyear=True):
+        """
+        render a month's table, prepare has to have been called for its days.
+        """
+        self.last_day_of_month = monthrange(theyear, themonth)[1]
 
         table = []
         a = table.append
@@ -148,9 +208,9 @@ class VacationCalendar(HTMLCalendar):
         a('\n')
         a(self.formatweekheader())
         a('\n')
-        for week in self.monthdatescalendar(theyear, themonth):
-            a(self.formatweek(theyear, themonth, week, events))
+        for week in weeks:
+            a(self.formatweek(theyear, themonth, week, self.day_events))
             a('\n')
-        # a("<\table>")
+        a("</table>")
         a("\n")
         return ''.join(table)
@@ -0,0 +1,87 @@
+import datetime
+
+from django.core import signing
+from django.db.models import Max, Sum
+from icalendar import Calendar, Event
+
+from vacation.models import MonthVersion, Vacation
+
+FEED_SALT = 'vacation.feed'
+# vacations that ended longer ago than this are left out of the feeds
+FEED_HISTORY = datetime.timedelta(days=365)
+
+
+def feed_token(user=None):
+    """
+    the token in the url of a feed. calendar clients can't log in, so the
+    url itself is the key: it is signed, and names the feed it opens.
+    :param user: User - whose vacations the feed has, None for everyone's
+    :return: str
+    """
+    return signing.dumps({'user': user.pk if user else None}, salt=FEED_SALT)
+
+
+def read_token(token):
+    """
+    :param token: str - from feed_token
+    :return: int or None - the user pk of the feed
+    :raises signing.BadSignature: if the token wasn't made by feed_token
+    """
+    return signing.loads(token, salt=FEED_SALT)['user']
+
+
+def feed_state():
+    """
+    the version and modified time of the vacation feeds. every change to a
+    vacation, or to the name it is shown with, bumps a month's version, so
+    the sum of the versions only ever grows and works as an ETag without
+    looking at the vacations themselves.
+    :return: (int, datetime or None)
+    """
+    state = MonthVersion.objects.aggregate(version=Sum('version'),
+                                           modified=Max('modified'))
+    return state['version'] or 0, state['modified']
+
+
+def feed_vacations(user_id=None, today=None):
+    today = today or datetime.date.today()
+    vacations = Vacation.objects \
+        .filter(end_date__gte=today - FEED_HISTORY) \
+        .select_related('user') \
+        .order_by('start_date', 'pk')
+    if user_id is not None:
+        vacations = vacations.filter(user_id=user_id)
+    return vacations
+
+
+def vacation_event(vacation, domain, stamp):
+    event = Event()
+    event.add('uid', f"vacation-{vacation.pk}@{domain}")
+    event.add('dtstamp', stamp)
+    event.add('summary', f"{vacation.user.username.title()} - Vacation")
+    event.add('dtstart', vacation.start_date)
+    # the end of an all day event is the day after it
+    event.add('dtend', vacation.end_date + datetime.timedelta(days=1))
+    event.add('transp', 'TRANSPARENT')
+    return event
+
+
+def stream_feed(vacations, name, domain, stamp):
+    """
+    the feed as an iCalendar file, one event at a time, so a large feed is
+    never built up in memory.
+    :param vacations: Vacation queryset, with the users selected
+    :param name: str - the calendar's name in the client
+    :param domain: str - makes the event uids unique
+    :param stamp: datetime - the time the feed was last changed
+    :return: generator of bytes
+    """
+    cal = Calendar()
+    cal.add('prodid', '-//LTD Priority List//Vacations//EN')
+    cal.add('version', '2.0')
+    cal.add('x-wr-calname', name)
+    head, tail = cal.to_ical().split(b'END:VCALENDAR')
+    yield head
+    for vacation in vacations.iterator():
+        yield vacation_event(vacation, domain, stamp).to_ical()
+    yield b'END:VCALENDAR' + tail
@@ -0,0 +1,60 @@
+import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# workalendar calendars that can be picked with the HOLIDAY_CALENDAR setting,
+# any other workalendar class can be given by its dotted path
+CALENDARS = {
+    'ontario': 'workalendar.america.Ontario',
+    'quebec': 'workalendar.america.Quebec',
+    'british_columbia': 'workalendar.america.BritishColumbia',
+    'alberta': 'workalendar.america.Alberta',
+    'canada': 'workalendar.america.Canada',
+}
+
+
+def default_calendar():
+    return getattr(settings, 'HOLIDAY_CALENDAR', 'ontario')
+
+
+def holidays(year, calendar=None):
+    """
+    the public holidays of a year, computed once per (calendar, year) for
+    the whole process.
+    :param year: int
+    :param calendar: name from CALENDARS or dotted path of a workalendar
+                     class, the HOLIDAY_CALENDAR setting if left out
+    :return: read-only dict - date: holiday name
+    """
+    return _holidays(year, calendar or default_calendar())
+
+
+# the least recently used years are dropped once more than 32 are held
+@lru_cache(maxsize=32)
+def _holidays(year, calendar):
+    workalendar = import_string(CALENDARS.get(calendar, calendar))()
+    return MappingProxyType(dict(workalendar.holidays(year)))
+
+
+def holidays_between(first, last, calendar=None):
+    """
+    :return: dict - date: holiday name, for every holiday from first to last
+    """
+    return {date: name
+            for year in range(first.year, last.year + 1)
+            for date, name in holidays(year, calendar).items()
+            if first <= date <= last}
+
+
+def warm(calendar=None):
+    """
+    compute this year's and next year's holidays ahead of the first request
+    that needs them.
+    :return: None
+    """
+    year = datetime.date.today().year
+    holidays(year, calendar)
+    holidays(year + 1, calendar)
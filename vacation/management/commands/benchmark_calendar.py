@@ -0,0 +1,63 @@
+import calendar
+import datetime
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from vacation.calendar import VacationCalendar
+from vacation.models import Vacation
+from utils.db import rolled_back
+
+
+class Command(BaseCommand):
+    help = ("Render a month of the vacation calendar with many overlapping "
+            "vacations and report the queries and time it takes. Everything "
+            "is done in a transaction that is rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vacations', type=int, default=200)
+        parser.add_argument('--users', type=int, default=40)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--year', type=int, default=2019)
+        parser.add_argument('--month', type=int, default=7)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options['seed'])
+        year, month = options['year'], options['month']
+        with rolled_back():
+            self.seed(options['vacations'], options['users'], year, month)
+            self.measure(year, month, options['repeat'])
+
+    def seed(self, num_vacations, num_users, year, month):
+        users = [User.objects.create(username=f"benchmark{i}")
+                 for i in range(num_users)]
+        first = datetime.date(year, month, 1)
+        vacations = []
+        for _ in range(num_vacations):
+            # start up to a week before the month, so some run into it
+            start = first + datetime.timedelta(days=random.randrange(-7, 31))
+            length = random.choice([1, 1, 2, 3, 5, 7, 14])
+            vacations.append(Vacation(
+                user=random.choice(users), start_date=start,
+                end_date=start + datetime.timedelta(days=length - 1)))
+        Vacation.objects.bulk_create(vacations)
+
+    def measure(self, year, month, repeat):
+        cal = VacationCalendar()
+        cal.setfirstweekday(calendar.SUNDAY)
+
+        with CaptureQueriesContext(connection) as queries:
+            cal.formatmonth(year, month)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            cal.formatmonth(year, month)
+        ms = (time.perf_counter() - start) * 1000 / repeat
+
+        self.stdout.write(f"{Vacation.objects.count()} vacations, "
+                          f"{len(queries)} queries, {ms:.1f} ms per month")
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.28 on 2026-10-18 09:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacation',
+            index=models.Index(fields=['start_date', 'end_date'], name='vacation_dates_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.28 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacation', '0002_vacation_dates_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('year', 'month')},
+            },
+        ),
+    ]
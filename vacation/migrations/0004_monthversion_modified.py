@@ -0,0 +1,19 @@
+# Generated by Django 2.2.28 on 2026-10-18 10:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacation', '0003_monthversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monthversion',
+            name='modified',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,6 +1,12 @@
+import datetime
+
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
+from django.utils import timezone
 
 
 # create your models here.
@@ -9,6 +15,43 @@ class Vacation(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
 
+    class Meta:
+        indexes = [
+            # the calendar loads the vacations overlapping a range of days
+            models.Index(fields=['start_date', 'end_date'],
+                         name='vacation_dates_idx'),
+        ]
+
+    # the dates the vacation was loaded with, see months_touched
+    _loaded_range = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_range = (instance.__dict__.get('start_date'),
+                                  instance.__dict__.get('end_date'))
+        return instance
+
+    def months_touched(self):
+        """
+        the months whose calendar shows the vacation, as it is and as it was
+        loaded. a month is shown with the end of the month before it and the
+        start of the one after, up to 6 days each way.
+        :return: set of (year, month)
+        """
+        ranges = [(self.start_date, self.end_date)]
+        if self._loaded_range is not None and None not in self._loaded_range:
+            ranges.append(self._loaded_range)
+
+        months = set()
+        for start, end in ranges:
+            day = start - datetime.timedelta(days=6)
+            last = end + datetime.timedelta(days=6)
+            while (day.year, day.month) <= (last.year, last.month):
+                months.add((day.year, day.month))
+                day = (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        return months
+
     def is_single_day_event(self):
         return self.start_date == self.end_date
 
@@ -23,3 +66,69 @@ class Vacation(models.Model):
 
     def __str__(self):
         return f"{self.user.username.title()}: {self.start_date} - {self.end_date}"
+
+
+class MonthVersion(models.Model):
+    """
+    a counter per calendar month, bumped whenever a vacation shown on the
+    month changes. rendered months are cached under it, see vacation.cache.
+    """
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    version = models.PositiveIntegerField(default=0)
+    # when the version was last bumped, the Last-Modified of the feeds
+    modified = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ('year', 'month')
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02}: {self.version}"
+
+
+def bump_month_versions(months):
+    """
+    mark the calendars of the given months as changed, so any cached copy of
+    them is no longer used.
+    :param months: iterable of (year, month)
+    :return: None
+    """
+    months = set(months)
+    if not months:
+        return
+    match = Q()
+    for year, month in months:
+        match |= Q(year=year, month=month)
+    existing = set(MonthVersion.objects
+                   .filter(match)
+                   .values_list('year', 'month'))
+    # months that were never bumped are at version 0. their rows are added
+    # at 0 and bumped with the rest, so two requests adding the same row at
+    # once still bump it twice
+    MonthVersion.objects.bulk_create(
+        [MonthVersion(year=year, month=month, version=0)
+         for year, month in months - existing],
+        ignore_conflicts=True)
+    MonthVersion.objects.filter(match).update(version=F('version') + 1,
+                                              modified=timezone.now())
+
+
+@receiver(post_save, sender=Vacation)
+@receiver(post_delete, sender=Vacation)
+def vacation_changed(sender, instance, **kwargs):
+    bump_month_versions(instance.months_touched())
+    instance._loaded_range = (instance.start_date, instance.end_date)
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, update_fields=None, **kwargs):
+    # the username is shown on the calendar. logging in saves last_login
+    # alone, which leaves the calendar as it is.
+    if created or (update_fields is not None
+                   and 'username' not in update_fields):
+        return
+    months = set()
+    for vacation in Vacation.objects.filter(user=instance).only(
+            'start_date', 'end_date'):
+        months |= vacation.months_touched()
+    bump_month_versions(months)
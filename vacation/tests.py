@@ -1 +1,454 @@
-# Create your tests here.
+import calendar
+import datetime
+import re
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from icalendar import Calendar
+
+from vacation import feeds, holidays
+from vacation.cache import month_versions, render_month
+from vacation.calendar import VacationCalendar
+from vacation.models import MonthVersion, Vacation, bump_month_versions
+
+
+class VacationCalendarTestCase(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='alice')
+        self.u2 = User.objects.create_user(username='bob')
+        self.u3 = User.objects.create_user(username='carol')
+
+        self.cal = VacationCalendar()
+        self.cal.setfirstweekday(calendar.SUNDAY)
+
+    def day_cells(self, html):
+        """
+        :return: dict - day of the month: html of its cell
+        """
+        cells = re.findall(r"<td height=150 valign='top' class='([^']*)'>"
+                           r"(.*?</tbody></table>)</td>", html)
+        return {int(re.search(r">(\d+)</a>", cell).group(1)): (classes, cell)
+                for classes, cell in cells if 'noday' not in classes}
+
+    def rows(self, cell):
+        """
+        :return: list - the name shown in each event row of a day, '' for
+        rows without a name and None for spacers
+        """
+        rows = re.findall(r"<tr><td( class='day-table-cell')?>(.*?)</td></tr>",
+                          cell)
+        return [None if not in_cell else re.sub(r'<[^>]+>', '', text)
+                for in_cell, text in rows]
+
+    def test_one_query(self):
+        for day in range(1, 20):
+            Vacation.objects.create(
+                user=self.u1, start_date=datetime.date(2019, 7, day),
+                end_date=datetime.date(2019, 7, day + 3))
+
+        with self.assertNumQueries(1):
+            self.cal.formatmonth(2019, 7)
+
+    def test_events_in_range(self):
+        Vacation.objects.create(user=self.u1,
+                                start_date=datetime.date(2019, 6, 28),
+                                end_date=datetime.date(2019, 7, 2))
+        # same month, another year
+        Vacation.objects.create(user=self.u2,
+                                start_date=datetime.date(2018, 7, 10),
+                                end_date=datetime.date(2018, 7, 10))
+        # spans the whole month
+        whole_month = Vacation.objects.create(user=self.u3,
+                                start_date=datetime.date(2019, 6, 20),
+                                end_date=datetime.date(2019, 8, 10))
+
+        days = self.day_cells(self.cal.formatmonth(2019, 7))
+
+        self.assertIn('calendar-event', days[1][1])
+        self.assertNotIn('Bob', ''.join(cell for _, cell in days.values()))
+        for day in days:
+            self.assertIn('href="%s"' % reverse('vacation:detail',
+                                                 args=[whole_month.pk]),
+                          days[day][1])
+
+    def test_holidays(self):
+        days = self.day_cells(self.cal.formatmonth(2019, 7))
+        self.assertIn('holiday', days[1][0])
+        self.assertIn('Canada Day', days[1][1])
+        self.assertNotIn('holiday', days[2][0])
+
+    def test_rows_line_up(self):
+        # a week from sunday the 7th to saturday the 13th
+        Vacation.objects.create(user=self.u1,
+                                start_date=datetime.date(2019, 7, 7),
+                                end_date=datetime.date(2019, 7, 8))
+        Vacation.objects.create(user=self.u2,
+                                start_date=datetime.date(2019, 7, 7),
+                                end_date=datetime.date(2019, 7, 11))
+        Vacation.objects.create(user=self.u3,
+                                start_date=datetime.date(2019, 7, 9),
+                                end_date=datetime.date(2019, 7, 9))
+
+        days = self.day_cells(self.cal.formatmonth(2019, 7))
+        rows = {day: self.rows(days[day][1]) for day in range(7, 14)}
+
+        # longest first on the day they both start, a five day vacation is
+        # named on its middle day
+        self.assertListEqual(rows[7], ['', 'Alice'])
+        self.assertEqual(rows[8][0], '')
+        self.assertEqual(rows[8][1], 'Alice')
+        # carol takes the row alice left, bob keeps his
+        self.assertListEqual(rows[9], ['Bob', 'Carol'])
+        self.assertEqual(len(rows[10]), 1)
+        self.assertListEqual(rows[12], [])
+
+    def test_spacer_rows(self):
+        # alice's vacation started the saturday before the week
+        Vacation.objects.create(user=self.u1,
+                                start_date=datetime.date(2019, 7, 6),
+                                end_date=datetime.date(2019, 7, 7))
+        Vacation.objects.create(user=self.u2,
+                                start_date=datetime.date(2019, 7, 7),
+                                end_date=datetime.date(2019, 7, 8))
+
+        days = self.day_cells(self.cal.formatmonth(2019, 7))
+
+        self.assertListEqual(self.rows(days[7][1]), ['Alice', 'Bob'])
+        # bob stays in the second row once alice is back
+        self.assertListEqual(self.rows(days[8][1]), [None, 'Bob'])
+
+
+class HolidaysTestCase(TestCase):
+    def setUp(self):
+        holidays._holidays.cache_clear()
+
+    def test_holidays_are_memoized(self):
+        first = holidays.holidays(2019)
+        self.assertEqual(first[datetime.date(2019, 7, 1)], 'Canada Day')
+        self.assertIs(holidays.holidays(2019), first)
+        self.assertIs(holidays.holidays(2019, 'ontario'), first)
+        self.assertEqual(holidays._holidays.cache_info().currsize, 1)
+
+    def test_other_calendars(self):
+        quebec = holidays.holidays(2019, 'quebec')
+        self.assertIn(datetime.date(2019, 6, 24), quebec)
+        self.assertNotIn(datetime.date(2019, 6, 24), holidays.holidays(2019))
+        self.assertEqual(
+            holidays.holidays(2019, 'workalendar.america.Quebec'), quebec)
+
+    @override_settings(HOLIDAY_CALENDAR='quebec')
+    def test_setting(self):
+        self.assertIn(datetime.date(2019, 6, 24), holidays.holidays(2019))
+
+    def test_between(self):
+        self.assertDictEqual(
+            holidays.holidays_between(datetime.date(2019, 12, 20),
+                                      datetime.date(2020, 1, 5)),
+            {datetime.date(2019, 12, 25): 'Christmas Day',
+             datetime.date(2019, 12, 26): 'Boxing Day',
+             datetime.date(2020, 1, 1): 'New year'})
+
+    def test_warm(self):
+        holidays.warm()
+        year = datetime.date.today().year
+        with mock.patch('vacation.holidays.import_string') as import_string:
+            holidays.holidays(year)
+            holidays.holidays(year + 1)
+        import_string.assert_not_called()
+
+
+class MonthsViewTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='alice',
+                                           password='testing123')
+        self.march = Vacation.objects.create(
+            user=self.u1, start_date=datetime.date(2019, 3, 28),
+            end_date=datetime.date(2019, 4, 3))
+        self.december = Vacation.objects.create(
+            user=self.u1, start_date=datetime.date(2019, 12, 30),
+            end_date=datetime.date(2020, 1, 2))
+
+    def link(self, vacation):
+        return 'href="%s"' % reverse('vacation:detail', args=[vacation.pk])
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_redirect_if_not_logged_in(self):
+        response = self.client.get(reverse('vacation:year',
+                                           kwargs={'year': 2019}))
+        self.assertEqual(response.status_code, 302)
+
+    def test_year(self):
+        self.client.login(username='alice', password='testing123')
+        with CaptureQueriesContext(connection) as queries:
+            html = self.get(reverse('vacation:year', kwargs={'year': 2019}))
+
+        vacation_queries = [query for query in queries
+                            if 'vacation_vacation' in query['sql']]
+        self.assertEqual(len(vacation_queries), 1)
+        for month in calendar.month_name[1:]:
+            self.assertIn(f'{month} 2019', html)
+        self.assertEqual(html.count("class='month'"), 12)
+        # every month's table is closed, they aren't nested in each other
+        self.assertEqual(html.count("</table>\n"), 12)
+        self.assertIn(self.link(self.march), html)
+        self.assertIn(self.link(self.december), html)
+        self.assertIn(reverse('vacation:year', kwargs={'year': 2020}), html)
+
+    def test_quarter(self):
+        self.client.login(username='alice', password='testing123')
+        html = self.get(reverse('vacation:quarter',
+                                kwargs={'year': 2019, 'quarter': 2}))
+
+        self.assertEqual(html.count("class='month'"), 3)
+        self.assertIn('April 2019', html)
+        self.assertIn('June 2019', html)
+        self.assertNotIn('March 2019', html)
+        # the march vacation runs into april
+        self.assertIn(self.link(self.march), html)
+        self.assertIn(reverse('vacation:quarter',
+                              kwargs={'year': 2019, 'quarter': 1}), html)
+        self.assertIn(reverse('vacation:quarter',
+                              kwargs={'year': 2019, 'quarter': 3}), html)
+
+    def test_quarter_out_of_range(self):
+        self.client.login(username='alice', password='testing123')
+        for quarter in (0, 5):
+            response = self.client.get(reverse(
+                'vacation:quarter', kwargs={'year': 2019, 'quarter': quarter}))
+            self.assertEqual(response.status_code, 404)
+
+
+class CalendarViewTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='alice',
+                                           password='testing123')
+        self.u2 = User.objects.create_user(username='bob')
+        self.spanning = Vacation.objects.create(
+            user=self.u1, start_date=datetime.date(2019, 6, 20),
+            end_date=datetime.date(2019, 8, 10))
+        self.in_month = Vacation.objects.create(
+            user=self.u2, start_date=datetime.date(2019, 7, 10),
+            end_date=datetime.date(2019, 7, 12))
+        # on the first week shown, which starts in june
+        self.shown = Vacation.objects.create(
+            user=self.u2, start_date=datetime.date(2019, 6, 30),
+            end_date=datetime.date(2019, 6, 30))
+        self.other_year = Vacation.objects.create(
+            user=self.u2, start_date=datetime.date(2018, 7, 10),
+            end_date=datetime.date(2018, 7, 12))
+        self.url = reverse('vacation:calendar',
+                           kwargs={'year': 2019, 'month': 7})
+
+    def test_loads_displayed_range(self):
+        self.client.login(username='alice', password='testing123')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertCountEqual(response.context['object_list'],
+                              [self.spanning, self.in_month, self.shown])
+        vacation_queries = [query for query in queries
+                            if 'vacation_vacation' in query['sql']]
+        self.assertEqual(len(vacation_queries), 1)
+        self.assertIn('auth_user', vacation_queries[0]['sql'])
+        self.assertContains(response, self.spanning.get_absolute_url())
+        self.assertNotContains(response, self.other_year.get_absolute_url())
+
+
+class MonthCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username='alice',
+                                           password='testing123')
+        self.vacation = Vacation.objects.create(
+            user=self.u1, start_date=datetime.date(2019, 7, 3),
+            end_date=datetime.date(2019, 7, 5))
+        self.url = reverse('vacation:calendar',
+                           kwargs={'year': 2019, 'month': 7})
+
+    def vacation_queries(self, queries):
+        return [query for query in queries
+                if 'vacation_vacation' in query['sql']]
+
+    def test_versions_bumped_for_touched_months(self):
+        # june's calendar shows the start of july
+        self.assertEqual(month_versions([(2019, 6), (2019, 7), (2019, 8),
+                                         (2019, 9)]),
+                         {(2019, 6): 1, (2019, 7): 1, (2019, 8): 0,
+                          (2019, 9): 0})
+        self.vacation.save()
+        self.assertEqual(month_versions([(2019, 7)]), {(2019, 7): 2})
+
+    def test_moved_vacation_bumps_both_months(self):
+        vacation = Vacation.objects.get(pk=self.vacation.pk)
+        vacation.start_date = datetime.date(2019, 10, 15)
+        vacation.end_date = datetime.date(2019, 10, 16)
+        vacation.save()
+        versions = month_versions([(2019, 7), (2019, 10)])
+        self.assertEqual(versions, {(2019, 7): 2, (2019, 10): 1})
+
+    def test_concurrent_first_bumps(self):
+        bulk_create = MonthVersion.objects.bulk_create
+
+        def other_request_first(*args, **kwargs):
+            # another request adds and bumps the row after this one found
+            # it missing
+            bulk_create([MonthVersion(year=2019, month=9, version=0)])
+            MonthVersion.objects.filter(year=2019, month=9).update(version=1)
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(MonthVersion.objects, 'bulk_create',
+                               side_effect=other_request_first):
+            bump_month_versions([(2019, 9)])
+        self.assertEqual(month_versions([(2019, 9)]), {(2019, 9): 2})
+
+    def test_delete_bumps_version(self):
+        self.vacation.delete()
+        self.assertEqual(month_versions([(2019, 7)]), {(2019, 7): 2})
+
+    def test_username_change_bumps_version(self):
+        self.u1.last_login = timezone.now()
+        self.u1.save(update_fields=['last_login'])
+        self.assertEqual(month_versions([(2019, 7)]), {(2019, 7): 1})
+
+        self.u1.username = 'alicia'
+        self.u1.save()
+        self.assertEqual(month_versions([(2019, 7)]), {(2019, 7): 2})
+
+    def test_cached_month_skips_vacation_query(self):
+        self.client.login(username='alice', password='testing123')
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(self.vacation_queries(queries), [])
+        self.assertContains(response, self.vacation.get_absolute_url())
+
+    def test_changed_month_rendered_again(self):
+        self.client.login(username='alice', password='testing123')
+        self.client.get(self.url)
+        other = Vacation.objects.create(
+            user=self.u1, start_date=datetime.date(2019, 7, 20),
+            end_date=datetime.date(2019, 7, 20))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(len(self.vacation_queries(queries)), 1)
+        self.assertContains(response, other.get_absolute_url())
+
+    def test_unchanged_months_cached_in_year(self):
+        url = reverse('vacation:year', kwargs={'year': 2019})
+        self.client.login(username='alice', password='testing123')
+        b''.join(self.client.get(url).streaming_content)
+        march = Vacation.objects.create(user=self.u1,
+                                        start_date=datetime.date(2019, 3, 12),
+                                        end_date=datetime.date(2019, 3, 12))
+
+        with mock.patch.object(VacationCalendar, 'formatmonths',
+                               autospec=True,
+                               side_effect=VacationCalendar.formatmonths
+                               ) as formatmonths:
+            html = b''.join(
+                self.client.get(url).streaming_content).decode()
+        # only march was rendered again
+        formatmonths.assert_called_once_with(mock.ANY, 2019, [3])
+        self.assertEqual(html.count("class='month'"), 12)
+        self.assertIn('href="%s"' % reverse('vacation:detail',
+                                             args=[march.pk]), html)
+
+    def test_today_keys_month(self):
+        cal = VacationCalendar()
+        cal.events = []
+        today = datetime.date(2019, 7, 15)
+        with mock.patch('vacation.cache.datetime') as mock_datetime:
+            mock_datetime.date.today.return_value = today
+            first = render_month(cal, 2019, 7)
+            with mock.patch.object(cal, 'formatmonth') as formatmonth:
+                self.assertEqual(render_month(cal, 2019, 7), first)
+                # august doesn't show the 15th of july
+                render_month(cal, 2019, 8)
+                mock_datetime.date.today.return_value = datetime.date(2019, 8, 20)
+                render_month(cal, 2019, 7)
+                formatmonth.assert_not_called()
+
+
+class VacationFeedTestCase(TestCase):
+    def setUp(self):
+        self.u1 = User.objects.create_user(username='alice',
+                                           password='testing123')
+        self.u2 = User.objects.create_user(username='bob')
+        today = datetime.date.today()
+        self.mine = Vacation.objects.create(
+            user=self.u1, start_date=today,
+            end_date=today + datetime.timedelta(days=2))
+        self.theirs = Vacation.objects.create(
+            user=self.u2, start_date=today + datetime.timedelta(days=10),
+            end_date=today + datetime.timedelta(days=10))
+        self.old = Vacation.objects.create(
+            user=self.u2, start_date=today - datetime.timedelta(days=800),
+            end_date=today - datetime.timedelta(days=800))
+        self.url = reverse('vacation:feed',
+                           kwargs={'token': feeds.feed_token()})
+        self.my_url = reverse('vacation:feed',
+                              kwargs={'token': feeds.feed_token(self.u1)})
+
+    def get(self, url, **headers):
+        response = self.client.get(url, **headers)
+        if response.status_code == 200:
+            self.assertTrue(response.streaming)
+            response.text = b''.join(response.streaming_content).decode()
+        return response
+
+    def test_shop_feed(self):
+        response = self.get(self.url)
+        self.assertEqual(response['Content-Type'],
+                         'text/calendar; charset=utf-8')
+        cal = Calendar.from_ical(response.text)
+        events = cal.walk('VEVENT')
+        self.assertEqual([str(event['summary']) for event in events],
+                         ['Alice - Vacation', 'Bob - Vacation'])
+        # the end of an all day event is the day after
+        self.assertEqual(events[0].decoded('dtend'),
+                         self.mine.end_date + datetime.timedelta(days=1))
+
+    def test_user_feed(self):
+        cal = Calendar.from_ical(self.get(self.my_url).text)
+        self.assertEqual([str(event['summary'])
+                          for event in cal.walk('VEVENT')],
+                         ['Alice - Vacation'])
+
+    def test_bad_token(self):
+        response = self.client.get(reverse('vacation:feed',
+                                           kwargs={'token': 'nope'}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_conditional_get(self):
+        response = self.get(self.url)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('vacation_vacation', queries[0]['sql'])
+
+        response = self.client.get(self.url,
+                                   HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_change_updates_etag(self):
+        etag = self.get(self.url)['ETag']
+        self.theirs.delete()
+        response = self.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Bob', response.text)
@@ -8,6 +8,10 @@ app_name = 'vacation'
 urlpatterns = [
     path('', login_required(views.CalendarView.as_view()), name='calendar'),
     path('?year=<int:year>?month=<int:month>', login_required(views.CalendarView.as_view()), name='calendar'),
+    path('year/<int:year>/', login_required(views.MonthsView.as_view()), name='year'),
+    path('year/<int:year>/q<int:quarter>/', login_required(views.MonthsView.as_view()), name='quarter'),
+    # calendar clients can't log in, the signed token lets them in
+    path('feed/<str:token>/vacations.ics', views.vacation_feed, name='feed'),
     path('<int:pk>/', login_required(views.VacationDetail.as_view()), name='detail'),
     path('add/', login_required(views.VacationAdd.as_view()), name='add'),
     path('add/?year=<int:year>?month=<int:month>?day=<int:day>',
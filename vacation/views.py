@@ -1,11 +1,19 @@
 import calendar
 import datetime
 
+from django.contrib.auth.models import User
+from django.core import signing
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
 from django.urls import reverse_lazy, reverse
 from django.utils import timezone as tz
 from django.utils.safestring import mark_safe
-from django.views.generic import CreateView, ListView, UpdateView, DeleteView, DetailView
+from django.views.decorators.http import condition
+from django.views.generic import CreateView, ListView, UpdateView, DeleteView, DetailView, View
 
+from vacation.cache import render_month, render_months
+from vacation import feeds
 from vacation.calendar import VacationCalendar
 from vacation.forms import VacationForm
 from vacation.models import Vacation
@@ -16,21 +24,33 @@ class CalendarView(ListView):
     model = Vacation
     template_name = 'vacation/index.html'
 
+    def get_month(self):
+        if 'year' in self.kwargs.keys():
+            return tz.datetime(self.kwargs['year'], self.kwargs['month'], 1)
+        return tz.now()
+
+    def get_calendar(self):
+        cal = VacationCalendar()
+        cal.setfirstweekday(calendar.SUNDAY)
+        return cal
+
     def get_queryset(self, *args, **kwargs):
-        return Vacation.objects.order_by('start_date', 'user')
+        # only the vacations on the weeks the month is shown with
+        now = self.get_month()
+        weeks = self.get_calendar().monthdatescalendar(now.year, now.month)
+        return Vacation.objects \
+            .filter(start_date__lte=weeks[-1][-1], end_date__gte=weeks[0][0]) \
+            .select_related('user') \
+            .order_by('start_date', 'user')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        cal = VacationCalendar()
-        cal.setfirstweekday(calendar.SUNDAY)
-
-        if 'year' in self.kwargs.keys():
-            now = tz.datetime(self.kwargs['year'], self.kwargs['month'], 1)
-            html_calendar = cal.formatmonth(self.kwargs['year'], self.kwargs['month'], withyear=True)
-        else:
-            now = tz.now()
-            html_calendar = cal.formatmonth(now.year, now.month, withyear=True)
+        now = self.get_month()
+        cal = self.get_calendar()
+        cal.events = self.object_list
+        # the vacations are only loaded if the month isn't cached
+        html_calendar = render_month(cal, now.year, now.month)
 
         prev_month = tz.datetime(now.year, now.month, 1)
         prev_month = prev_month - datetime.timedelta(days=1)
@@ -46,10 +66,100 @@ class CalendarView(ListView):
         context['next_month'] = reverse('vacation:calendar',
                                         kwargs={'year': next_month.year, 'month': next_month.month})
 
+        context['year_link'] = reverse('vacation:year', kwargs={'year': now.year})
+        context['feed_link'] = reverse('vacation:feed', kwargs={'token': feeds.feed_token()})
+        context['my_feed_link'] = reverse('vacation:feed', kwargs={'token': feeds.feed_token(self.request.user)})
         context['calendar'] = mark_safe(html_calendar)
         return context
 
 
+class MonthsView(View):
+    """
+    a whole year, or a quarter of it, at a glance. the vacations of every
+    month are loaded with one query and the page is streamed, each month
+    is sent as soon as it is rendered.
+    """
+    template_name = 'vacation/months.html'
+    # the rendered months go where the template shows this
+    calendar_marker = '<!-- calendar -->'
+
+    def get(self, request, year, quarter=None):
+        if quarter is None:
+            months = list(range(1, 13))
+            prev_link = reverse('vacation:year', kwargs={'year': year - 1})
+            next_link = reverse('vacation:year', kwargs={'year': year + 1})
+            title = f"{year}"
+        else:
+            if not 1 <= quarter <= 4:
+                raise Http404(f"There is no quarter {quarter}.")
+            months = list(range(quarter * 3 - 2, quarter * 3 + 1))
+            prev_year, prev_quarter = (year, quarter - 1) if quarter > 1 else (year - 1, 4)
+            next_year, next_quarter = (year, quarter + 1) if quarter < 4 else (year + 1, 1)
+            prev_link = reverse('vacation:quarter', kwargs={'year': prev_year, 'quarter': prev_quarter})
+            next_link = reverse('vacation:quarter', kwargs={'year': next_year, 'quarter': next_quarter})
+            title = f"Q{quarter} {year}"
+
+        page = render_to_string(self.template_name, {
+            'title': title,
+            'year': year,
+            'prev_link': prev_link,
+            'next_link': next_link,
+            'calendar': mark_safe(self.calendar_marker),
+        }, request)
+        head, tail = page.split(self.calendar_marker, 1)
+
+        cal = VacationCalendar()
+        cal.setfirstweekday(calendar.SUNDAY)
+
+        def stream():
+            yield head
+            yield from render_months(cal, year, months)
+            yield tail
+
+        return StreamingHttpResponse(stream())
+
+
+def feed_state(request, token):
+    # etag and last modified both come from one query
+    if not hasattr(request, '_feed_state'):
+        request._feed_state = feeds.feed_state()
+    return request._feed_state
+
+
+def feed_etag(request, token):
+    return f"vacations-{feed_state(request, token)[0]}"
+
+
+def feed_last_modified(request, token):
+    return feed_state(request, token)[1]
+
+
+@condition(etag_func=feed_etag, last_modified_func=feed_last_modified)
+def vacation_feed(request, token):
+    """
+    the vacations as an iCalendar feed, everyone's or one user's, for
+    calendar clients to subscribe to. clients poll with conditional GETs,
+    which are answered from the month versions alone while nothing has
+    changed.
+    """
+    try:
+        user_id = feeds.read_token(token)
+    except signing.BadSignature:
+        raise Http404("No such feed.")
+    if user_id is None:
+        name = "Vacations"
+    else:
+        name = f"{get_object_or_404(User, pk=user_id).username.title()} - Vacations"
+
+    stamp = feed_state(request, token)[1] or tz.now()
+    response = StreamingHttpResponse(
+        feeds.stream_feed(feeds.feed_vacations(user_id), name,
+                          request.get_host(), stamp),
+        content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = 'inline; filename="vacations.ics"'
+    return response
+
+
 class VacationDetail(DetailView):
     model = Vacation
 